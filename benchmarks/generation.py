@@ -0,0 +1,274 @@
+"""
+Project generation benchmark
+
+Generates every valid framework/ORM combination of COMPATIBILITY_MATRIX, for
+every database and every combination of the auth/docker/testing flags, and
+reports p50/p95 latency, files/sec, peak RSS and per-phase times.
+
+Each combination runs in a fresh worker process (so peak RSS is its own):
+"cold" runs use a new ProjectGenerator each time, with empty template caches
+and no bytecode cache; "warm" runs reuse one generator whose templates are
+already compiled. The generation cache is off in both, and projects are
+written to a temporary directory.
+
+Usage:
+    python benchmarks/generation.py [--runs N] [--filter TEXT] [--output FILE]
+    python benchmarks/generation.py --compare BASELINE [--threshold 0.25]
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Phases reported by GenerationProfiler, in generation order
+PHASES = ["structure", "templates", "framework_files", "dependencies"]
+
+# Noise floor: smaller regressions never fail a comparison
+MIN_DELTA_MS = 2.0
+
+
+def cases(pattern: str | None = None) -> list[dict]:
+    """Every valid configuration of the matrix, optionally filtered by case name"""
+    from vyte.core.config import COMPATIBILITY_MATRIX
+
+    configs = []
+    for framework, info in COMPATIBILITY_MATRIX.items():
+        for orm, database, (auth, docker, testing) in itertools.product(
+            info["compatible_orms"], info["databases"], itertools.product([True, False], repeat=3)
+        ):
+            config = {
+                "name": "bench-api",
+                "framework": framework,
+                "orm": orm,
+                "database": database,
+                "auth_enabled": auth,
+                "docker_support": docker,
+                "testing_suite": testing,
+                "git_init": False,
+            }
+            if pattern is None or pattern.lower() in case_name(config).lower():
+                configs.append(config)
+    return configs
+
+
+def case_name(config: dict) -> str:
+    """Readable key of a configuration, e.g. FastAPI/SQLAlchemy/SQLite/auth+docker"""
+    flags = [
+        flag
+        for flag, field in [
+            ("auth", "auth_enabled"),
+            ("docker", "docker_support"),
+            ("testing", "testing_suite"),
+        ]
+        if config[field]
+    ]
+    return "/".join(
+        [config["framework"], config["orm"], config["database"], "+".join(flags) or "bare"]
+    )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of a non-empty sample"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(samples: list[dict]) -> dict:
+    """Latency percentiles (ms), throughput and median phase times (ms) of runs"""
+    totals = [sample["total"] for sample in samples]
+    files = samples[0]["files"]
+    return {
+        "runs": len(samples),
+        "p50_ms": percentile(totals, 0.50) * 1000,
+        "p95_ms": percentile(totals, 0.95) * 1000,
+        "files_per_sec": files / statistics.median(totals) if files else 0.0,
+        "phases_ms": {
+            phase: statistics.median(sample["phases"].get(phase, 0.0) for sample in samples) * 1000
+            for phase in PHASES
+        },
+    }
+
+
+def run_case(config_data: dict, runs: int) -> dict:
+    """Benchmark one configuration (runs in a worker process)"""
+    from vyte.core.config import ProjectConfig
+    from vyte.core.events import EventBus
+    from vyte.core.generator import ProjectGenerator
+    from vyte.core.profiler import GenerationProfiler
+
+    config = ProjectConfig(**config_data)
+
+    with tempfile.TemporaryDirectory(prefix="vyte-bench-") as root:
+
+        def measure(generator: ProjectGenerator) -> dict:
+            profiler = GenerationProfiler()
+            start = time.perf_counter()
+            project_path = generator.generate(config, events=EventBus(profiler))
+            total = time.perf_counter() - start
+            shutil.rmtree(project_path)
+            return {"total": total, "files": profiler.files_written, "phases": profiler.phases}
+
+        cold = [measure(ProjectGenerator(output_root=root, cache=False)) for _ in range(runs)]
+        generator = ProjectGenerator(output_root=root, cache=False)
+        measure(generator)
+        warm = [measure(generator) for _ in range(runs)]
+
+    return {
+        "files": cold[0]["files"],
+        "cold": summarize(cold),
+        "warm": summarize(warm),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_all(configs: list[dict], runs: int) -> dict:
+    """Benchmark every configuration, each in its own fresh process"""
+    from vyte.__version__ import __version__
+
+    # Cold runs must compile every template
+    os.environ["VYTE_NO_CACHE"] = "1"
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for index, config in enumerate(configs, 1):
+            name = case_name(config)
+            results[name] = pool.apply(run_case, (config, runs))
+            result = results[name]
+            print(
+                f"[{index:3}/{len(configs)}] {name:<52} "
+                f"cold p50 {result['cold']['p50_ms']:7.1f} ms  "
+                f"warm p50 {result['warm']['p50_ms']:6.1f} ms  "
+                f"{result['warm']['files_per_sec']:7.0f} files/s",
+                flush=True,
+            )
+
+    return {
+        "vyte": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "cases": results,
+    }
+
+
+def report(document: dict):
+    """Print latency, throughput, phase and memory figures over every case"""
+    results = document["cases"]
+    if not results:
+        return
+    for mode in ("cold", "warm"):
+        p50 = [case[mode]["p50_ms"] for case in results.values()]
+        p95 = [case[mode]["p95_ms"] for case in results.values()]
+        rate = [case[mode]["files_per_sec"] for case in results.values()]
+        phases = {
+            phase: statistics.median(case[mode]["phases_ms"][phase] for case in results.values())
+            for phase in PHASES
+        }
+        print(
+            f"{mode}: median p50 {statistics.median(p50):.1f} ms, worst p95 {max(p95):.1f} ms, "
+            f"median {statistics.median(rate):.0f} files/s"
+        )
+        print("      phases " + ", ".join(f"{phase} {ms:.1f} ms" for phase, ms in phases.items()))
+    rss = [case["peak_rss_mb"] for case in results.values() if case["peak_rss_mb"] is not None]
+    if rss:
+        print(f"peak RSS: max {max(rss):.1f} MiB")
+
+
+def compare(document: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Regressions of a run against a baseline
+
+    A case regresses when its cold or warm p50 latency, or its peak RSS, grows
+    by more than `threshold` (a fraction) and by more than MIN_DELTA_MS for
+    latencies. Cases missing from either document are ignored.
+    """
+    regressions = []
+    for name, case in document["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        metrics = [
+            (f"{mode} p50", case[mode]["p50_ms"], base[mode]["p50_ms"], MIN_DELTA_MS, "ms")
+            for mode in ("cold", "warm")
+        ]
+        if case["peak_rss_mb"] is not None and base["peak_rss_mb"] is not None:
+            metrics.append(("peak RSS", case["peak_rss_mb"], base["peak_rss_mb"], 0.0, "MiB"))
+        for metric, value, reference, floor, unit in metrics:
+            if value > reference * (1 + threshold) and value - reference > floor:
+                regressions.append(
+                    f"{name}: {metric} {value:.1f} {unit} vs {reference:.1f} {unit} "
+                    f"(+{(value / reference - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Cold and warm runs per case (default: 5)"
+    )
+    parser.add_argument("--filter", help="Only run cases whose name contains this text")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="Fail on regressions against this JSON file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or memory growth against the baseline (default: 0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    configs = cases(args.filter)
+    if not configs:
+        print(f"No case matches '{args.filter}'")
+        return 1
+
+    document = run_all(configs, args.runs)
+    report(document)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    regressions = compare(document, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No regression over {args.threshold:.0%} against {args.compare}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
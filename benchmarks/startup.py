@@ -0,0 +1,100 @@
+"""
+CLI startup benchmark
+
+Runs `vyte` subcommands that don't generate anything in fresh interpreters
+and compares their median wall time against a budget.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--no-budget]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# (arguments, budget in milliseconds) - budgets leave room for slow CI machines
+CASES = [
+    (["--version"], 300),
+    (["--help"], 350),
+    (["list"], 600),
+    (["info", "FastAPI"], 600),
+    (["cache", "stats"], 450),
+]
+
+# Modules that must not be imported by `vyte --version`
+HEAVY_MODULES = ["jinja2", "pydantic", "InquirerPy", "rich.progress", "vyte.core.generator"]
+
+
+def measure(args: list[str], runs: int) -> float:
+    """Median wall time of `vyte <args>` in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "vyte.cli.commands", *args],
+            capture_output=True,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def interpreter_baseline(runs: int) -> float:
+    """Median wall time of a bare interpreter start, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def heavy_imports() -> list[str]:
+    """Heavy modules imported by `vyte --version`"""
+    code = (
+        "import sys\n"
+        "from vyte.cli.commands import cli\n"
+        "try:\n"
+        "    cli(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('HEAVY:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    line = next(line for line in result.stdout.splitlines() if line.startswith("HEAVY:"))
+    return [m for m in line.removeprefix("HEAVY:").split(",") if m]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="Runs per command (default: 7)")
+    parser.add_argument("--no-budget", action="store_true", help="Report only, never fail")
+    args = parser.parse_args()
+
+    print(f"{'python -c pass':<24} {interpreter_baseline(args.runs):8.1f} ms")
+
+    over_budget = []
+    for case_args, budget in CASES:
+        elapsed = measure(case_args, args.runs)
+        status = "ok" if elapsed <= budget else "OVER"
+        print(
+            f"{'vyte ' + ' '.join(case_args):<24} {elapsed:8.1f} ms  (budget {budget} ms) {status}"
+        )
+        if elapsed > budget:
+            over_budget.append(case_args)
+
+    heavy = heavy_imports()
+    if heavy:
+        print(f"vyte --version imported heavy modules: {', '.join(heavy)}")
+
+    if args.no_budget:
+        return 0
+    return 1 if over_budget or heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
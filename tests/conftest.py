@@ -17,6 +17,15 @@ from vyte.core.generator import ProjectGenerator
 from vyte.core.renderer import TemplateRenderer
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """Keep vyte's on-disk caches out of the user's home during tests"""
+    with pytest.MonkeyPatch.context() as mp:
+        cache_dir = tmp_path_factory.mktemp("vyte-cache")
+        mp.setenv("VYTE_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
 @pytest.fixture
 def temp_dir():
     """Create temporary directory for tests"""
@@ -62,8 +71,8 @@ def sample_config():
 
 @pytest.fixture
 def generator():
-    """Project generator instance"""
-    return ProjectGenerator()
+    """Project generator instance, rendering every project (no generation cache)"""
+    return ProjectGenerator(cache=False)
 
 
 @pytest.fixture
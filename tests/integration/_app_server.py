@@ -0,0 +1,60 @@
+"""Serve test-client requests to the app of a generated project, over stdin/stdout.
+
+Run by AppClient in a fresh interpreter whose working directory is the project
+root, so the project's modules (``src``, ``app``, ...) never mix with those of
+other projects or of the test session. Takes the app as ``module:attribute``;
+each line on stdin is a JSON request, answered by one JSON line on stdout.
+"""
+
+import importlib
+import json
+import os
+import sys
+import traceback
+
+
+def main() -> None:
+    # Keep stdout for replies: anything the app prints goes to stderr
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    module_name, _, attribute = sys.argv[1].partition(":")
+    app = getattr(importlib.import_module(module_name), attribute)
+
+    if hasattr(app, "test_client"):  # Flask (WSGI)
+        client = app.test_client()
+        routes = sorted({rule.rule for rule in app.url_map.iter_rules()})
+    else:  # FastAPI (ASGI)
+        from fastapi.testclient import TestClient
+
+        client = TestClient(app)
+        routes = sorted(app.openapi()["paths"])
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            if request["method"] == "ROUTES":
+                reply = {"routes": routes}
+            elif hasattr(client, "open"):
+                response = client.open(
+                    request["path"], method=request["method"], json=request["json"]
+                )
+                reply = {
+                    "status_code": response.status_code,
+                    "json": response.get_json(silent=True),
+                }
+            else:
+                response = client.request(request["method"], request["path"], json=request["json"])
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = None
+                reply = {"status_code": response.status_code, "json": body}
+        except Exception:  # noqa: BLE001 - reported to the test process
+            reply = {"error": traceback.format_exc()}
+        print(json.dumps(reply), file=replies, flush=True)
+
+
+if __name__ == "__main__":
+    main()
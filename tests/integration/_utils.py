@@ -1,17 +1,22 @@
 """Helpers for integration tests.
 
-Provide small utilities to generate projects, write stubs, manage sys.path and
-manually load modules when filesystem timing causes flaky imports on CI/Windows.
+Generated projects are shared between tests (see ``project_factory`` in
+conftest.py) and their apps are imported in a separate interpreter per client,
+so tests never touch ``sys.path``, ``sys.modules`` or the working directory.
 """
 
-import importlib
+import json
 import os
 import shutil
 import stat
+import subprocess
 import sys
+import tempfile
 import time
-import types
 from pathlib import Path
+from typing import Any
+
+APP_SERVER = Path(__file__).with_name("_app_server.py")
 
 
 def safe_rmtree(path):
@@ -38,119 +43,92 @@ def safe_rmtree(path):
         pass
 
 
-def insert_project_path(project_path: Path) -> None:
-    p = str(project_path)
-    if p not in sys.path:
-        sys.path.insert(0, p)
-
-
-def remove_project_path(project_path: Path) -> None:
-    p = str(project_path)
-    try:
-        sys.path.remove(p)
-    except ValueError:
-        pass
-
-
-def manual_load_module_from_path(
-    module_name: str, file_path: Path, project_src: Path | None = None
-) -> types.ModuleType:
-    """Manually load a module from a file and insert it into sys.modules.
+class AppResponse:
+    """Status and JSON body of a response, like the ones of Flask/Starlette test clients."""
 
-    Ensures `src` and `src.api` packages exist in sys.modules with __path__ set
-    so subsequent imports treat them as packages.
-    """
-    if project_src is None:
-        # file_path is expected to be like <project_path>/src/...py
-        # project_src should point to the project's `src` directory so
-        # package __path__ entries resolve correctly.
-        project_src = file_path.parent
-
-    # Ensure package entries
-    pkg_root_name = module_name.split(".")[0]
-    if pkg_root_name not in sys.modules:
-        pkg_root = types.ModuleType(pkg_root_name)
-        pkg_root.__path__ = [str(project_src)]
-        sys.modules[pkg_root_name] = pkg_root
-
-    # Add intermediate packages if needed
-    parts = module_name.split(".")
-    for i in range(2, len(parts)):
-        pkg_name = ".".join(parts[:i])
-        pkg_path = project_src / "/".join(parts[1:i])
-        if pkg_name not in sys.modules:
-            pkg = types.ModuleType(pkg_name)
-            # Try to set __path__ if we can
-            pkg.__path__ = [str(project_src / "/".join(parts[1:i]))]
-            sys.modules[pkg_name] = pkg
-    # Preload common nested modules that generated mains often import (e.g. src.api.routes)
-    try:
-        api_routes = project_src / "api" / "routes.py"
-        if api_routes.exists() and f"{pkg_root_name}.api.routes" not in sys.modules:
-            # Load routes module so imports inside main succeed
-            manual_load_module_from_path(
-                f"{pkg_root_name}.api.routes", api_routes, project_src=project_src
-            )
-    except Exception:
-        # Non-fatal; continue to load requested module
-        pass
+    def __init__(self, status_code: int, body: Any):
+        self.status_code = status_code
+        self._body = body
 
-    with open(file_path, encoding="utf-8") as f:
-        code = f.read()
-
-    module = types.ModuleType(module_name)
-    module.__file__ = str(file_path)
-    exec(compile(code, str(file_path), "exec"), module.__dict__)
-    sys.modules[module_name] = module
-    # Ensure parent package objects expose the child as an attribute so
-    # statements like `from src.api import routes` work as expected when
-    # modules were injected into sys.modules manually.
-    if "." in module_name:
-        parent_name, child_name = module_name.rsplit(".", 1)
-        parent = sys.modules.get(parent_name)
-        if parent is not None:
-            try:
-                setattr(parent, child_name, module)
-            except Exception:
-                # Non-fatal: ignore if we cannot set attribute
-                pass
+    def json(self) -> Any:
+        return self._body
 
-    return module
+    get_json = json
 
 
-def import_with_retry(
-    module_name: str, project_path: Path, retries: int = 3, backoff: float = 0.05
-):
-    """Try to import a module from a generated project path; fall back to manual load.
+class AppClient:
+    """Test client for the app of a generated project, running in its own interpreter.
 
-    Returns the imported module or raises the last exception.
+    The project is imported with its root as working directory and on
+    ``sys.path``, exactly like ``python -c "import src.main"`` from the project
+    would, without writing bytecode into the (shared) project directory.
     """
-    insert_project_path(project_path)
-    last_exc = None
-    for _ in range(retries):
-        try:
-            return importlib.import_module(module_name)
-        except ModuleNotFoundError as e:
-            last_exc = e
-            time.sleep(backoff)
-    # Fallback: manual load if module looks like a file inside the project
-    parts = module_name.split(".")
-    # Construct path assuming module corresponds to project/src/... .py
-    if parts[0] == "src" and len(parts) >= 2:
-        rel = Path("src") / Path("/".join(parts[1:]) + ".py")
-        candidate = project_path / rel
-        # If main imports auxiliary modules (like src.api.routes), try to preload them
+
+    def __init__(self, project_path: Path, target: str):
+        """Start the app server.
+
+        Args:
+            project_path: Root of the generated project
+            target: App to import, as ``module:attribute`` (e.g. ``src.main:app``)
+        """
+        self._stderr = tempfile.TemporaryFile(mode="w+", encoding="utf-8")  # noqa: SIM115
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(project_path),
+            "PYTHONDONTWRITEBYTECODE": "1",
+        }
+        self._process = subprocess.Popen(
+            [sys.executable, str(APP_SERVER), target],
+            cwd=project_path,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def _call(self, request: dict) -> dict:
         try:
-            api_candidate = project_path / "src" / "api" / "routes.py"
-            if api_candidate.exists() and "src.api.routes" not in sys.modules:
-                # Preload routes so manual-loading main won't fail on imports
-                manual_load_module_from_path(
-                    "src.api.routes", api_candidate, project_src=project_path / "src"
-                )
-        except Exception:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except BrokenPipeError:
             pass
-        if candidate.exists():
-            return manual_load_module_from_path(
-                module_name, candidate, project_src=project_path / "src"
-            )
-    raise last_exc
+        line = self._process.stdout.readline()
+        if not line:
+            self._process.wait()
+            raise RuntimeError(f"App server exited:\n{self._output()}")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(f"App raised:\n{reply['error']}")
+        return reply
+
+    def _output(self) -> str:
+        self._stderr.seek(0)
+        return self._stderr.read()
+
+    def request(self, method: str, path: str, json: Any = None) -> AppResponse:
+        reply = self._call({"method": method, "path": path, "json": json})
+        return AppResponse(reply["status_code"], reply["json"])
+
+    def get(self, path: str) -> AppResponse:
+        return self.request("GET", path)
+
+    def post(self, path: str, json: Any = None) -> AppResponse:
+        return self.request("POST", path, json=json)
+
+    @property
+    def routes(self) -> list[str]:
+        """Paths the app serves"""
+        return self._call({"method": "ROUTES"})["routes"]
+
+    def close(self):
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        self._process.stdout.close()
+        self._stderr.close()
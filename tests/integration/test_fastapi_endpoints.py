@@ -20,8 +20,7 @@ def test_items_crud(generated_fastapi_client):
     client = generated_fastapi_client
 
     # Check routes present
-    routes = [r.path for r in client.app.routes]
-    # For debugging, ensure the expected path is registered
+    routes = client.routes
     assert "/api/items" in routes, f"Expected /api/items in routes, got: {routes}"
 
     # Initially empty (router is included under /api prefix)
@@ -0,0 +1,163 @@
+"""
+Test the asyncio generation API
+"""
+import asyncio
+import hashlib
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from vyte.core.async_generator import AsyncProjectGenerator
+from vyte.core.config import ProjectConfig
+from vyte.core.generator import ProjectGenerator
+from vyte.core.output import DiskOutput, MemoryOutput
+
+
+class SlowOutput(DiskOutput):
+    """Disk backend taking a while per file, to cancel in the middle of a flush"""
+
+    def __init__(self, root: Path, started: asyncio.Event, loop: asyncio.AbstractEventLoop):
+        super().__init__(root)
+        self.started = started
+        self.loop = loop
+        self.writes = 0
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        self.writes += 1
+        self.loop.call_soon_threadsafe(self.started.set)
+        time.sleep(0.01)
+        super().write_bytes(path, data, mode)
+
+
+def _digest(project_path: Path) -> dict[str, str]:
+    """Content hash of every file in a project"""
+    return {
+        path.relative_to(project_path).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(project_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_async_generate_matches_sync(sample_config, temp_dir):
+    """Test async generation writes the same project as the sync generator"""
+    generator = AsyncProjectGenerator(output_root=temp_dir / "async")
+
+    path = asyncio.run(generator.generate(sample_config))
+
+    expected = ProjectGenerator(output_root=temp_dir / "sync").generate(sample_config)
+    assert path == temp_dir / "async" / sample_config.name
+    assert _digest(path) == _digest(expected)
+
+
+def test_async_generate_in_memory(sample_config, temp_dir):
+    """Test async generation into a memory backend"""
+    output = MemoryOutput(temp_dir / sample_config.name)
+
+    asyncio.run(AsyncProjectGenerator().generate(sample_config, output=output))
+
+    assert "README.md" in output.files
+    assert not (temp_dir / sample_config.name).exists()
+
+
+def test_async_generate_existing_directory(sample_config, temp_dir):
+    """Test an existing project directory is refused and left alone"""
+    (temp_dir / sample_config.name).mkdir()
+    (temp_dir / sample_config.name / "keep.txt").write_text("mine")
+    generator = AsyncProjectGenerator(output_root=temp_dir)
+
+    with pytest.raises(FileExistsError):
+        asyncio.run(generator.generate(sample_config))
+
+    assert (temp_dir / sample_config.name / "keep.txt").read_text() == "mine"
+
+
+def test_async_generate_concurrently(temp_dir):
+    """Test many generations gathered on one loop and one generator"""
+    generator = AsyncProjectGenerator(output_root=temp_dir)
+    configs = [
+        ProjectConfig(
+            name=f"gathered-{index}", framework="FastAPI", orm="SQLAlchemy", database="SQLite"
+        )
+        for index in range(8)
+    ]
+
+    async def main():
+        return await asyncio.gather(*(generator.generate(config) for config in configs))
+
+    paths = asyncio.run(main())
+
+    assert paths == [temp_dir / config.name for config in configs]
+    assert all((path / "README.md").exists() for path in paths)
+
+
+def test_cancel_mid_flush_cleans_up(sample_config, temp_dir):
+    """Test cancelling during the flush removes the partial project"""
+    project_path = temp_dir / sample_config.name
+
+    async def main():
+        started = asyncio.Event()
+        output = SlowOutput(project_path, started, asyncio.get_running_loop())
+        task = asyncio.create_task(AsyncProjectGenerator().generate(sample_config, output=output))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return output
+
+    output = asyncio.run(main())
+
+    assert output.writes > 0
+    assert not project_path.exists()
+
+
+def test_event_loop_stays_responsive(sample_config, temp_dir):
+    """Test the loop keeps running other tasks while a project is generated"""
+    generator = AsyncProjectGenerator(output_root=temp_dir)
+
+    async def main():
+        ticks = 0
+        generation = asyncio.create_task(generator.generate(sample_config))
+        while not generation.done():
+            ticks += 1
+            await asyncio.sleep(0)
+        await generation
+        return ticks
+
+    assert asyncio.run(main()) > 1
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_async_init_git_cli(sample_config, temp_dir, monkeypatch):
+    """Test the git CLI fallback runs as asyncio subprocesses"""
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Vyte Tests")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "tests@vyte.dev")
+    generator = AsyncProjectGenerator(output_root=temp_dir)
+
+    async def main():
+        path = await generator.generate(sample_config)
+        return path, await generator.init_git(path, use_cli=True)
+
+    path, commit = asyncio.run(main())
+
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True, check=True
+    )
+    assert commit == head.stdout.strip()
+
+
+def test_async_init_git_builtin(sample_config, temp_dir):
+    """Test the built-in git writer is usable from a coroutine"""
+    generator = AsyncProjectGenerator(output_root=temp_dir)
+
+    async def main():
+        path = await generator.generate(sample_config)
+        return path, await generator.init_git(path)
+
+    path, commit = asyncio.run(main())
+
+    assert (path / ".git" / "HEAD").exists()
+    assert len(commit) == 40
@@ -0,0 +1,129 @@
+"""
+Test batch project generation
+"""
+import json
+
+import pytest
+
+from vyte.core.batch import generate_many, load_manifest
+from vyte.core.config import ProjectConfig
+from vyte.exceptions import ConfigurationError
+
+
+def _config(name, framework="Flask-Restx", orm="SQLAlchemy"):
+    return ProjectConfig(
+        name=name,
+        framework=framework,
+        orm=orm,
+        database="SQLite",
+        docker_support=False,
+        git_init=False,
+    )
+
+
+def test_generate_many_serial(generator, temp_dir, monkeypatch):
+    """Test serial batch generation reuses the given generator"""
+    monkeypatch.chdir(temp_dir)
+
+    report = generator.generate_many([_config("svc-a"), _config("svc-b")], workers=1)
+
+    assert report.ok
+    assert [r.name for r in report.results] == ["svc-a", "svc-b"]
+    assert (temp_dir / "svc-a" / "requirements.txt").exists()
+    assert (temp_dir / "svc-b" / "requirements.txt").exists()
+
+
+def test_generate_many_collects_errors(generator, temp_dir, monkeypatch):
+    """Test that one failing project does not abort the batch"""
+    monkeypatch.chdir(temp_dir)
+    configs = [_config("svc-a"), _config("svc-b")]
+    (temp_dir / "svc-a").mkdir()
+
+    report = generator.generate_many(configs, workers=1)
+
+    assert not report.ok
+    assert report.results[0].error_type == "FileExistsError"
+    assert report.results[1].ok
+    assert report.to_dict()["failed"] == 1
+
+
+def test_generate_many_rejects_duplicates(temp_dir, monkeypatch):
+    """Test that duplicate project paths are reported, not raced"""
+    monkeypatch.chdir(temp_dir)
+
+    report = generate_many([_config("svc-a"), _config("svc-a")], workers=1)
+
+    assert report.results[0].ok
+    assert report.results[1].error_type == "ConfigurationError"
+
+
+def test_generate_many_process_pool(temp_dir, monkeypatch):
+    """Test batch generation across worker processes"""
+    monkeypatch.chdir(temp_dir)
+    configs = [_config("pool-a"), _config("pool-b", "FastAPI", "TortoiseORM"), _config("pool-c")]
+
+    report = generate_many(configs, workers=2)
+
+    assert report.ok, report.to_dict()
+    for config in configs:
+        assert (temp_dir / config.name / "README.md").exists()
+
+
+def test_load_manifest_yaml_defaults(temp_dir):
+    """Test manifest defaults are applied to each project"""
+    pytest.importorskip("yaml")
+    manifest = temp_dir / "services.yaml"
+    manifest.write_text(
+        "defaults:\n"
+        "  framework: FastAPI\n"
+        "  orm: SQLAlchemy\n"
+        "  database: PostgreSQL\n"
+        "projects:\n"
+        "  - name: billing-api\n"
+        "  - name: users-api\n"
+        "    framework: Flask-Restx\n"
+    )
+
+    configs = load_manifest(manifest)
+
+    assert [c.name for c in configs] == ["billing-api", "users-api"]
+    assert configs[0].framework == "FastAPI"
+    assert configs[1].framework == "Flask-Restx"
+    assert configs[1].database == "PostgreSQL"
+
+
+def test_load_manifest_invalid_entry(temp_dir, monkeypatch):
+    """Test invalid manifest entries fail on their own, the rest is generated"""
+    monkeypatch.chdir(temp_dir)
+    manifest = temp_dir / "services.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {"name": "bad", "framework": "Flask-Restx"},
+                "not-a-mapping",
+                {
+                    "name": "good",
+                    "framework": "Flask-Restx",
+                    "orm": "SQLAlchemy",
+                    "database": "SQLite",
+                },
+            ]
+        )
+    )
+
+    report = generate_many(load_manifest(manifest), workers=1)
+
+    assert [r.name for r in report.results] == ["bad", "#2", "good"]
+    assert [r.ok for r in report.results] == [False, False, True]
+    assert "Invalid manifest entry bad" in report.results[0].error
+    assert report.results[1].error_type == "ConfigurationError"
+    assert (temp_dir / "good" / "README.md").exists()
+
+
+def test_load_manifest_without_projects(temp_dir):
+    """Test a manifest listing no projects raises ConfigurationError"""
+    manifest = temp_dir / "services.json"
+    manifest.write_text(json.dumps({"defaults": {"framework": "FastAPI"}}))
+
+    with pytest.raises(ConfigurationError, match="does not define any projects"):
+        load_manifest(manifest)
@@ -0,0 +1,265 @@
+"""
+Test on-disk caches
+"""
+import hashlib
+import os
+import shutil
+
+import pytest
+
+from vyte.core.cache import (
+    EMPTY_HASH,
+    GenerationCache,
+    RecordingOutput,
+    TemplateBytecodeCache,
+    get_cache_dir,
+)
+from vyte.core.events import EventBus
+from vyte.core.generator import ProjectGenerator
+from vyte.core.output import MemoryOutput
+from vyte.core.renderer import TemplateRenderer
+from vyte.exceptions import FileSystemError
+
+
+def test_cache_dir_from_env(tmp_path, monkeypatch):
+    """Test cache directory honours VYTE_CACHE_DIR"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path))
+
+    assert get_cache_dir() == tmp_path
+
+
+def test_renderer_persists_bytecode(tmp_path, monkeypatch):
+    """Test compiled templates are stored and reused across renderers"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path))
+
+    TemplateRenderer().render("common/LICENSE.j2", {"name": "demo"})
+    assert TemplateBytecodeCache().stats()["entries"] == 1
+
+    # A fresh renderer (new CLI run) loads bytecode instead of compiling
+    renderer = TemplateRenderer()
+    compiled = []
+    original = renderer.env._compile
+    monkeypatch.setattr(renderer.env, "_compile", lambda *a: compiled.append(a) or original(*a))
+
+    assert "demo" in renderer.render("common/LICENSE.j2", {"name": "demo"})
+    assert compiled == []
+
+
+def test_renderer_cache_disabled(tmp_path, monkeypatch):
+    """Test VYTE_NO_CACHE disables the bytecode cache"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("VYTE_NO_CACHE", "1")
+
+    renderer = TemplateRenderer()
+
+    assert renderer.bytecode_cache is None
+    assert renderer.env.bytecode_cache is None
+
+
+def test_cache_key_depends_on_mtime(tmp_path):
+    """Test editing a template changes its cache key"""
+    cache = TemplateBytecodeCache(tmp_path / "bc")
+    template = tmp_path / "demo.j2"
+    template.write_text("a")
+
+    before = cache.get_cache_key("demo.j2", str(template))
+    template.write_text("b")
+    os.utime(template, ns=(0, 12345))
+
+    assert cache.get_cache_key("demo.j2", str(template)) != before
+
+
+def test_cache_eviction_and_clear(tmp_path):
+    """Test size-bounded eviction drops oldest entries first"""
+    cache = TemplateBytecodeCache(tmp_path, max_size=250)
+    for i in range(4):
+        path = tmp_path / (cache.PATTERN % f"entry{i}")
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (i, i))
+
+    assert cache.evict() == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        cache.PATTERN % "entry2",
+        cache.PATTERN % "entry3",
+    ]
+
+    assert cache.clear() == 2
+    assert cache.stats()["entries"] == 0
+
+
+def _digest(project_path):
+    """Content and mode of every file in a project"""
+    return {
+        path.relative_to(project_path).as_posix(): (path.read_bytes(), path.stat().st_mode)
+        for path in sorted(project_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_generation_cache_replays_identical_project(sample_config, tmp_path, monkeypatch):
+    """Test a repeated generation comes from the cache, byte for byte"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path / "cache"))
+    rendered = ProjectGenerator(output_root=tmp_path / "first").generate(sample_config)
+    assert GenerationCache().stats()["entries"] == 1
+
+    events = []
+    generator = ProjectGenerator(output_root=tmp_path / "second")
+    replayed = generator.generate(sample_config, events=EventBus(events.append))
+
+    assert _digest(replayed) == _digest(rendered)
+    assert [e.phase for e in events if e.kind == "phase_finished"] == ["cache"]
+    assert not any(e.kind == "file_rendered" for e in events)
+
+
+def test_generation_cache_key_inputs(sample_config, tmp_path):
+    """Test the key changes with the config, the templates and the year"""
+    shutil.copytree(TemplateRenderer().template_dir, tmp_path / "templates")
+    renderer = TemplateRenderer(tmp_path / "templates", bytecode_cache=False)
+    cache = GenerationCache(tmp_path / "cache")
+    key = cache.key(sample_config, renderer)
+
+    assert cache.key(sample_config.model_copy(), renderer) == key
+    assert cache.key(sample_config.model_copy(update={"auth_enabled": False}), renderer) != key
+
+    license_template = tmp_path / "templates" / "common" / "LICENSE.j2"
+    license_template.write_text(license_template.read_text() + "\nEdited\n")
+    edited = cache.key(sample_config, renderer)
+    assert edited != key
+
+    (tmp_path / "templates" / "common" / "extra.j2").write_text("new template\n")
+    added = cache.key(sample_config, renderer)
+    assert added != edited
+
+    renderer.env.globals["year"] += 1
+    assert cache.key(sample_config, renderer) != added
+
+
+def test_generation_cache_key_scoped_to_templates(sample_config, tmp_path):
+    """Test a key over the project's templates ignores edits to other templates"""
+    shutil.copytree(TemplateRenderer().template_dir, tmp_path / "templates")
+    renderer = TemplateRenderer(tmp_path / "templates", bytecode_cache=False)
+    cache = GenerationCache(tmp_path / "cache")
+    used = ProjectGenerator(cache=False).get_render_plan(sample_config).templates
+    key = cache.key(sample_config, renderer, used)
+
+    unused = tmp_path / "templates" / "django-rest" / "djangoORM" / "settings.py.j2"
+    unused.write_text(unused.read_text() + "\nEdited\n")
+    assert cache.key(sample_config, renderer, used) == key
+
+    readme = tmp_path / "templates" / "common" / "README.md.j2"
+    readme.write_text(readme.read_text() + "\nEdited\n")
+    assert cache.key(sample_config, renderer, used) != key
+
+
+def test_generation_cache_skips_clock_templates(sample_config, tmp_path):
+    """Test templates calling now() make projects uncacheable"""
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "stamp.j2").write_text("Generated {{ now().isoformat() }}\n")
+    (tmp_path / "templates" / "model.j2").write_text("default=db.func.now()\n")
+    cache = GenerationCache(tmp_path / "cache")
+
+    assert cache.key(sample_config, TemplateRenderer(tmp_path / "templates")) is None
+
+    (tmp_path / "templates" / "stamp.j2").unlink()
+    assert cache.key(sample_config, TemplateRenderer(tmp_path / "templates")) is not None
+
+
+def test_generation_cache_skips_clock_templates_in_plan(sample_config, tmp_path):
+    """Test only the project's own templates calling now() make it uncacheable"""
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "stamp.j2").write_text("Generated {{ now().isoformat() }}\n")
+    (tmp_path / "templates" / "page.j2").write_text('{% include "stamp.j2" %}\n')
+    (tmp_path / "templates" / "model.j2").write_text("default=db.func.now()\n")
+    renderer = TemplateRenderer(tmp_path / "templates", bytecode_cache=False)
+    cache = GenerationCache(tmp_path / "cache")
+
+    assert cache.key(sample_config, renderer, ["page.j2", "model.j2"]) is None
+    assert cache.key(sample_config, renderer, ["model.j2"]) is not None
+
+
+def test_generation_cache_discards_corrupt_entries(tmp_path):
+    """Test a damaged entry is a miss, and is removed"""
+    cache = GenerationCache(tmp_path)
+    tree = MemoryOutput(tmp_path / "demo")
+    tree.write_bytes(tmp_path / "demo" / "run.sh", b"#!/bin/sh\n", 0o755)
+    tree.mkdir(tmp_path / "demo" / "empty")
+    assert cache.store("abc", tree)
+
+    loaded = cache.load("abc", tmp_path / "elsewhere")
+    assert loaded.files == tree.files
+    assert loaded.mode("run.sh") == 0o755
+    assert loaded.directories == {"empty"}
+
+    entry = tmp_path / (cache.PATTERN % "abc")
+    entry.write_bytes(entry.read_bytes()[:-1] + b"X")
+
+    assert cache.load("abc", tmp_path / "elsewhere") is None
+    assert not entry.exists()
+
+
+def test_generation_cache_evicts_by_size(tmp_path):
+    """Test least recently used trees are evicted once over max_size"""
+    cache = GenerationCache(tmp_path)
+    for index in range(3):
+        tree = MemoryOutput(tmp_path / "demo")
+        tree.write_bytes(tmp_path / "demo" / "data", bytes([index]) * 1000)
+        cache.store(f"entry{index}", tree)
+        os.utime(tmp_path / (cache.PATTERN % f"entry{index}"), (index, index))
+    cache.max_size = cache.stats()["size"]
+
+    # Reading entry0 makes it the most recently used
+    assert cache.load("entry0", tmp_path / "demo") is not None
+    cache.store("entry3", MemoryOutput(tmp_path / "demo"))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        cache.PATTERN % "entry0",
+        cache.PATTERN % "entry2",
+        cache.PATTERN % "entry3",
+    ]
+
+
+def test_generation_cache_bypass(sample_config, tmp_path, monkeypatch):
+    """Test cache=False and VYTE_NO_CACHE render every project"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path / "cache"))
+
+    assert ProjectGenerator(cache=False).cache is None
+    ProjectGenerator(output_root=tmp_path, cache=False).generate(sample_config)
+    assert GenerationCache().stats()["entries"] == 0
+
+    monkeypatch.setenv("VYTE_NO_CACHE", "1")
+    assert ProjectGenerator().cache is None
+
+
+def test_failed_generation_is_not_cached(sample_config, tmp_path, monkeypatch):
+    """Test a generation that fails leaves no cache entry"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path / "cache"))
+    generator = ProjectGenerator(output_root=tmp_path)
+
+    def render(*_args, **_kwargs):
+        raise OSError("boom")
+
+    monkeypatch.setattr(generator.renderer, "render", render)
+
+    with pytest.raises(FileSystemError):
+        generator.generate(sample_config)
+
+    assert GenerationCache().stats()["entries"] == 0
+
+
+def test_recording_output_keeps_content_only_when_asked(tmp_path):
+    """Test only hashes are recorded unless the tree is going to be cached"""
+    for keep_files in (False, True):
+        root = tmp_path / f"project-{keep_files}"
+        recorder = RecordingOutput(MemoryOutput(root), keep_files=keep_files)
+        recorder.create_root()
+        recorder.write_text(root / "src" / "main.py", "print()")
+        recorder.touch(root / "src" / "__init__.py")
+
+        assert recorder.hashes == {
+            "src/main.py": hashlib.sha256(b"print()").hexdigest(),
+            "src/__init__.py": EMPTY_HASH,
+        }
+        if keep_files:
+            assert recorder.tree.files["src/main.py"] == b"print()"
+        else:
+            assert recorder.tree is None
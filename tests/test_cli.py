@@ -2,6 +2,10 @@
 """
 Test CLI commands
 """
+import io
+import json
+import tarfile
+
 import vyte
 from vyte.cli.commands import cli
 
@@ -72,3 +76,177 @@ def test_cli_create_non_interactive(runner):
 
         # The command may interact with templates on disk; ensure it exits cleanly
         assert result.exit_code in (0, 1)
+
+
+def test_cli_create_from_manifest(runner, tmp_path, monkeypatch):
+    """Test batch creation from a manifest"""
+    monkeypatch.chdir(tmp_path)
+    manifest = tmp_path / "services.json"
+    manifest.write_text(
+        '{"defaults": {"framework": "Flask-Restx", "orm": "Peewee", "database": "SQLite",'
+        ' "git_init": false, "docker_support": false},'
+        ' "projects": [{"name": "svc-one"}, {"name": "svc-two"}]}'
+    )
+
+    result = runner.invoke(cli, ["create", "--from-manifest", str(manifest), "--workers", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "svc-one" / "app.py").exists()
+    assert (tmp_path / "svc-two" / "app.py").exists()
+
+
+def test_cli_create_from_manifest_invalid_entry(runner, tmp_path, monkeypatch):
+    """Test an invalid manifest entry is reported without aborting the batch"""
+    monkeypatch.chdir(tmp_path)
+    manifest = tmp_path / "services.json"
+    manifest.write_text(
+        '{"defaults": {"framework": "Flask-Restx", "orm": "Peewee", "database": "SQLite",'
+        ' "git_init": false, "docker_support": false},'
+        ' "projects": [{"name": "svc-one", "orm": "Prisma"}, {"name": "svc-two"}]}'
+    )
+
+    result = runner.invoke(cli, ["create", "--from-manifest", str(manifest), "--workers", "1"])
+
+    assert result.exit_code == 1
+    assert "1 failed" in result.output
+    assert not (tmp_path / "svc-one").exists()
+    assert (tmp_path / "svc-two" / "app.py").exists()
+
+
+def test_cli_cache_stats_and_clear(runner):
+    """Test cache management commands"""
+    result = runner.invoke(cli, ["cache", "stats"])
+    assert result.exit_code == 0
+    assert "Entries" in result.output
+
+    result = runner.invoke(cli, ["cache", "clear"])
+    assert result.exit_code == 0
+    assert "Removed" in result.output
+
+
+def test_cli_create_archive_to_stdout(runner, tmp_path, monkeypatch):
+    """Test --archive - streams a tarball to stdout and nothing else"""
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        cli,
+        [
+            "create",
+            "-n",
+            "streamed-api",
+            "-f",
+            "Flask-Restx",
+            "-o",
+            "SQLAlchemy",
+            "-d",
+            "SQLite",
+            "--no-interactive",
+            "--archive",
+            "-",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    with tarfile.open(fileobj=io.BytesIO(result.stdout_bytes), mode="r:gz") as tar:
+        assert "streamed-api/app.py" in tar.getnames()
+    assert "Project archived to: stdout" in result.stderr
+    assert not (tmp_path / "streamed-api").exists()
+
+
+def test_cli_create_archive_next_to_existing_directory(runner, tmp_path, monkeypatch):
+    """Test a same-named directory only blocks generation to disk"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "streamed-api").mkdir()
+    args = ["create", "-n", "streamed-api", "-f", "Flask-Restx", "-o", "SQLAlchemy", "-d", "SQLite"]
+
+    result = runner.invoke(cli, [*args, "--no-interactive", "--archive", "-"])
+
+    assert result.exit_code == 0, result.stderr
+    assert list((tmp_path / "streamed-api").iterdir()) == []
+
+    result = runner.invoke(cli, [*args, "--no-interactive"])
+    assert result.exit_code == 1
+    assert "Directory already exists" in result.output
+
+
+def test_cli_create_profile_output(runner, tmp_path, monkeypatch):
+    """Test --profile-output prints the profile and writes it as JSON"""
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        cli,
+        [
+            "create",
+            "-n",
+            "profiled-api",
+            "-f",
+            "FastAPI",
+            "-o",
+            "SQLAlchemy",
+            "-d",
+            "SQLite",
+            "--no-interactive",
+            "--no-git",
+            "--no-cache",
+            "--profile-output",
+            "profile.json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Generation Profile" in result.output
+
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert set(profile["phases"]) == {"structure", "templates", "framework_files", "dependencies"}
+    assert "fastapi/sqlalchemy/alembic_env.py.j2" in profile["templates"]
+    assert profile["writes"]["files"] > 0
+
+
+def test_cli_create_replays_from_cache(runner, tmp_path, monkeypatch):
+    """Test a repeated create is restored from the generation cache unless --no-cache"""
+    monkeypatch.setenv("VYTE_CACHE_DIR", str(tmp_path / "cache"))
+    args = ["create", "-n", "cached-api", "-f", "FastAPI", "-o", "SQLAlchemy", "-d", "SQLite"]
+    args += ["--no-interactive", "--no-git", "--profile-output", "../profile.json"]
+
+    phases = []
+    outputs = []
+    for directory, extra in (("first", []), ("second", []), ("third", ["--no-cache"])):
+        (tmp_path / directory).mkdir()
+        monkeypatch.chdir(tmp_path / directory)
+        result = runner.invoke(cli, args + extra)
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / directory / "cached-api" / "alembic" / "env.py").exists()
+        phases.append(set(json.loads((tmp_path / "profile.json").read_text())["phases"]))
+        outputs.append(result.output)
+
+    assert "templates" in phases[0]
+    assert phases[1] == {"cache"}
+    assert "templates" in phases[2]
+
+    # A replayed project has no template timings to list
+    assert "Slowest Templates" in outputs[0]
+    assert "Slowest Templates" not in outputs[1]
+    assert "Served from the generation cache" in outputs[1]
+
+
+def test_cli_regenerate(runner, tmp_path, monkeypatch):
+    """Test regenerate applies a flag change and reports edited files"""
+    monkeypatch.chdir(tmp_path)
+    args = ["create", "-n", "regen-api", "-f", "FastAPI", "-o", "SQLAlchemy", "-d", "SQLite"]
+    result = runner.invoke(cli, args + ["--no-interactive", "--no-git", "--no-cache"])
+    assert result.exit_code == 0, result.output
+    project = tmp_path / "regen-api"
+    (project / "README.md").write_text("my readme")
+
+    result = runner.invoke(cli, ["regenerate", str(project), "--no-docker", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert (project / "Dockerfile").exists()
+
+    result = runner.invoke(cli, ["regenerate", str(project), "--no-docker"])
+    assert result.exit_code == 0, result.output
+    assert "README.md" in result.output
+    assert not (project / "Dockerfile").exists()
+    assert (project / "README.md").read_text() == "my readme"
+
+    result = runner.invoke(cli, ["regenerate", str(tmp_path)])
+    assert result.exit_code == 1
@@ -0,0 +1,104 @@
+"""
+Test concurrent generations sharing one generator
+"""
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from vyte.core.config import ProjectConfig
+from vyte.core.generator import ProjectGenerator
+from vyte.core.output import MemoryOutput
+
+STACKS = [
+    ("FastAPI", "SQLAlchemy"),
+    ("FastAPI", "TortoiseORM"),
+    ("Flask-Restx", "SQLAlchemy"),
+    ("Flask-Restx", "Peewee"),
+    ("Django-Rest", "DjangoORM"),
+]
+
+
+def _config(index: int) -> ProjectConfig:
+    """Config number `index`, cycling through every stack and flag"""
+    framework, orm = STACKS[index % len(STACKS)]
+    return ProjectConfig(
+        name=f"stress-{index}",
+        framework=framework,
+        orm=orm,
+        database="PostgreSQL",
+        auth_enabled=index % 2 == 0,
+        testing_suite=index % 3 != 0,
+        git_init=False,
+    )
+
+
+def _digest(project_path: Path) -> dict[str, str]:
+    """Content hash of every file in a project"""
+    return {
+        path.relative_to(project_path).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(project_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_config_does_not_depend_on_cwd(temp_dir, monkeypatch):
+    """Test names are validated without looking at the filesystem"""
+    monkeypatch.chdir(temp_dir)
+    (temp_dir / "taken").mkdir()
+
+    config = ProjectConfig(name="taken", framework="FastAPI", orm="SQLAlchemy", database="SQLite")
+
+    assert config.get_output_path(temp_dir / "elsewhere") == temp_dir / "elsewhere" / "taken"
+    assert config.get_output_path() == temp_dir / "taken"
+
+
+def test_existing_directory_fails_validation(temp_dir):
+    """Test an existing project directory is reported before generating"""
+    generator = ProjectGenerator(output_root=temp_dir)
+    (temp_dir / "taken").mkdir()
+    config = ProjectConfig(name="taken", framework="FastAPI", orm="SQLAlchemy", database="SQLite")
+
+    is_valid, errors = generator.validate_before_generate(config)
+
+    assert not is_valid
+    assert any("already exists" in error for error in errors)
+
+
+@pytest.mark.timeout(300)
+def test_hundreds_of_threaded_generations(temp_dir):
+    """Test 200 concurrent generations on one generator match serial output"""
+    cwd = os.getcwd()
+    generator = ProjectGenerator(output_root=temp_dir / "threaded", io_workers=2)
+    serial = ProjectGenerator(output_root=temp_dir / "serial", io_workers=1)
+    configs = [_config(index) for index in range(200)]
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        paths = list(executor.map(generator.generate, configs))
+
+    assert os.getcwd() == cwd
+    assert paths == [temp_dir / "threaded" / config.name for config in configs]
+
+    # Every project matches a serial generation of the same config
+    for config, path in zip(configs, paths, strict=True):
+        assert _digest(path) == _digest(serial.generate(config)), config.name
+
+
+def test_threaded_in_memory_generations(generator, temp_dir):
+    """Test concurrent in-memory generations never touch disk or each other"""
+    configs = [_config(index) for index in range(100)]
+
+    def generate(config):
+        output = MemoryOutput(temp_dir / config.name)
+        generator.generate(config, output=output)
+        return output
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        outputs = list(executor.map(generate, configs))
+
+    assert list(temp_dir.iterdir()) == []
+    for config, output in zip(configs, outputs, strict=True):
+        assert set(re.findall(r"stress-\d+", output.read_text("README.md"))) == {config.name}
@@ -3,7 +3,7 @@
 Test dependency management
 """
 from vyte.core.config import ProjectConfig
-from vyte.core.dependencies import DependencyManager
+from vyte.core.dependencies import CATEGORIES, DependencyManager
 
 
 def test_get_all_dependencies():
@@ -76,3 +76,60 @@ def test_sync_driver_selection():
     # Should include sync driver
     assert any("psycopg2" in d.lower() for d in deps)
     assert not any("asyncpg" in d.lower() for d in deps)
+
+
+def test_resolve_categorizes_dependencies():
+    """Test each requirement is tagged with the category it comes from"""
+    config = ProjectConfig(
+        name="test-api",
+        framework="FastAPI",
+        orm="SQLAlchemy",
+        database="PostgreSQL",
+        auth_enabled=True,
+        testing_suite=False,
+    )
+
+    resolved = DependencyManager.resolve(config)
+
+    assert "fastapi>=0.109.0" in resolved.category("framework")
+    assert "asyncpg>=0.29.0" in resolved.category("driver")
+    assert "alembic>=1.13.0" in resolved.category("orm")
+    assert resolved.category("testing") == ()
+    # Listed by both the framework and auth: keeps the first category
+    assert "python-multipart>=0.0.6" not in resolved.category("auth")
+    assert list(resolved.requirements) == DependencyManager.get_all_dependencies(config)
+    assert sum(resolved.counts()[c] for c in CATEGORIES) == resolved.counts()["total"]
+
+
+def test_resolve_is_memoized(sample_config):
+    """Test a combination is resolved once and shared"""
+    first = DependencyManager.resolve(sample_config)
+
+    assert DependencyManager.resolve(sample_config.model_copy(update={"name": "other"})) is first
+    assert (
+        DependencyManager.resolve(sample_config.model_copy(update={"auth_enabled": False})) != first
+    )
+
+
+def test_requirements_grouped_by_category(sample_config):
+    """Test requirements.txt lists every requirement once, under its category"""
+    content = DependencyManager.render_requirements_txt(sample_config)
+    lines = [line for line in content.splitlines() if line and not line.startswith("#")]
+
+    assert sorted(lines) == DependencyManager.get_all_dependencies(sample_config)
+    assert (
+        "# Flask-Restx framework\nFlask>=3.0.0\nflask-cors>=4.0.0\nflask-restx>=1.3.0\n" in content
+    )
+    assert "# Authentication\n" in content
+
+
+def test_dependencies_merged_per_package():
+    """Test a package required in several forms is listed once"""
+    config = ProjectConfig(
+        name="test-api", framework="FastAPI", orm="SQLAlchemy", database="SQLite"
+    )
+
+    deps = DependencyManager.get_all_dependencies(config)
+
+    assert [d for d in deps if d.startswith("sqlalchemy")] == ["sqlalchemy[asyncio]>=2.0.0"]
+    assert DependencyManager.check_dependency_conflicts(deps) == []
@@ -0,0 +1,133 @@
+"""
+Test generation events
+"""
+import time
+
+import pytest
+
+from vyte.cli.display import show_generation_progress
+from vyte.core.config import ProjectConfig
+from vyte.core.events import EventBus
+from vyte.core.output import MemoryOutput
+
+
+@pytest.fixture
+def fastapi_config():
+    """FastAPI project configuration"""
+    return ProjectConfig(
+        name="evented-api",
+        framework="FastAPI",
+        orm="SQLAlchemy",
+        database="SQLite",
+        git_init=False,
+    )
+
+
+def test_phases_are_reported_in_order(generator, temp_dir, fastapi_config):
+    """Test every phase starts and finishes, in generation order"""
+    events = []
+    generator.generate(
+        fastapi_config,
+        output=MemoryOutput(temp_dir / "evented-api"),
+        events=EventBus(events.append),
+    )
+
+    phases = [(e.kind, e.phase) for e in events if e.kind.startswith("phase_")]
+    assert phases == [
+        ("phase_started", "structure"),
+        ("phase_finished", "structure"),
+        ("phase_started", "templates"),
+        ("phase_finished", "templates"),
+        ("phase_started", "framework_files"),
+        ("phase_finished", "framework_files"),
+        ("phase_started", "dependencies"),
+        ("phase_finished", "dependencies"),
+    ]
+    assert all(e.duration >= 0 for e in events if e.kind == "phase_finished")
+
+
+def test_files_are_rendered_in_plan_order(generator, temp_dir, fastapi_config):
+    """Test file_rendered events follow the render plan, with sizes and timings"""
+    project_path = temp_dir / "evented-api"
+    events = []
+    generator.generate(
+        fastapi_config, output=MemoryOutput(project_path), events=EventBus(events.append)
+    )
+
+    plan = generator.get_render_plan(fastapi_config)
+    started = next(e for e in events if e.kind == "phase_started" and e.phase == "templates")
+    rendered = [e for e in events if e.kind == "file_rendered"]
+
+    assert started.total == len(plan)
+    assert [e.path for e in rendered] == [
+        path for _, path in plan.resolve(project_path, fastapi_config.model_dump_safe())
+    ]
+    assert [e.template for e in rendered] == [step.template for step in plan]
+    assert all(e.size > 0 and e.duration >= 0 for e in rendered)
+
+
+def test_directories_and_other_files_are_reported(generator, temp_dir, fastapi_config):
+    """Test writes outside the render plan are reported too"""
+    project_path = temp_dir / "evented-api"
+    events = []
+    generator.generate(
+        fastapi_config, output=MemoryOutput(project_path), events=EventBus(events.append)
+    )
+
+    directories = {e.path for e in events if e.kind == "directory_created"}
+    written = {e.path: e for e in events if e.kind == "file_written"}
+
+    assert project_path in directories
+    assert project_path / "src" / "api" in directories
+    assert written[project_path / "requirements.txt"].size > 0
+    assert project_path / "alembic.ini" in written
+
+
+def test_failed_phase_is_not_finished(generator, temp_dir, fastapi_config, monkeypatch):
+    """Test a failing phase reports no phase_finished event"""
+
+    def render(*_args, **_kwargs):
+        raise OSError("boom")
+
+    monkeypatch.setattr(generator.renderer, "render", render)
+    events = []
+
+    with pytest.raises(Exception, match="boom"):
+        generator.generate(
+            fastapi_config,
+            output=MemoryOutput(temp_dir / "evented-api"),
+            events=EventBus(events.append),
+        )
+
+    finished = [e.phase for e in events if e.kind == "phase_finished"]
+    assert finished == ["structure"]
+
+
+def test_event_bus_subscription():
+    """Test listeners can be added and removed"""
+    bus = EventBus()
+    received = []
+
+    bus.emit("phase_started", phase="ignored")
+
+    @bus.subscribe
+    def listener(event):
+        received.append(event.phase)
+
+    bus.emit("phase_started", phase="seen")
+    bus.unsubscribe(listener)
+    bus.emit("phase_started", phase="dropped")
+
+    assert received == ["seen"]
+
+
+def test_progress_has_no_artificial_delay(generator, fastapi_config, temp_dir):
+    """Test the progress display is driven by events, not sleeps"""
+    output = MemoryOutput(temp_dir / "evented-api")
+
+    start = time.perf_counter()
+    project_path = show_generation_progress(generator, fastapi_config, output=output)
+
+    assert project_path == temp_dir / "evented-api"
+    assert "src/main.py" in output.files
+    assert time.perf_counter() - start < 1.0
@@ -7,6 +7,8 @@ import subprocess
 import pytest
 from jinja2 import TemplateNotFound
 
+from vyte.core.output import MemoryOutput
+
 
 def test_generator_initialization(generator):
     """Test generator initialization"""
@@ -26,6 +28,21 @@ def test_validate_before_generate(generator, sample_config):
     assert isinstance(errors, list)
 
 
+def test_validate_before_generate_existing_directory(
+    generator, sample_config, temp_dir, monkeypatch
+):
+    """Test an existing project directory is only an error for output to disk"""
+    monkeypatch.chdir(temp_dir)
+    output_path = generator.get_output_path(sample_config)
+    output_path.mkdir()
+
+    _, errors = generator.validate_before_generate(sample_config)
+    assert f"Directory already exists: {output_path}" in errors
+
+    _, errors = generator.validate_before_generate(sample_config, MemoryOutput(output_path))
+    assert not any("already exists" in error for error in errors)
+
+
 def test_get_generation_summary(generator, sample_config):
     """Test generation summary"""
     summary = generator.get_generation_summary(sample_config)
@@ -0,0 +1,244 @@
+"""
+Test the built-in git repository writer
+"""
+import shutil
+import subprocess
+
+import pytest
+
+from vyte.cli.commands import cli
+from vyte.core.config import ProjectConfig
+from vyte.core.output import DiskOutput, MemoryOutput
+from vyte.exceptions import GitError
+from vyte.utils.git import (
+    GitIgnore,
+    Signature,
+    global_excludes,
+    initialize_repo,
+    initialize_repo_cli,
+    read_git_config,
+    tracked_files,
+)
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture
+def identity(monkeypatch):
+    """Fixed author, committer and dates shared by vyte and the git CLI"""
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Ada Lovelace")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "ada@example.com")
+        monkeypatch.setenv(f"GIT_{role}_DATE", "@1700000000 +0100")
+
+
+def _git(project_path, *args) -> str:
+    """Run a git command in a project"""
+    return subprocess.run(
+        ["git", *args], cwd=project_path, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _generate(generator, temp_dir, framework, orm):
+    """Generate a project on disk"""
+    config = ProjectConfig(
+        name=f"git-{framework.lower()}",
+        framework=framework,
+        orm=orm,
+        database="SQLite",
+        git_init=False,
+    )
+    return generator.generate(config, output=DiskOutput(temp_dir / config.name))
+
+
+@requires_git
+@pytest.mark.parametrize(
+    "framework,orm",
+    [("FastAPI", "SQLAlchemy"), ("Flask-Restx", "Peewee"), ("Django-Rest", "DjangoORM")],
+)
+def test_commit_matches_git_cli(generator, temp_dir, identity, framework, orm):
+    """Test the built-in writer produces the same commit as the git CLI"""
+    project_path = _generate(generator, temp_dir, framework, orm)
+    # Ignored files must stay out of the commit
+    (project_path / "server.log").write_text("ignored")
+    (project_path / "src" / "__pycache__").mkdir(parents=True, exist_ok=True)
+    (project_path / "src" / "__pycache__" / "main.cpython-312.pyc").write_bytes(b"\0")
+
+    copy = temp_dir / "cli-copy"
+    shutil.copytree(project_path, copy)
+
+    assert initialize_repo(project_path) == initialize_repo_cli(copy)
+    assert _git(project_path, "status", "--porcelain") == ""
+    _git(project_path, "fsck", "--strict")
+    assert "commit (initial): Initial commit from vyte" in _git(project_path, "reflog")
+
+
+@requires_git
+def test_repository_in_memory(generator, temp_dir, identity):
+    """Test a MemoryOutput project gets its .git in memory"""
+    config = ProjectConfig(
+        name="mem-git", framework="FastAPI", orm="SQLAlchemy", database="SQLite", git_init=False
+    )
+    output = MemoryOutput(temp_dir / "mem-git")
+    generator.generate(config, output=output)
+
+    commit = generator.init_git(output.root, output=output)
+
+    assert output.read_text(".git/HEAD").startswith("ref: refs/heads/")
+    assert any(path.endswith(".pack") for path in output.files)
+    assert not (temp_dir / "mem-git").exists()
+
+    project_path = output.materialize()
+    assert _git(project_path, "rev-parse", "HEAD").strip() == commit
+    assert _git(project_path, "status", "--porcelain") == ""
+
+
+def test_existing_repository_is_rejected(temp_dir):
+    """Test the writer refuses to overwrite a repository"""
+    output = MemoryOutput(temp_dir / "twice")
+    output.create_root()
+    output.write_text(temp_dir / "twice" / "README.md", "# Twice\n")
+
+    initialize_repo(output.root, output=output)
+    with pytest.raises(GitError):
+        initialize_repo(output.root, output=output)
+
+
+def test_gitignore_rules():
+    """Test .gitignore matching follows git semantics"""
+    files = {
+        ".gitignore": (b"*.log\nbuild/\n/local.cfg\n!keep.log\ndocs/**/*.tmp\n", 0o644),
+        "app.log": (b"", 0o644),
+        "keep.log": (b"", 0o644),
+        "build/out.py": (b"", 0o644),
+        "src/build": (b"file, not a directory", 0o644),
+        "local.cfg": (b"", 0o644),
+        "src/local.cfg": (b"", 0o644),
+        "docs/a/b/c.tmp": (b"", 0o644),
+        "src/main.py": (b"", 0o755),
+    }
+
+    assert sorted(tracked_files(files)) == [
+        ".gitignore",
+        "keep.log",
+        "src/build",
+        "src/local.cfg",
+        "src/main.py",
+    ]
+
+    ignore = GitIgnore()
+    ignore.add("src", "*.pyc\n")
+    assert ignore.ignored("src/a/b.pyc")
+    assert not ignore.ignored("b.pyc")
+
+
+@pytest.fixture
+def git_home(temp_dir, monkeypatch):
+    """Empty home directory holding the only git configuration"""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for name in ("XDG_CONFIG_HOME", "GIT_CONFIG_GLOBAL"):
+        monkeypatch.delenv(name, raising=False)
+    return home
+
+
+def test_global_excludes(git_home):
+    """Test the XDG ignore file is the default and core.excludesFile replaces it"""
+    (git_home / ".config" / "git").mkdir(parents=True)
+    (git_home / ".config" / "git" / "ignore").write_text("*.swp\n")
+    files = {"a.swp": (b"", 0o644), "a.bak": (b"", 0o644), ".gitignore": (b"!a.bak\n", 0o644)}
+
+    assert sorted(tracked_files(files, global_excludes())) == [".gitignore", "a.bak"]
+
+    (git_home / ".gitconfig").write_text("[core]\n\texcludesFile = ~/ignore\n")
+    (git_home / "ignore").write_text("*.bak\n")
+    assert global_excludes() == "*.bak\n"
+    # .gitignore files override global patterns
+    assert sorted(tracked_files(files, global_excludes())) == [".gitignore", "a.bak", "a.swp"]
+
+
+def test_read_git_config_includes(git_home, temp_dir):
+    """Test [include] files are read, and [includeIf "gitdir:"] ones for matching repositories"""
+    (git_home / ".gitconfig").write_text(
+        "[user]\n\tname = Global\n"
+        "[include]\n\tpath = extra.gitconfig\n"
+        '[includeIf "gitdir:work/"]\n\tpath = ~/work.gitconfig\n'
+        '[includeIf "onbranch:main"]\n\tpath = ~/branch.gitconfig\n'
+    )
+    (git_home / "extra.gitconfig").write_text("[user]\n\temail = extra@example.com\n")
+    (git_home / "work.gitconfig").write_text("[user]\n\tname = Work\n")
+    (git_home / "branch.gitconfig").write_text("[user]\n\tname = Branch\n")
+
+    config = read_git_config(temp_dir / "personal" / "api" / ".git")
+    assert (config["user.name"], config["user.email"]) == ("Global", "extra@example.com")
+
+    config = read_git_config(temp_dir / "work" / "api" / ".git")
+    assert (config["user.name"], config["user.email"]) == ("Work", "extra@example.com")
+
+
+@requires_git
+def test_commit_honors_global_git_config(generator, git_home, temp_dir, identity):
+    """Test included config and core.excludesFile apply as they do for the git CLI"""
+    (git_home / ".gitconfig").write_text(
+        '[includeIf "gitdir:work/"]\n\tpath = work.gitconfig\n'
+        "[include]\n\tpath = ~/.config/vyte-test.gitconfig\n"
+    )
+    (git_home / "work.gitconfig").write_text("[init]\n\tdefaultBranch = trunk\n")
+    (git_home / ".config").mkdir()
+    (git_home / ".config" / "vyte-test.gitconfig").write_text(
+        "[core]\n\texcludesFile = ~/global-ignore\n"
+    )
+    (git_home / "global-ignore").write_text("*.secret\n")
+
+    project_path = _generate(generator, temp_dir / "work", "FastAPI", "SQLAlchemy")
+    (project_path / "notes.secret").write_text("ignored")
+    copy = temp_dir / "work" / "cli-copy"
+    shutil.copytree(project_path, copy)
+
+    assert initialize_repo(project_path) == initialize_repo_cli(copy)
+    assert _git(project_path, "branch", "--show-current").strip() == "trunk"
+    assert "notes.secret" not in _git(project_path, "ls-files")
+    assert _git(project_path, "status", "--porcelain") == ""
+
+
+def test_signature_from_environment(monkeypatch):
+    """Test identities and dates come from git's environment variables"""
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Grace")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "grace@example.com")
+    monkeypatch.setenv("GIT_AUTHOR_DATE", "1700000000 -0230")
+
+    signature = Signature.from_environment("author", config={})
+
+    assert signature.format() == "Grace <grace@example.com> 1700000000 -0230"
+
+
+def test_cli_create_initializes_git_in_process(runner, tmp_path, monkeypatch):
+    """Test `vyte create --git` does not spawn git"""
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("git CLI must not be used")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(subprocess, "run", forbidden)
+
+    result = runner.invoke(
+        cli,
+        [
+            "create",
+            "-n",
+            "git-api",
+            "-f",
+            "Flask-Restx",
+            "-o",
+            "SQLAlchemy",
+            "-d",
+            "SQLite",
+            "--no-interactive",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Git repository initialized" in result.output
+    assert (tmp_path / "git-api" / ".git" / "index").is_file()
@@ -0,0 +1,227 @@
+"""
+Test offline lockfile resolution
+"""
+import hashlib
+import io
+import platform
+import tarfile
+import zipfile
+
+import pytest
+
+from vyte.cli.commands import cli
+from vyte.core.dependencies import DependencyManager
+from vyte.core.lockfile import (
+    LOCKFILE_NAME,
+    PackageIndex,
+    read_requirements,
+    resolve_lockfile,
+    target_environment,
+    target_tags,
+)
+from vyte.exceptions import DependencyError
+
+
+def _metadata(name: str, version: str, requires: list[str], requires_python: str = "") -> str:
+    """Core metadata of a release"""
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    if requires_python:
+        lines.append(f"Requires-Python: {requires_python}")
+    lines.extend(f"Requires-Dist: {requirement}" for requirement in requires)
+    return "\n".join(lines) + "\n"
+
+
+def _wheel(
+    index,
+    name: str,
+    version: str,
+    requires: list[str] = (),
+    tag: str = "py3-none-any",
+    requires_python: str = "",
+):
+    """Write a wheel holding only its metadata"""
+    project = name.replace("-", "_")
+    path = index / f"{project}-{version}-{tag}.whl"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            f"{project}-{version}.dist-info/METADATA",
+            _metadata(name, version, requires, requires_python),
+        )
+    return path
+
+
+def _sdist(index, name: str, version: str, requires: list[str] = ()):
+    """Write a source distribution holding only its PKG-INFO"""
+    project = name.replace("-", "_")
+    path = index / f"{project}-{version}.tar.gz"
+    data = _metadata(name, version, requires).encode()
+    with tarfile.open(path, "w:gz") as archive:
+        info = tarfile.TarInfo(f"{project}-{version}/PKG-INFO")
+        info.size = len(data)
+        archive.addfile(info, io.BytesIO(data))
+    return path
+
+
+@pytest.fixture
+def index(temp_dir):
+    """Package index snapshot with a small dependency tree"""
+    root = temp_dir / "index"
+    root.mkdir()
+    _wheel(root, "web", "1.0.0", ["core>=1.0"])
+    _wheel(root, "web", "2.0.0", ["core>=2.0,<3", "speedups; extra == 'fast'"])
+    _wheel(
+        root,
+        "web",
+        "2.0.0",
+        ["core>=2.0,<3", "speedups; extra == 'fast'"],
+        "cp311-cp311-linux_x86_64",
+    )
+    _wheel(root, "core", "1.5.0")
+    _wheel(root, "core", "2.1.0", ["legacy; python_version < '3.8'"])
+    _wheel(root, "core", "3.0.0")
+    _wheel(root, "core", "3.1.0rc1")
+    (root / "simple" / "speedups").mkdir(parents=True)
+    _sdist(root / "simple" / "speedups", "speedups", "0.9")
+    (root / "notes.txt").write_text("not a distribution")
+    return root
+
+
+def test_resolve_lockfile(index):
+    """Test the newest compatible releases are pinned, with transitive dependencies"""
+    lockfile = resolve_lockfile(["web>=1.0", "core"], PackageIndex(index))
+
+    pins = {package.name: str(package.version) for package in lockfile.packages}
+    assert pins == {"core": "2.1.0", "web": "2.0.0"}
+
+    web = lockfile.packages[1]
+    assert len(web.hashes) == 2
+    assert web.via == ("-r requirements.txt",)
+    assert lockfile.packages[0].via == ("-r requirements.txt", "web")
+
+
+def test_resolve_lockfile_extras_and_sdists(index):
+    """Test extras pull in their dependencies, read from source distributions too"""
+    lockfile = resolve_lockfile(["web[fast]"], PackageIndex(index))
+
+    packages = {package.name: package for package in lockfile.packages}
+    assert packages["web"].requirement == "web[fast]==2.0.0"
+    speedups = index / "simple" / "speedups" / "speedups-0.9.tar.gz"
+    assert packages["speedups"].hashes == (hashlib.sha256(speedups.read_bytes()).hexdigest(),)
+
+
+def test_resolve_lockfile_backs_off_newest_release(index):
+    """Test a pin is revised when a dependency's requirement excludes it"""
+    lockfile = resolve_lockfile(["core", "web"], PackageIndex(index))
+
+    # core 3.0.0 is newest, but web 2.0.0 requires core<3
+    assert {p.name: str(p.version) for p in lockfile.packages} == {
+        "core": "2.1.0",
+        "web": "2.0.0",
+    }
+
+
+def test_resolve_lockfile_backtracks(index):
+    """Test an older release is tried when the newest one's requirements conflict"""
+    lockfile = resolve_lockfile(["web", "core<2"], PackageIndex(index))
+
+    # web 2.0.0 requires core>=2.0, web 1.0.0 only core>=1.0
+    assert {p.name: str(p.version) for p in lockfile.packages} == {
+        "core": "1.5.0",
+        "web": "1.0.0",
+    }
+
+
+def test_resolve_lockfile_requires_python(index):
+    """Test releases whose Requires-Python excludes the target are skipped"""
+    _wheel(index, "core", "2.2.0", requires_python=">=3.12")
+
+    def pins(python_version):
+        lockfile = resolve_lockfile(
+            ["web"],
+            PackageIndex(index),
+            target_environment(python_version),
+            target_tags(python_version),
+        )
+        return {p.name: str(p.version) for p in lockfile.packages}
+
+    assert pins("3.11")["core"] == "2.1.0"
+    assert pins("3.12")["core"] == "2.2.0"
+
+    with pytest.raises(DependencyError, match=r"2\.2\.0 \(Requires-Python >=3\.12\)"):
+        resolve_lockfile(
+            ["core==2.2.0"], PackageIndex(index), target_environment("3.11"), target_tags("3.11")
+        )
+
+
+def test_resolve_lockfile_wheel_tags(index):
+    """Test releases with no wheel for the target interpreter and platform are skipped"""
+    arch = platform.machine().lower()
+    _wheel(index, "core", "2.5.0", tag=f"cp312-cp312-manylinux_2_17_{arch}.manylinux2014_{arch}")
+    _wheel(index, "core", "2.6.0", tag="cp311-cp311-win_amd64")
+
+    lockfile = resolve_lockfile(
+        ["core<3"], PackageIndex(index), target_environment("3.12"), target_tags("3.12")
+    )
+    assert str(lockfile.packages[0].version) == "2.5.0"
+
+    lockfile = resolve_lockfile(
+        ["core<3"], PackageIndex(index), target_environment("3.11"), target_tags("3.11")
+    )
+    assert str(lockfile.packages[0].version) == "2.1.0"
+
+
+def test_resolve_lockfile_unsatisfiable(index):
+    """Test missing projects and impossible constraints are reported"""
+    with pytest.raises(DependencyError, match="not in"):
+        resolve_lockfile(["missing"], PackageIndex(index))
+
+    with pytest.raises(DependencyError, match="No release of core"):
+        resolve_lockfile(["web==2.0.0", "core<2"], PackageIndex(index))
+
+
+def test_lockfile_format(index):
+    """Test the output is pip-tools compatible and deterministic"""
+    text = resolve_lockfile(["web"], PackageIndex(index), target_environment("3.11")).to_text()
+
+    assert "web==2.0.0 \\\n    --hash=sha256:" in text
+    assert "    # via -r requirements.txt\n" in text
+    assert text == resolve_lockfile(["web"], PackageIndex(index)).to_text()
+
+
+def test_render_lockfile(sample_config, temp_dir):
+    """Test a project's dependencies are locked from a snapshot holding them"""
+    root = temp_dir / "wheels"
+    root.mkdir()
+    requirements = DependencyManager.resolve(sample_config).requirements
+    for requirement in requirements:
+        name, version = requirement.split("=", 1)[0].rstrip(">"), requirement.split("=")[-1]
+        _wheel(root, name.split("[")[0], version)
+
+    text = DependencyManager.render_lockfile(sample_config, root)
+
+    assert text.count("--hash=sha256:") == len(requirements)
+    assert "passlib[bcrypt]==1.7.4 \\\n" in text
+
+
+def test_read_requirements(temp_dir):
+    """Test comments and pip options are skipped"""
+    path = temp_dir / "requirements.txt"
+    path.write_text("# Base\n-r base.txt\nfastapi>=0.109.0  # web\n\nrich\n")
+
+    assert read_requirements(path) == ["fastapi>=0.109.0", "rich"]
+
+
+def test_cli_lock(index, temp_dir, runner):
+    """Test vyte lock writes requirements.lock next to requirements.txt"""
+    project = temp_dir / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("web[fast]\n")
+
+    result = runner.invoke(cli, ["lock", str(project), "--index", str(index)])
+
+    assert result.exit_code == 0, result.output
+    assert "speedups==0.9" in (project / LOCKFILE_NAME).read_text()
+
+    (project / "requirements.txt").write_text("missing\n")
+    result = runner.invoke(cli, ["lock", str(project), "--index", str(index)])
+    assert result.exit_code == 1
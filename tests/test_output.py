@@ -0,0 +1,227 @@
+"""
+Test output backends
+"""
+import importlib
+import io
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from vyte.core.config import ProjectConfig
+from vyte.core.output import ArchiveOutput, DiskOutput, MemoryOutput
+from vyte.exceptions import ConfigurationError, FileSystemError
+
+
+def _config(framework="FastAPI", orm="SQLAlchemy", name="mem-api"):
+    return ProjectConfig(
+        name=name,
+        framework=framework,
+        orm=orm,
+        database="SQLite",
+        auth_enabled=True,
+        docker_support=True,
+        testing_suite=True,
+        git_init=False,
+    )
+
+
+def _disk_tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+def test_memory_generation_does_not_touch_disk(generator, temp_dir):
+    """Test generating into memory writes nothing to the filesystem"""
+    output = MemoryOutput(temp_dir / "mem-api")
+
+    project_path = generator.generate(_config(), output=output)
+
+    assert project_path == temp_dir / "mem-api"
+    assert not project_path.exists()
+    assert "src/main.py" in output.files
+    assert "src/api/__init__.py" in output.files
+    assert "src/crud" in output.directories
+    assert "mem-api" in output.read_text("README.md")
+    assert output.read_text(project_path / "README.md") == output.read_text("README.md")
+
+
+@pytest.mark.parametrize(
+    "framework,orm",
+    [("FastAPI", "SQLAlchemy"), ("Flask-Restx", "Peewee"), ("Django-Rest", "DjangoORM")],
+)
+def test_memory_matches_disk(generator, temp_dir, framework, orm):
+    """Test in-memory and on-disk generation produce the same tree"""
+    config = _config(framework, orm)
+    disk_path = generator.generate(config, output=DiskOutput(temp_dir / "disk" / config.name))
+    output = MemoryOutput(temp_dir / "memory" / config.name)
+    generator.generate(config, output=output)
+
+    assert output.files == _disk_tree(disk_path)
+
+
+def test_manage_py_is_executable_in_memory(generator, temp_dir):
+    """Test file modes are tracked in memory"""
+    output = MemoryOutput(temp_dir / "mem-api")
+    generator.generate(_config("Django-Rest", "DjangoORM"), output=output)
+
+    assert output.mode("manage.py") == 0o755
+    assert output.mode("README.md") == MemoryOutput.DEFAULT_FILE_MODE
+
+
+def test_memory_output_rejects_existing_root(generator, temp_dir):
+    """Test a memory backend can only receive one project"""
+    output = MemoryOutput(temp_dir / "mem-api")
+    generator.generate(_config(), output=output)
+
+    with pytest.raises(FileExistsError):
+        generator.generate(_config(), output=output)
+
+
+def test_paths_outside_root_are_rejected(temp_dir):
+    """Test backends refuse to write outside the project root"""
+    output = MemoryOutput(temp_dir / "project")
+
+    with pytest.raises(FileSystemError):
+        output.write_text(temp_dir / "elsewhere.txt", "nope")
+
+
+def test_activate_imports(generator, temp_dir):
+    """Test generated modules are importable straight from memory"""
+    output = MemoryOutput(temp_dir / "mem-api")
+    generator.generate(_config(), output=output)
+
+    with output.activate_imports():
+        module = importlib.import_module("src.config.config")
+        assert module.Settings().app_name == "mem-api"
+
+    # Modules from memory don't leak past the context
+    assert sys.modules.get("src.config.config") is not module
+
+
+def test_materialize(generator, temp_dir):
+    """Test the in-memory tree is written to disk in one pass"""
+    output = MemoryOutput(temp_dir / "mem-api")
+    generator.generate(_config(), output=output)
+
+    project_path = output.materialize()
+
+    assert _disk_tree(project_path) == output.files
+    assert (project_path / "alembic" / "versions").is_dir()
+
+    with pytest.raises(FileExistsError):
+        output.materialize()
+
+
+def test_to_tar_and_zip(generator, temp_dir):
+    """Test archives are rooted at the project name"""
+    output = MemoryOutput(temp_dir / "mem-api")
+    generator.generate(_config(), output=output)
+
+    buffer = io.BytesIO()
+    output.to_tar(buffer)
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer, mode="r:gz") as tar:
+        readme = tar.extractfile("mem-api/README.md").read()
+        assert tar.getmember("mem-api/src").isdir()
+    assert readme == output.files["README.md"]
+
+    zip_path = temp_dir / "mem-api.zip"
+    output.to_zip(zip_path)
+    with zipfile.ZipFile(zip_path) as archive:
+        files = [name for name in archive.namelist() if not name.endswith("/")]
+        assert sorted(files) == sorted(f"mem-api/{f}" for f in output.files)
+        assert "mem-api/src/" in archive.namelist()
+
+
+@pytest.mark.parametrize("archive_format", ["tar.gz", "zip"])
+def test_generate_archive_matches_disk(generator, temp_dir, archive_format):
+    """Test streamed archives hold exactly the on-disk tree"""
+    config = _config("Django-Rest", "DjangoORM")
+    disk_path = generator.generate(config, output=DiskOutput(temp_dir / "disk" / config.name))
+    target = temp_dir / f"project.{archive_format}"
+
+    generator.generate_archive(config, target)
+
+    extracted = temp_dir / "extracted"
+    if archive_format == "zip":
+        with zipfile.ZipFile(target) as archive:
+            archive.extractall(extracted)
+            manage_mode = archive.getinfo(f"{config.name}/manage.py").external_attr >> 16
+    else:
+        with tarfile.open(target) as tar:
+            tar.extractall(extracted, filter="data")
+            manage_mode = tar.getmember(f"{config.name}/manage.py").mode
+
+    assert _disk_tree(extracted / config.name) == _disk_tree(disk_path)
+    assert manage_mode & 0o777 == 0o755
+    assert not config.get_output_path().exists()
+
+
+def test_archive_streams_to_unseekable_target(generator):
+    """Test archives can be streamed to a pipe-like object"""
+
+    class Pipe(io.RawIOBase):
+        def __init__(self):
+            self.chunks = []
+
+        def writable(self):
+            return True
+
+        def write(self, data):
+            self.chunks.append(bytes(data))
+            return len(data)
+
+    pipe = Pipe()
+    generator.generate(_config(), output=ArchiveOutput(Path("mem-api"), pipe, "tar.gz"))
+
+    with tarfile.open(fileobj=io.BytesIO(b"".join(pipe.chunks)), mode="r:gz") as tar:
+        names = tar.getnames()
+    assert "mem-api/src/main.py" in names
+    assert "mem-api/alembic/versions/.gitkeep" in names
+    assert len(names) == len(set(names))
+
+
+def test_archive_touch_is_deferred(temp_dir):
+    """Test an empty placeholder doesn't block a later write to the same path"""
+    target = temp_dir / "out.zip"
+    output = ArchiveOutput(temp_dir / "project", target)
+    output.create_root()
+    output.touch(temp_dir / "project" / "pkg" / "__init__.py")
+    output.write_text(temp_dir / "project" / "pkg" / "__init__.py", "VALUE = 1\n")
+    output.touch(temp_dir / "project" / "empty.py")
+    output.close()
+
+    with zipfile.ZipFile(target) as archive:
+        assert archive.read("project/pkg/__init__.py") == b"VALUE = 1\n"
+        assert archive.read("project/empty.py") == b""
+
+
+def test_archive_format_detection(temp_dir):
+    """Test the format is taken from the file name"""
+    assert ArchiveOutput.detect_format("x.zip") == "zip"
+    assert ArchiveOutput.detect_format(temp_dir / "x.tar.xz") == "tar.xz"
+    assert ArchiveOutput.detect_format(io.BytesIO()) == "tar.gz"
+
+    with pytest.raises(ConfigurationError):
+        ArchiveOutput(temp_dir / "project", temp_dir / "x.rar", "rar")
+
+
+def test_failed_archive_is_removed(generator, temp_dir, monkeypatch):
+    """Test a partial archive file is deleted when generation fails"""
+    target = temp_dir / "broken.tar.gz"
+
+    def render(*_args, **_kwargs):
+        raise OSError("boom")
+
+    monkeypatch.setattr(generator.renderer, "render", render)
+
+    with pytest.raises(FileSystemError):
+        generator.generate_archive(_config(), target)
+
+    assert not target.exists()
@@ -0,0 +1,64 @@
+"""
+Test render plan compilation
+"""
+from vyte.core.config import ProjectConfig
+from vyte.core.plan import COMMON_RULES, PlanRule, compile_render_plan
+
+
+def _config(**overrides):
+    values = {
+        "name": "plan-api",
+        "framework": "FastAPI",
+        "orm": "SQLAlchemy",
+        "database": "SQLite",
+        "auth_enabled": True,
+        "docker_support": True,
+        "testing_suite": True,
+    }
+    values.update(overrides)
+    return ProjectConfig(**values)
+
+
+def test_render_plan_is_memoized(generator):
+    """Test plans are compiled once per combination"""
+    first = generator.get_render_plan(_config())
+    second = generator.get_render_plan(_config(name="other-api"))
+
+    assert first is second
+
+
+def test_render_plan_conditions(generator):
+    """Test disabled flags drop their rules"""
+    full = generator.get_render_plan(_config())
+    minimal = generator.get_render_plan(
+        _config(auth_enabled=False, docker_support=False, testing_suite=False)
+    )
+
+    full_destinations = {step.destination for step in full}
+    minimal_destinations = {step.destination for step in minimal}
+
+    assert {"src/security.py", "Dockerfile", "tests/conftest.py"} <= full_destinations
+    assert not {"src/security.py", "Dockerfile", "tests/conftest.py"} & minimal_destinations
+    assert full.diff(minimal)["removed"]
+    assert not full.diff(minimal)["added"]
+
+
+def test_render_plan_last_rule_wins():
+    """Test duplicate destinations keep only the last rule"""
+    rules = (PlanRule("tests", "pytest_ini", "pytest.ini", "testing_suite"),) + COMMON_RULES
+
+    plan = compile_render_plan(rules, "Django-Rest", "DjangoORM", True, True, False)
+
+    pytest_steps = [step for step in plan if step.destination == "pytest.ini"]
+    assert [step.template for step in pytest_steps] == ["common/pytest.ini.j2"]
+
+
+def test_render_plan_resolves_app_name(generator, tmp_path):
+    """Test {app_name} placeholders resolve per project"""
+    config = _config(name="my-shop", framework="Django-Rest", orm="DjangoORM")
+    plan = generator.get_render_plan(config)
+
+    outputs = {path for _, path in plan.resolve(tmp_path, config.model_dump_safe())}
+
+    assert tmp_path / "my_shop" / "settings.py" in outputs
+    assert tmp_path / "my_shop" / "permissions.py" in outputs
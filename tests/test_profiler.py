@@ -0,0 +1,90 @@
+"""
+Test generation profiling
+"""
+import json
+
+import pytest
+
+from vyte.core.config import ProjectConfig
+from vyte.core.events import EventBus
+from vyte.core.output import MemoryOutput
+from vyte.core.profiler import GenerationProfiler
+
+
+@pytest.fixture
+def fastapi_config():
+    """FastAPI project configuration"""
+    return ProjectConfig(
+        name="profiled-api",
+        framework="FastAPI",
+        orm="SQLAlchemy",
+        database="SQLite",
+        git_init=False,
+    )
+
+
+def test_profile_covers_phases_templates_and_writes(generator, temp_dir, fastapi_config):
+    """Test the profiler records every phase, template and written byte"""
+    output = MemoryOutput(temp_dir / "profiled-api")
+    profiler = GenerationProfiler()
+
+    generator.generate(fastapi_config, output=output, events=EventBus(profiler))
+
+    assert list(profiler.phases) == ["structure", "templates", "framework_files", "dependencies"]
+
+    plan = generator.get_render_plan(fastapi_config)
+    assert set(profiler.templates) == {step.template for step in plan}
+    assert all(t.renders == 1 and t.render >= t.load >= 0 for t in profiler.templates.values())
+
+    # Some files are touched before being rendered over: bytes of every write count
+    assert profiler.files_written == len(output.files)
+    assert profiler.directories == len(output.directories) + 1  # the project root
+    assert profiler.bytes_written >= sum(len(data) for data in output.files.values())
+    assert profiler.total >= sum(profiler.phases.values())
+
+
+def test_generator_wide_hooks(generator, temp_dir, fastapi_config):
+    """Test listeners on generator.events see every generation"""
+    seen = []
+    generator.events.subscribe(seen.append)
+
+    generator.generate(fastapi_config, output=MemoryOutput(temp_dir / "one"))
+    generator.generate(fastapi_config, output=MemoryOutput(temp_dir / "two"))
+
+    roots = {
+        e.path: None for e in seen if e.kind == "directory_created" and e.path.parent == temp_dir
+    }
+    assert list(roots) == [temp_dir / "one", temp_dir / "two"]
+
+
+def test_template_loaded_events(renderer):
+    """Test the renderer reports template load times when given a bus"""
+    events = []
+
+    renderer.render("common/LICENSE.j2", {"name": "demo"}, events=EventBus(events.append))
+
+    assert [(e.kind, e.template) for e in events] == [("template_loaded", "common/LICENSE.j2")]
+
+
+def test_report_is_json(generator, temp_dir, fastapi_config):
+    """Test the report serializes, slowest template first"""
+    profiler = GenerationProfiler()
+    generator.generate(
+        fastapi_config, output=MemoryOutput(temp_dir / "api"), events=EventBus(profiler)
+    )
+
+    path = temp_dir / "profile.json"
+    document = json.loads(profiler.to_json(path))
+
+    assert json.loads(path.read_text()) == document
+    renders = [t["render"] for t in document["templates"].values()]
+    assert renders == sorted(renders, reverse=True)
+    assert document["writes"]["bytes"] == profiler.bytes_written
+
+
+def test_empty_profile():
+    """Test a profiler that saw nothing reports zeros"""
+    report = GenerationProfiler().report()
+
+    assert report["total"] == 0.0
+    assert report["templates"] == {}
@@ -0,0 +1,190 @@
+"""
+Test project manifests and incremental regeneration
+"""
+import hashlib
+import shutil
+from pathlib import Path
+
+import pytest
+
+from vyte.core.events import EventBus
+from vyte.core.generator import ProjectGenerator
+from vyte.core.manifest import MANIFEST_PATH, ProjectManifest
+from vyte.exceptions import ConfigurationError
+
+
+def _digest(project_path: Path) -> dict[str, str]:
+    """Content hash of every file in a project"""
+    return {
+        path.relative_to(project_path).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(project_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.fixture
+def project(sample_config, temp_dir):
+    """Generated project with a manifest"""
+    return ProjectGenerator(output_root=temp_dir, cache=False).generate(sample_config)
+
+
+def _rendered(generator, project_path, **kwargs):
+    """Regenerate a project, returning the report and the templates rendered"""
+    templates = []
+    bus = EventBus()
+    bus.subscribe(lambda e: templates.append(e.template) if e.kind == "file_rendered" else None)
+    report = generator.regenerate(project_path, events=bus, **kwargs)
+    return report, templates
+
+
+def test_manifest_covers_project(project, generator):
+    """Test the manifest records every generated file and round-trips"""
+    manifest = ProjectManifest.load(project)
+
+    files = set(_digest(project)) - {MANIFEST_PATH}
+    assert set(manifest.files) == files
+    assert manifest.files["README.md"].template is not None
+    assert manifest.files["requirements.txt"].template is None
+    assert manifest.config["name"] == "test-api"
+    assert manifest.to_json() == (project / MANIFEST_PATH).read_text()
+
+
+def test_regenerate_up_to_date(project, generator):
+    """Test regenerating an untouched project renders and writes nothing"""
+    before = _digest(project)
+
+    report, templates = _rendered(generator, project)
+
+    assert report.rendered == 0
+    assert templates == []
+    assert not report.changed
+    assert not report.modified
+    assert _digest(project) == before
+
+
+def test_regenerate_matches_fresh_generation(project, sample_config, temp_dir, generator):
+    """Test a regenerated project is identical to one generated with the new config"""
+    config = sample_config.model_copy(update={"auth_enabled": False, "docker_support": False})
+
+    report = generator.regenerate(project, config=config)
+
+    fresh = ProjectGenerator(output_root=temp_dir / "fresh", cache=False).generate(config)
+    assert _digest(project) == _digest(fresh)
+    assert "Dockerfile" in report.removed
+    assert not report.modified
+
+
+def test_regenerate_renders_affected_templates_only(project, sample_config, generator):
+    """Test only templates reading a changed value are rendered again"""
+    config = sample_config.model_copy(update={"docker_support": False})
+
+    report, templates = _rendered(generator, project, config=config)
+
+    assert templates
+    assert report.rendered == len(templates)
+    assert len(templates) < len(ProjectManifest.load(project).files)
+    for template in templates:
+        variables = generator.renderer.template_variables(template)
+        assert "docker_support" in variables, template
+
+
+def test_regenerate_after_year_change(project, generator, monkeypatch):
+    """Test templates reading a global (the copyright year) are rendered again"""
+    monkeypatch.setitem(generator.renderer.env.globals, "year", 1999)
+
+    report, templates = _rendered(generator, project)
+
+    assert "common/LICENSE.j2" in templates
+    assert all("year" in generator.renderer.template_variables(t) for t in templates)
+    assert "LICENSE" in report.updated
+    assert "1999" in (project / "LICENSE").read_text()
+
+
+def test_regenerate_after_template_change(sample_config, temp_dir):
+    """Test editing one template renders only the files it produces"""
+    template_dir = temp_dir / "templates"
+    shutil.copytree(ProjectGenerator().renderer.template_dir, template_dir)
+    project_path = ProjectGenerator(
+        template_dir=template_dir, output_root=temp_dir / "out", cache=False
+    ).generate(sample_config)
+    readme = ProjectManifest.load(project_path).files["README.md"].template
+    with open(template_dir / readme, "a", encoding="utf-8") as f:
+        f.write("\nRegenerated\n")
+
+    generator = ProjectGenerator(template_dir=template_dir, cache=False)
+    report, templates = _rendered(generator, project_path)
+
+    assert templates == [readme]
+    assert report.updated == ["README.md"]
+    assert (project_path / "README.md").read_text().endswith("Regenerated\n")
+
+
+def test_regenerate_keeps_user_edits(project, sample_config, generator):
+    """Test files edited since generation are reported and left alone"""
+    (project / "README.md").write_text("my readme")
+    (project / "Dockerfile").write_text("FROM scratch")
+    config = sample_config.model_copy(update={"docker_support": False})
+
+    report = generator.regenerate(project, config=config)
+
+    assert report.modified == ["Dockerfile", "README.md"]
+    assert (project / "README.md").read_text() == "my readme"
+    assert (project / "Dockerfile").read_text() == "FROM scratch"
+    assert ProjectManifest.load(project).config["docker_support"] is False
+
+
+def test_regenerate_keeps_reporting_user_edits(project, sample_config, generator):
+    """Test a change kept back by a user edit is reported again on the next run"""
+    readme = project / "README.md"
+    readme.write_text(readme.read_text() + "My notes\n")
+    config = sample_config.model_copy(update={"auth_enabled": False})
+
+    assert "README.md" in generator.regenerate(project, config=config).modified
+
+    report = generator.regenerate(project)
+
+    assert "README.md" in report.modified
+    assert readme.read_text().endswith("My notes\n")
+
+
+def test_regenerate_dry_run(project, sample_config, generator):
+    """Test a dry run reports changes without writing anything"""
+    before = _digest(project)
+    config = sample_config.model_copy(update={"auth_enabled": False})
+
+    report = generator.regenerate(project, config=config, dry_run=True)
+
+    assert report.dry_run
+    assert report.changed
+    assert _digest(project) == before
+
+
+def test_regenerate_requires_manifest(project, generator):
+    """Test projects without a manifest are refused"""
+    (project / MANIFEST_PATH).unlink()
+
+    with pytest.raises(ConfigurationError, match="No vyte manifest"):
+        generator.regenerate(project)
+
+
+@pytest.mark.parametrize("relative", ["../outside.txt", "src/../../outside.txt", "/etc/passwd"])
+def test_regenerate_rejects_paths_outside_project(project, generator, temp_dir, relative):
+    """Test a tampered manifest can't make regenerate touch files outside the project"""
+    outside = temp_dir / "outside.txt"
+    outside.write_text("keep me")
+    manifest_path = project / MANIFEST_PATH
+    manifest = manifest_path.read_text()
+    manifest_path.write_text(manifest.replace('"README.md":', f'"{relative}":', 1))
+
+    with pytest.raises(ConfigurationError, match="outside the project"):
+        generator.regenerate(project)
+
+    assert outside.read_text() == "keep me"
+
+
+def test_regenerate_refuses_rename(project, sample_config, generator):
+    """Test regeneration can't rename a project"""
+    config = sample_config.model_copy(update={"name": "renamed-api"})
+
+    with pytest.raises(ConfigurationError, match="rename"):
+        generator.regenerate(project, config=config)
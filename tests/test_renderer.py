@@ -2,7 +2,15 @@
 """
 Test template rendering
 """
-from vyte.core.renderer import TemplateRegistry
+import sys
+import zipfile
+
+import pytest
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, TemplateNotFound
+
+from vyte.core.config import ProjectConfig
+from vyte.core.generator import ProjectGenerator
+from vyte.core.renderer import ResourceLoader, TemplateRegistry, TemplateRenderer
 
 
 def test_renderer_initialization(renderer):
@@ -50,3 +58,137 @@ def test_template_registry():
     assert len(templates) > 0
     assert "init" in templates or "init_auth" in templates
     assert "models" in templates
+
+
+def test_validate_context_from_ast(temp_dir):
+    """Test required variables come from every statement, not just {{ name }}"""
+    (temp_dir / "page.j2").write_text(
+        "{% if docker_support %}{{ port }}{% endif %}\n"
+        "{% for item in items %}{{ item }}{% endfor %}\n"
+        "{{ database_url | default('sqlite://') }} {{ year }}\n"
+        "{% if api_key is defined %}{{ api_key }}{% endif %}\n"
+    )
+    renderer = TemplateRenderer(temp_dir, bytecode_cache=False)
+
+    assert renderer.validate_context("page.j2", {}) == ["docker_support", "items", "port"]
+    assert renderer.validate_context("page.j2", {"docker_support": 1, "items": [], "port": 1}) == []
+    assert renderer.validate_context("missing.j2", {}) == []
+
+
+def test_validate_context_parses_once(temp_dir, monkeypatch):
+    """Test repeated validation reuses the parsed template"""
+    (temp_dir / "page.j2").write_text("{{ name }}\n")
+    renderer = TemplateRenderer(temp_dir, bytecode_cache=False)
+    parsed = []
+    original = renderer.env.parse
+    monkeypatch.setattr(renderer.env, "parse", lambda *a: parsed.append(a) or original(*a))
+
+    for _ in range(5):
+        assert renderer.validate_context("page.j2", {}) == ["name"]
+
+    assert len(parsed) == 1
+
+
+def test_validate_all(temp_dir, sample_config):
+    """Test a whole template set is checked in one call"""
+    (temp_dir / "ok.j2").write_text("{{ name }} {{ framework }}\n")
+    (temp_dir / "bad.j2").write_text("{{ name }} {{ api_prefix }}\n")
+    renderer = TemplateRenderer(temp_dir, bytecode_cache=False)
+
+    problems = renderer.validate_all(sample_config, ["ok.j2", "bad.j2", "ok.j2"])
+
+    assert problems == {"bad.j2": ["api_prefix"]}
+
+
+def test_validate_all_render_plan():
+    """Test the shipped FastAPI templates get every variable they need"""
+    config = ProjectConfig(
+        name="plan-api", framework="FastAPI", orm="SQLAlchemy", database="SQLite"
+    )
+    generator = ProjectGenerator(cache=False)
+    templates = generator.get_render_plan(config).templates
+
+    assert generator.renderer.validate_all(config, templates) == {}
+
+
+def test_template_index(temp_dir, monkeypatch):
+    """Test existence checks use the index, which picks up new templates"""
+    (temp_dir / "common").mkdir()
+    (temp_dir / "common" / "a.j2").write_text("a\n")
+    renderer = TemplateRenderer(temp_dir, bytecode_cache=False)
+    monkeypatch.setattr(renderer.env, "_compile", lambda *_: pytest.fail("compiled"))
+
+    assert renderer.template_exists("common/a.j2")
+    assert not renderer.template_exists("common/b.j2")
+
+    (temp_dir / "common" / "b.j2").write_text("b\n")
+    assert renderer.template_exists("common/b.j2")
+    assert renderer.template_index() == {"common/a.j2", "common/b.j2"}
+
+
+def test_validate_templates_exist_without_compiling(monkeypatch):
+    """Test pre-flight validation never compiles templates"""
+    renderer = TemplateRenderer(bytecode_cache=False)
+    monkeypatch.setattr(renderer.env, "_compile", lambda *_: pytest.fail("compiled"))
+
+    assert TemplateRegistry.validate_templates_exist(renderer, "FastAPI", "SQLAlchemy") == (
+        True,
+        [],
+    )
+
+
+def test_warm_up(temp_dir, monkeypatch):
+    """Test warm-up compiles every template once, up front"""
+    for name in ("a", "b", "c"):
+        (temp_dir / f"{name}.j2").write_text(f"{{{{ {name} }}}}\n")
+    renderer = TemplateRenderer(temp_dir, bytecode_cache=False)
+    compiled = []
+    original = renderer.env._compile
+    monkeypatch.setattr(renderer.env, "_compile", lambda *a: compiled.append(a) or original(*a))
+
+    assert renderer.warm_up() == 3
+    renderer.render("b.j2", {"b": 1})
+
+    assert len(compiled) == 3
+
+
+def test_list_templates_merges_loaders(temp_dir):
+    """Test listing covers every loader and info follows loader precedence"""
+    for root, names in (("first", ["common/a.j2", "shared.j2"]), ("second", ["b.j2", "shared.j2"])):
+        for name in names:
+            (temp_dir / root / name).parent.mkdir(parents=True, exist_ok=True)
+            (temp_dir / root / name).write_text(f"{root}\n")
+    renderer = TemplateRenderer(temp_dir / "first", bytecode_cache=False)
+    renderer.env.loader = ChoiceLoader(
+        [FileSystemLoader(str(temp_dir / "first")), FileSystemLoader(str(temp_dir / "second"))]
+    )
+
+    assert renderer.list_templates() == ["b.j2", "common/a.j2", "shared.j2"]
+    assert renderer.list_templates("*.j2") == ["b.j2", "shared.j2"]
+    assert renderer.list_templates("**/a.j2") == ["common/a.j2"]
+    info = renderer.get_template_info("shared.j2")
+    assert info["full_path"] == str(temp_dir / "first" / "shared.j2")
+    assert info["size"] == len("first\n")
+    with pytest.raises(FileNotFoundError):
+        renderer.get_template_info("missing.j2")
+
+
+def test_resource_loader_from_zip(temp_dir, monkeypatch):
+    """Test templates can be listed and rendered from a zipped package"""
+    archive = temp_dir / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr("zipped_templates/__init__.py", "")
+        bundle.writestr("zipped_templates/templates/common/hello.j2", "Hello {{ name }}\n")
+        bundle.writestr("zipped_templates/templates/notes.txt", "notes\n")
+    monkeypatch.syspath_prepend(str(archive))
+    monkeypatch.delitem(sys.modules, "zipped_templates", raising=False)
+
+    loader = ResourceLoader("zipped_templates")
+    env = Environment(loader=loader)
+
+    assert loader.list_templates() == ["common/hello.j2", "notes.txt"]
+    assert env.get_template("common/hello.j2").render(name="zip") == "Hello zip"
+    with pytest.raises(TemplateNotFound):
+        env.get_template("common/missing.j2")
+    with pytest.raises(ValueError, match="No 'nothing' resources"):
+        ResourceLoader("zipped_templates", "nothing")
@@ -0,0 +1,87 @@
+"""
+Test requirement merging and conflict checks
+"""
+import pytest
+from packaging.specifiers import SpecifierSet
+
+from vyte.core.requirements import check_conflicts, merge_requirements, satisfiable
+from vyte.exceptions import DependencyError
+
+
+def test_merge_requirements():
+    """Test requirements on one package are merged, extras included"""
+    merged = merge_requirements(
+        [
+            "sqlalchemy>=2.0.0",
+            "SQLAlchemy[asyncio]>=2.0.0",
+            "bcrypt==4.0.1",
+            "bcrypt>=3.1.0",
+            "httpx>=0.20,<1",
+            "httpx>=0.26.0",
+        ]
+    )
+
+    assert merged == ["sqlalchemy[asyncio]>=2.0.0", "bcrypt==4.0.1", "httpx<1,>=0.26.0"]
+
+
+def test_merge_requirements_keeps_markers_apart():
+    """Test requirements for different environments are not merged"""
+    merged = merge_requirements(["uvloop>=0.17", "uvloop; sys_platform != 'win32'"])
+
+    assert merged == ["uvloop>=0.17", 'uvloop; sys_platform != "win32"']
+
+
+@pytest.mark.parametrize(
+    ("specifier", "expected"),
+    [
+        (">=2,<3", True),
+        (">=2,<2", False),
+        (">=2,<=2", True),
+        (">=2,<=2,!=2", False),
+        ("==1.7.4,>=1.7", True),
+        ("==1.7.4,==1.7.5", False),
+        ("~=1.4,>=1.5", True),
+        ("~=1.4.2,>=1.5", False),
+        ("==1.*,>=2", False),
+    ],
+)
+def test_satisfiable(specifier, expected):
+    """Test specifier intersections are checked for an allowed version"""
+    assert satisfiable(SpecifierSet(specifier)) is expected
+
+
+def test_check_conflicts_direct():
+    """Test contradictory requirements on one package are reported"""
+    (message,) = check_conflicts(["django>=5.0.0", "Django<4.2"])
+
+    assert message.startswith("Conflict: no version of django")
+
+
+def test_check_conflicts_through_extras():
+    """Test requirements implied by an extra are checked against the set"""
+    assert check_conflicts(["passlib[bcrypt]==1.7.4", "bcrypt==4.0.1"]) == []
+
+    (message,) = check_conflicts(["passlib[bcrypt]==1.7.4", "bcrypt<3"])
+    assert "bcrypt>=3.1.0 (from passlib[bcrypt]==1.7.4)" in message
+
+
+def test_check_conflicts_incompatible_releases():
+    """Test known incompatible releases are reported when both can be installed"""
+    (message,) = check_conflicts(["passlib[bcrypt]==1.7.4", "bcrypt>=4.0.0"])
+
+    assert message.startswith("Warning: passlib==1.7.4 allows bcrypt>=4.1.0")
+
+
+def test_check_conflicts_alternatives():
+    """Test mixing ORMs or frameworks is reported once per kind"""
+    messages = check_conflicts(["sqlalchemy", "tortoise-orm", "django", "flask", "fastapi"])
+
+    assert len(messages) == 2
+    assert "SQLAlchemy and TortoiseORM" in messages[0]
+    assert "Mixing Django" in messages[1]
+
+
+def test_invalid_requirement():
+    """Test unparseable requirements raise DependencyError"""
+    with pytest.raises(DependencyError, match="Invalid requirement"):
+        check_conflicts(["fastapi>>1"])
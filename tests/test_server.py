@@ -0,0 +1,212 @@
+"""
+Test the generation server and its thin client
+"""
+import http.client
+import io
+import json
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vyte.core.client import VyteClient, main
+from vyte.core.server import create_server
+from vyte.exceptions import ConfigurationError, GenerationError
+
+CONFIG = {
+    "name": "served-api",
+    "framework": "FastAPI",
+    "orm": "SQLAlchemy",
+    "database": "SQLite",
+}
+
+
+def _start(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def tcp_server(generator, temp_dir):
+    """Generation server on a free TCP port, allowed to write into temp_dir"""
+    server = _start(create_server(port=0, generator=generator, allow_roots=[temp_dir]))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(tcp_server):
+    """Client connected to the TCP server"""
+    return VyteClient(f"http://127.0.0.1:{tcp_server.server_address[1]}")
+
+
+def test_health(client):
+    """Test the health endpoint"""
+    health = client.health()
+
+    assert health["status"] == "ok"
+    assert health["requests"] == 0
+
+
+def test_generate_archive(client):
+    """Test a project comes back as a tarball"""
+    data = client.generate_archive(CONFIG)
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        names = tar.getnames()
+    assert "served-api/src/main.py" in names
+    assert "served-api/alembic.ini" in names
+
+
+def test_concurrent_requests(client, tcp_server):
+    """Test parallel requests share the warm generator safely"""
+    configs = [{**CONFIG, "name": f"served-{i}"} for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        archives = list(executor.map(lambda c: client.generate_archive(c, "zip"), configs))
+
+    for config, data in zip(configs, archives, strict=True):
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert f"{config['name']}/src/main.py" in archive.namelist()
+            readme = archive.read(f"{config['name']}/README.md").decode("utf-8")
+            assert config["name"] in readme
+    assert tcp_server.requests_served == 8
+
+
+def test_generate_to_path(client, temp_dir):
+    """Test the server can write the project to a directory"""
+    project_path = client.generate_to(CONFIG, temp_dir)
+
+    assert project_path == temp_dir / "served-api"
+    assert (project_path / "src" / "main.py").exists()
+
+    with pytest.raises(ConfigurationError, match="already exists"):
+        client.generate_to(CONFIG, temp_dir)
+
+
+def test_invalid_requests(client, temp_dir):
+    """Test bad requests get 4xx errors, and write failures a 5xx error"""
+    with pytest.raises(ConfigurationError, match="Invalid configuration"):
+        client.generate_archive({**CONFIG, "framework": "Rails"})
+
+    with pytest.raises(ConfigurationError, match="Unsupported archive format"):
+        client.generate_archive(CONFIG, "rar")
+
+    with pytest.raises(ConfigurationError, match="'path' must be a string"):
+        client._request("POST", "/generate", {"config": CONFIG, "path": 42})
+
+    for archive_format in (["zip"], {"zip": True}):
+        with pytest.raises(ConfigurationError, match="'format' must be a string"):
+            client._request("POST", "/generate", {"config": CONFIG, "format": archive_format})
+
+    not_a_directory = temp_dir / "file.txt"
+    not_a_directory.write_text("")
+    with pytest.raises(GenerationError, match="Cannot write project"):
+        client.generate_to(CONFIG, not_a_directory)
+
+
+def test_generate_to_path_requires_allowed_root(generator, tcp_server, temp_dir):
+    """Test path writes are opt-in, and limited to the allowed roots"""
+    server = _start(create_server(port=0, generator=generator, warm=False))
+    try:
+        client = VyteClient(f"http://127.0.0.1:{server.server_address[1]}")
+        with pytest.raises(ConfigurationError, match="disabled"):
+            client.generate_to(CONFIG, temp_dir)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    client = VyteClient(f"http://127.0.0.1:{tcp_server.server_address[1]}")
+    with pytest.raises(ConfigurationError, match="must be inside"):
+        client.generate_to(CONFIG, temp_dir.parent)
+    assert not (temp_dir.parent / CONFIG["name"]).exists()
+
+
+def _post(port: int, body: bytes, headers: dict[str, str], path: str = "/generate"):
+    """Send a raw POST, returning the response with its body read"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.request("POST", path, body=body, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+    return response
+
+
+def test_rejects_browser_requests(tcp_server):
+    """Test cross-site form posts and foreign origins can't trigger generation"""
+    port = tcp_server.server_address[1]
+    body = json.dumps({"config": CONFIG}).encode()
+
+    assert _post(port, body, {"Content-Type": "text/plain"}).status == 415
+    origin = {"Content-Type": "application/json", "Origin": "http://evil.example"}
+    assert _post(port, body, origin).status == 403
+    # DNS rebinding: the attacker's host name now resolves to the server
+    rebound = {"Content-Type": "application/json", "Origin": f"http://evil.example:{port}"}
+    assert _post(port, body, rebound).status == 403
+
+    own = {"Content-Type": "application/json", "Origin": f"http://localhost:{port}"}
+    assert _post(port, body, own).status == 200
+
+
+def test_unread_body_closes_connection(tcp_server):
+    """Test errors answered before reading the body don't leave it for the next request"""
+    port = tcp_server.server_address[1]
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        # Looks like a second request if the body were left on the connection
+        body = b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        connection.request("POST", "/generate", body=body, headers={"Content-Type": "text/plain"})
+        response = connection.getresponse()
+        response.read()
+
+        assert response.status == 415
+        assert response.getheader("Connection") == "close"
+        assert response.will_close
+    finally:
+        connection.close()
+
+
+def test_unix_socket(generator, temp_dir):
+    """Test serving over a Unix domain socket"""
+    socket_path = temp_dir / "vyte.sock"
+    server = _start(create_server(socket_path=socket_path, generator=generator, warm=False))
+    try:
+        client = VyteClient(socket_path=socket_path)
+        assert client.health()["status"] == "ok"
+        assert client.generate_archive(CONFIG)[:2] == b"\x1f\x8b"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_main(tcp_server, temp_dir):
+    """Test the vyte-client entry point"""
+    url = f"http://127.0.0.1:{tcp_server.server_address[1]}"
+    archive = temp_dir / "out.zip"
+
+    exit_code = main(
+        [
+            "--url",
+            url,
+            "-n",
+            "cli-api",
+            "-f",
+            "Flask-Restx",
+            "-o",
+            "Peewee",
+            "-d",
+            "SQLite",
+            "--format",
+            "zip",
+            "--archive",
+            str(archive),
+        ]
+    )
+
+    assert exit_code == 0
+    with zipfile.ZipFile(archive) as data:
+        assert "cli-api/app.py" in data.namelist()
@@ -0,0 +1,100 @@
+"""
+Test lazy imports keep CLI startup light
+"""
+import subprocess
+import sys
+
+import click
+import pytest
+
+import vyte
+from vyte.cli.commands import cli
+from vyte.cli.lazy import LazyGroup
+
+
+def _imported_after(code: str, modules: list[str]) -> list[str]:
+    """Run code in a fresh interpreter and report which modules it imported"""
+    probe = f"{code}\nimport sys\nprint('LOADED:' + ','.join(m for m in {modules!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    line = next(line for line in result.stdout.splitlines() if line.startswith("LOADED:"))
+    return [m for m in line.removeprefix("LOADED:").split(",") if m]
+
+
+HEAVY = ["jinja2", "pydantic", "InquirerPy", "rich.progress", "vyte.core.generator"]
+
+
+def test_import_vyte_is_light():
+    """Test importing the package doesn't import the core"""
+    assert _imported_after("import vyte", HEAVY + ["click", "rich"]) == []
+
+
+def test_version_is_light():
+    """Test `vyte --version` imports no heavy dependency"""
+    code = (
+        "from vyte.cli.commands import cli\n"
+        "try:\n"
+        "    cli(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert _imported_after(code, HEAVY + ["vyte.core.output", "tarfile"]) == []
+
+
+def test_help_lists_lazy_commands_without_loading_server():
+    """Test `vyte --help` lists lazy commands without importing their backends"""
+    code = (
+        "from vyte.cli.commands import cli\n"
+        "try:\n"
+        "    cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert _imported_after(code, HEAVY + ["vyte.core.server"]) == []
+
+
+def test_list_skips_interactive_and_generator():
+    """Test `vyte list` doesn't import InquirerPy or the generator"""
+    code = (
+        "from vyte.cli.commands import cli\n"
+        "try:\n"
+        "    cli(['list'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert _imported_after(code, ["InquirerPy", "jinja2", "vyte.core.generator"]) == []
+
+
+def test_lazy_package_exports():
+    """Test public names still resolve from the package"""
+    assert vyte.ProjectGenerator.__name__ == "ProjectGenerator"
+    assert "ProjectConfig" in dir(vyte)
+
+    with pytest.raises(AttributeError):
+        vyte.NotAThing  # noqa: B018
+
+
+def test_lazy_group(runner):
+    """Test lazily registered commands are listed, loaded and validated"""
+
+    @click.group(
+        cls=LazyGroup,
+        lazy_commands={"serve": "vyte.cli.serve:serve", "broken": "vyte.cli.lazy:LazyGroup"},
+    )
+    def group():
+        pass
+
+    assert group.list_commands(None) == ["broken", "serve"]
+
+    result = runner.invoke(group, ["serve", "--help"])
+    assert result.exit_code == 0
+    assert "Unix domain socket" in result.output
+
+    with pytest.raises(TypeError):
+        group.get_command(None, "broken")
+
+
+def test_cli_lists_every_command():
+    """Test the CLI exposes eager and lazy commands"""
+    assert {"create", "list", "serve", "cache"} <= set(cli.list_commands(None))
@@ -2,8 +2,13 @@
 """
 Test strategy pattern implementations
 """
+import ast
+import os
+import subprocess
 
+from vyte.core.alembic_setup import AlembicConfigurator
 from vyte.core.config import ProjectConfig
+from vyte.core.output import MemoryOutput
 from vyte.core.renderer import TemplateRenderer
 from vyte.strategies.fastapi import FastAPIStrategy
 from vyte.strategies.flask_restx import FlaskRestxStrategy
@@ -39,3 +44,67 @@ def test_fastapi_strategy():
 
     assert strategy.config == config
     assert strategy.renderer == renderer
+
+
+def test_fastapi_alembic_is_rendered_in_process(generator, temp_dir, monkeypatch):
+    """Test the Alembic tree is rendered from templates, without subprocess or chdir"""
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("Alembic scaffolding must not spawn processes or change directory")
+
+    monkeypatch.setattr(subprocess, "run", forbidden)
+    monkeypatch.setattr(os, "chdir", forbidden)
+    config = ProjectConfig(
+        name="migrated-api",
+        framework="FastAPI",
+        orm="SQLAlchemy",
+        database="PostgreSQL",
+        git_init=False,
+    )
+
+    output = MemoryOutput(temp_dir / "migrated-api")
+    generator.generate(config, output=output)
+
+    assert "alembic/versions/.gitkeep" in output.files
+    assert "script_location = alembic" in output.read_text("alembic.ini")
+    assert "${upgrades" in output.read_text("alembic/script.py.mako")
+
+    env_py = output.read_text("alembic/env.py")
+    # env.py runs inside the generated project: no vyte (or relative) imports
+    imports = [node for node in ast.walk(ast.parse(env_py)) if isinstance(node, ast.ImportFrom)]
+    assert not [node.module for node in imports if node.level or "vyte" in (node.module or "")]
+    assert "from src.models import models" in env_py
+    assert "sqlite:///./migrated-api.db" in env_py
+
+
+def test_tortoise_has_no_alembic(generator, temp_dir):
+    """Test only SQLAlchemy projects get Alembic"""
+    config = ProjectConfig(
+        name="tortoise-api",
+        framework="FastAPI",
+        orm="TortoiseORM",
+        database="PostgreSQL",
+        git_init=False,
+    )
+
+    output = MemoryOutput(temp_dir / "tortoise-api")
+    generator.generate(config, output=output)
+
+    assert not any(path.startswith("alembic") for path in output.files)
+
+
+def test_setup_alembic_on_existing_project(temp_dir):
+    """Test AlembicConfigurator adds Alembic to an existing project"""
+    output = MemoryOutput(temp_dir / "legacy")
+
+    assert AlembicConfigurator.setup_alembic(
+        temp_dir / "legacy", "legacy", module_name="app", output=output
+    )
+
+    assert "from app.database import Base" in output.read_text("alembic/env.py")
+    assert set(output.files) == {
+        "alembic.ini",
+        "alembic/env.py",
+        "alembic/script.py.mako",
+        "alembic/versions/.gitkeep",
+    }
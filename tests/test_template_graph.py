@@ -0,0 +1,104 @@
+"""
+Test the template dependency graph
+"""
+import pytest
+from jinja2 import TemplateNotFound
+
+from vyte.core.renderer import TemplateRegistry, TemplateRenderer
+
+
+@pytest.fixture
+def templates(tmp_path):
+    """Template tree with extends/include/import chains"""
+    root = tmp_path / "templates"
+    (root / "partials").mkdir(parents=True)
+    (root / "base.j2").write_text("# {{ name }}\n{% block body %}{% endblock %}\n")
+    (root / "partials" / "docker.j2").write_text("{% if docker_support %}Docker{% endif %}\n")
+    (root / "partials" / "macros.j2").write_text(
+        "{% macro title(text) %}{{ text }}{% endmacro %}\n"
+    )
+    (root / "page.j2").write_text(
+        '{% extends "base.j2" %}{% import "partials/macros.j2" as m %}'
+        '{% block body %}{{ m.title(orm) }}{% include "partials/docker.j2" %}{% endblock %}\n'
+    )
+    (root / "plain.j2").write_text("{{ database }}\n")
+    return root
+
+
+def test_graph_follows_chains(templates):
+    """Test dependencies and variables cover extends, include and import"""
+    graph = TemplateRenderer(templates, bytecode_cache=False).graph
+
+    assert graph.dependencies("page.j2") == {
+        "base.j2",
+        "partials/docker.j2",
+        "partials/macros.j2",
+    }
+    assert graph.variables("page.j2") >= {"name", "orm", "docker_support"}
+    assert graph.dependencies("plain.j2") == set()
+    assert graph.variables("plain.j2") == {"database"}
+
+
+def test_fingerprint_tracks_included_templates(templates):
+    """Test editing an included template changes only the templates loading it"""
+    renderer = TemplateRenderer(templates, bytecode_cache=False)
+    page, plain = renderer.source_hash("page.j2"), renderer.source_hash("plain.j2")
+
+    (templates / "partials" / "docker.j2").write_text("{{ docker_support }}\n", encoding="utf-8")
+
+    assert renderer.source_hash("page.j2") != page
+    assert renderer.source_hash("plain.j2") == plain
+
+
+def test_graph_parses_each_template_once(templates, monkeypatch):
+    """Test repeated queries reuse the parsed nodes"""
+    renderer = TemplateRenderer(templates, bytecode_cache=False)
+    parsed = []
+    original = renderer.env.parse
+    monkeypatch.setattr(renderer.env, "parse", lambda *a: parsed.append(a[1]) or original(*a))
+
+    for _ in range(3):
+        renderer.graph.fingerprint("page.j2")
+        renderer.graph.variables("page.j2")
+
+    assert sorted(parsed) == ["base.j2", "page.j2", "partials/docker.j2", "partials/macros.j2"]
+
+
+def test_graph_dynamic_include(templates):
+    """Test a template included by a variable name depends on every template"""
+    (templates / "dynamic.j2").write_text("{% include partial %}\n")
+    graph = TemplateRenderer(templates, bytecode_cache=False).graph
+
+    assert "partials/docker.j2" in graph.dependencies("dynamic.j2")
+    assert "docker_support" in graph.variables("dynamic.j2")
+
+
+def test_graph_reports_missing_templates(templates):
+    """Test broken chains are reported without compiling templates"""
+    (templates / "broken.j2").write_text('{% include "partials/gone.j2" %}\n')
+    graph = TemplateRenderer(templates, bytecode_cache=False).graph
+
+    assert graph.missing("broken.j2") == ["partials/gone.j2"]
+    assert graph.missing("page.j2") == []
+    assert graph.missing("nope.j2") == ["nope.j2"]
+    with pytest.raises(TemplateNotFound):
+        graph.fingerprint("nope.j2")
+
+
+def test_registry_templates_are_complete(renderer):
+    """Test every shipped template chain resolves"""
+    for framework, orms in TemplateRegistry.TEMPLATES.items():
+        for orm in orms:
+            assert TemplateRegistry.validate_templates_exist(renderer, framework, orm) == (True, [])
+
+
+def test_graph_tracks_globals(templates):
+    """Test names defined as environment globals still count as read"""
+    (templates / "stamp.j2").write_text("{{ now().isoformat() }} {{ year }}\n")
+    (templates / "code.j2").write_text("created = datetime.now()\n")
+    (templates / "wrapper.j2").write_text('{% include "stamp.j2" %}\n')
+    graph = TemplateRenderer(templates, bytecode_cache=False).graph
+
+    assert {"now", "year"} <= graph.variables("wrapper.j2")
+    assert graph.reads("wrapper.j2", "now")
+    assert not graph.reads("code.j2", "now")
@@ -0,0 +1,103 @@
+"""
+Test the parallel render-and-write pipeline
+"""
+import threading
+from pathlib import Path
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from vyte.core.events import EventBus
+from vyte.core.writer import ParallelFileWriter
+
+CONTEXT = {"name": "demo-api", "year": 2025}
+
+
+def test_parallel_matches_serial(renderer, tmp_path):
+    """Test threaded output is identical to serial output"""
+    items = [
+        ("common/README.md.j2", Path("README.md")),
+        ("common/LICENSE.j2", Path("LICENSE")),
+        ("common/.gitignore.j2", Path("nested/deep/.gitignore")),
+    ]
+    context = {**CONTEXT, "framework": "FastAPI", "orm": "SQLAlchemy", "database": "SQLite"}
+
+    serial = ParallelFileWriter(renderer, max_workers=1).write(
+        [(t, tmp_path / "serial" / p) for t, p in items], context
+    )
+    parallel = ParallelFileWriter(renderer, max_workers=4).write(
+        [(t, tmp_path / "parallel" / p) for t, p in items], context
+    )
+
+    assert [p.relative_to(tmp_path / "parallel") for p in parallel] == [p for _, p in items]
+    for s_path, p_path in zip(serial, parallel, strict=True):
+        assert s_path.read_bytes() == p_path.read_bytes()
+
+
+def test_duplicate_destinations_last_wins(renderer, tmp_path):
+    """Test a path listed twice is written once, from the last template"""
+    target = tmp_path / "out.txt"
+
+    written = ParallelFileWriter(renderer, max_workers=4).write(
+        [("common/README.md.j2", target), ("common/LICENSE.j2", target)], CONTEXT
+    )
+
+    assert written == [target]
+    assert "Copyright" in target.read_text(encoding="utf-8")
+
+
+def test_first_error_in_order_is_raised(renderer, tmp_path):
+    """Test failures surface deterministically and before any write"""
+    items = [
+        ("common/LICENSE.j2", tmp_path / "LICENSE"),
+        ("missing/first.j2", tmp_path / "a.txt"),
+        ("missing/second.j2", tmp_path / "b.txt"),
+    ]
+
+    with pytest.raises(TemplateNotFound, match="missing/first.j2"):
+        ParallelFileWriter(renderer, max_workers=4).write(items, CONTEXT)
+
+    assert not (tmp_path / "LICENSE").exists()
+
+
+def test_directories_created_once(renderer, tmp_path, monkeypatch):
+    """Test each parent directory is created a single time"""
+    created = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self, *args, **kwargs):
+        created.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+
+    ParallelFileWriter(renderer, max_workers=4).write(
+        [("common/LICENSE.j2", tmp_path / "pkg" / f"file{i}.txt") for i in range(10)], CONTEXT
+    )
+
+    assert created.count(tmp_path / "pkg") == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_progress_is_reported_while_rendering(renderer, tmp_path, monkeypatch, max_workers):
+    """Test file_rendered events arrive as files finish, not after the whole batch"""
+    first_reported = threading.Event()
+    seen_before_last = []
+    render = renderer.render
+
+    def slow_last(template, context, **kwargs):
+        if template == "common/LICENSE.j2":
+            seen_before_last.append(first_reported.wait(timeout=5))
+        return render(template, context, **kwargs)
+
+    monkeypatch.setattr(renderer, "render", slow_last)
+    events = EventBus(lambda e: first_reported.set() if e.kind == "file_rendered" else None)
+    items = [
+        ("common/README.md.j2", tmp_path / "README.md"),
+        ("common/LICENSE.j2", tmp_path / "LICENSE"),
+    ]
+    context = {**CONTEXT, "framework": "FastAPI", "orm": "SQLAlchemy", "database": "SQLite"}
+
+    ParallelFileWriter(renderer, max_workers=max_workers, events=events).write(items, context)
+
+    assert seen_before_last == [True]
@@ -5,20 +5,41 @@ Vyte - Rapid Development Tool
 Professional API project generator for Python
 """
 
+import importlib
+
 from .__version__ import __version__
 
 __author__ = "Pablo Domínguez"
 __license__ = "MIT"
 
-from .core.config import ProjectConfig
-from .core.dependencies import DependencyManager
-from .core.generator import ProjectGenerator, quick_generate
-from .core.renderer import TemplateRenderer
+# Public API, imported on first access to keep `import vyte` (and the CLI
+# entry point, which lives inside this package) fast
+_EXPORTS = {
+    "ProjectConfig": ".core.config",
+    "ProjectGenerator": ".core.generator",
+    "AsyncProjectGenerator": ".core.async_generator",
+    "quick_generate": ".core.generator",
+    "DependencyManager": ".core.dependencies",
+    "TemplateRenderer": ".core.renderer",
+}
 
 __all__ = [
     "ProjectConfig",
     "ProjectGenerator",
+    "AsyncProjectGenerator",
     "quick_generate",
     "DependencyManager",
     "TemplateRenderer",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -1,27 +1,35 @@
 # vyte/cli/__init__.py
 """
 CLI module for vyte
+
+Exports are loaded on first access so that importing `vyte.cli.commands`
+(the `vyte` entry point) doesn't pull in Rich widgets or InquirerPy.
 """
-from .commands import cli
-from .display import (
-    show_error,
-    show_generation_progress,
-    show_next_steps,
-    show_success,
-    show_summary,
-    show_warning,
-    show_welcome,
-)
-from .interactive import interactive_setup
+import importlib
+
+_EXPORTS = {
+    "cli": ".commands",
+    "interactive_setup": ".interactive",
+    "show_welcome": ".display",
+    "show_summary": ".display",
+    "show_next_steps": ".display",
+    "show_generation_progress": ".display",
+    "show_batch_report": ".display",
+    "show_error": ".display",
+    "show_success": ".display",
+    "show_warning": ".display",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "cli",
-    "interactive_setup",
-    "show_welcome",
-    "show_summary",
-    "show_next_steps",
-    "show_generation_progress",
-    "show_error",
-    "show_success",
-    "show_warning",
-]
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,67 @@
+"""
+`vyte cache` commands
+"""
+
+import click
+from rich.console import Console
+
+console = Console()
+
+
+@click.group()
+def cache():
+    """
+    Manage vyte's on-disk caches
+
+    Examples:
+        vyte cache stats
+        vyte cache clear
+    """
+
+
+@cache.command("stats")
+def cache_stats():
+    """Show cache location, entries and size"""
+    from rich.table import Table
+
+    from ..core.cache import GenerationCache, TemplateBytecodeCache
+
+    for title, store in (
+        ("🗃️  Template Bytecode Cache", TemplateBytecodeCache()),
+        ("♻️  Generation Cache", GenerationCache()),
+    ):
+        stats = store.stats()
+
+        table = Table(title=title, show_header=False)
+        table.add_column("Property", style="cyan", width=20)
+        table.add_column("Value", style="green")
+
+        table.add_row("Directory", str(stats["directory"]))
+        table.add_row("Entries", str(stats["entries"]))
+        table.add_row("Size", _format_size(stats["size"]))
+        table.add_row("Max Size", _format_size(stats["max_size"]))
+
+        console.print("\n")
+        console.print(table)
+    console.print("\n")
+
+
+@cache.command("clear")
+def cache_clear():
+    """Remove all cached entries"""
+    from ..core.cache import GenerationCache, TemplateBytecodeCache
+
+    templates = TemplateBytecodeCache().clear()
+    projects = GenerationCache().clear()
+    console.print(
+        f"\n[green]✅ Removed {templates} cached templates and {projects} cached projects[/green]\n"
+    )
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count for display"""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -1,23 +1,21 @@
 """
 CLI commands for vyte
+
+Heavy dependencies (the generator, Jinja2, pydantic models, InquirerPy and
+Rich widgets) are imported inside the commands that need them, and rarely
+used commands live in their own modules behind a LazyGroup, so startup only
+pays for what the invoked command uses.
 """
 
+import contextlib
 import sys
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from ..__version__ import __version__
-from ..core.config import (
-    COMPATIBILITY_MATRIX,
-    ProjectConfig,
-    get_compatible_orms,
-    get_framework_info,
-)
-from ..core.dependencies import DependencyManager
-from ..core.generator import ProjectGenerator
+from ..core.formats import ARCHIVE_FORMATS
 from ..exceptions import (
     ConfigurationError,
     FileSystemError,
@@ -26,21 +24,20 @@ from ..exceptions import (
     ValidationError,
     VyteError,
 )
-from .display import (
-    show_error,
-    show_generation_progress,
-    show_next_steps,
-    show_success,
-    show_summary,
-    show_warning,
-    show_welcome,
-)
-from .interactive import interactive_setup
+from .lazy import LazyGroup
 
 console = Console()
 
+# Subcommands imported on first use
+LAZY_COMMANDS = {
+    "serve": "vyte.cli.serve:serve",
+    "cache": "vyte.cli.cache:cache",
+    "regenerate": "vyte.cli.regenerate:regenerate",
+    "lock": "vyte.cli.lock:lock",
+}
+
 
-@click.group(name="vyte")
+@click.group(name="vyte", cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="Vyte")
 def cli():
     """
@@ -75,10 +72,74 @@ def cli():
 @click.option("--docker/--no-docker", default=True, help="Include Docker support")
 @click.option("--tests/--no-tests", default=True, help="Include testing suite")
 @click.option("--git/--no-git", default=True, help="Initialize Git repository")
+@click.option(
+    "--git-cli",
+    is_flag=True,
+    help="Initialize the repository with the git command instead of the built-in writer",
+)
 @click.option(
     "--interactive/--no-interactive", "-i", default=True, help="Interactive mode (recommended)"
 )
-def create(name, framework, orm, database, auth, docker, tests, git, interactive):
+@click.option(
+    "--from-manifest",
+    "manifest",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Generate every project listed in a YAML/JSON manifest",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for --from-manifest (default: CPU count)",
+)
+@click.option(
+    "--archive",
+    metavar="PATH",
+    help="Stream the project into a tar/zip archive instead of a directory ('-' for stdout)",
+)
+@click.option(
+    "--archive-format",
+    type=click.Choice(list(ARCHIVE_FORMATS)),
+    default=None,
+    help="Archive format (default: from the --archive file name, else tar.gz)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Render every file instead of replaying an identical earlier generation",
+)
+@click.option("--profile", is_flag=True, help="Show where generation time went")
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the generation profile as JSON (implies --profile)",
+)
+@click.option(
+    "--lock-index",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Also write requirements.lock, pinned with hashes against this local package index",
+)
+def create(
+    name,
+    framework,
+    orm,
+    database,
+    auth,
+    docker,
+    tests,
+    git,
+    git_cli,
+    interactive,
+    manifest,
+    workers,
+    archive,
+    archive_format,
+    no_cache,
+    profile,
+    profile_output,
+    lock_index,
+):
     """
     Create a new API project
 
@@ -92,12 +153,63 @@ def create(name, framework, orm, database, auth, docker, tests, git, interactive
 
         # No authentication
         vyte create -n my-api -f Flask-Restx -o SQLAlchemy -d SQLite --no-auth
+
+        # Batch creation from a manifest
+        vyte create --from-manifest services.yaml --workers 8
+
+        # Stream a tarball to stdout
+        vyte create -n my-api -f FastAPI -o SQLAlchemy -d SQLite --no-interactive --archive - > my-api.tar.gz
+
+        # Time every phase, template and write
+        vyte create -n my-api -f FastAPI -o SQLAlchemy -d SQLite --no-interactive --profile-output profile.json
+
+        # Pin every dependency, offline, from a directory of wheels
+        vyte create -n my-api -f FastAPI -o SQLAlchemy -d SQLite --no-interactive --lock-index wheels/
     """
+    from ..core.config import ProjectConfig
+    from ..core.events import EventBus
+    from ..core.generator import ProjectGenerator
+    from .display import (
+        show_error,
+        show_generation_progress,
+        show_next_steps,
+        show_success,
+        show_summary,
+        show_warning,
+        show_welcome,
+    )
+
+    if archive is not None and manifest is not None:
+        raise click.UsageError("--archive cannot be combined with --from-manifest")
+    if lock_index is not None and (archive is not None or manifest is not None):
+        raise click.UsageError("--lock-index cannot be combined with --archive or --from-manifest")
+
+    profiler = None
+    if profile or profile_output is not None:
+        if manifest is not None:
+            raise click.UsageError("--profile cannot be combined with --from-manifest")
+        from ..core.profiler import GenerationProfiler
+
+        profiler = GenerationProfiler()
+    events = EventBus(profiler) if profiler is not None else None
+
+    archive_target = archive
+    if archive == "-":
+        # The archive owns stdout: send every message to stderr
+        archive_target = sys.stdout.buffer
+        click.get_current_context().with_resource(contextlib.redirect_stdout(sys.stderr))
+
     show_welcome()
 
+    if manifest is not None:
+        _create_from_manifest(manifest, workers, git_cli, cache=not no_cache)
+        return
+
     try:
         # Interactive mode or use provided options
         if interactive or not all([name, framework, orm, database]):
+            from .interactive import interactive_setup
+
             config = interactive_setup()
         else:
             # Validate configuration
@@ -122,20 +234,51 @@ def create(name, framework, orm, database, auth, docker, tests, git, interactive
                 return
 
         # Initialize generator
-        generator = ProjectGenerator()
+        generator = ProjectGenerator(cache=not no_cache)
+
+        output = None
+        if archive is not None:
+            from ..core.output import ArchiveOutput
+
+            output = ArchiveOutput(config.get_output_path(), archive_target, archive_format)
 
         # Validate before generation
-        is_valid, errors = generator.validate_before_generate(config)
+        is_valid, errors = generator.validate_before_generate(config, output=output)
         if not is_valid:
             show_error("Validation failed", errors)
             sys.exit(1)
 
+        if output is not None:
+            show_generation_progress(generator, config, output=output, events=events)
+
+            if config.git_init:
+                show_warning("Git initialization skipped for archive output")
+            destination = "stdout" if archive == "-" else archive
+            show_success(f"Project archived to: {destination}")
+            _report_profile(profiler, profile_output)
+            return
+
+        # Resolve the lockfile first: an index that can't satisfy the
+        # requirements fails before anything is written
+        lockfile = None
+        if lock_index is not None:
+            from ..core.dependencies import DependencyManager
+
+            lockfile = DependencyManager.render_lockfile(config, lock_index)
+
         # Generate project with progress
-        project_path = show_generation_progress(generator, config)
+        project_path = show_generation_progress(generator, config, events=events)
+
+        if lockfile is not None:
+            from ..core.lockfile import LOCKFILE_NAME
+
+            (project_path / LOCKFILE_NAME).write_text(lockfile, encoding="utf-8")
 
         # Initialize git if requested
         if config.git_init:
-            _init_git(project_path)
+            _init_git(generator, project_path, git_cli, events)
+
+        _report_profile(profiler, profile_output)
 
         # Show success and next steps
         show_success(f"Project created successfully at: {project_path}")
@@ -186,6 +329,9 @@ def info(framework):
         vyte info FastAPI
         vyte info Flask-Restx
     """
+    from rich.table import Table
+
+    from ..core.config import get_framework_info
 
     framework_info = get_framework_info(framework)
 
@@ -224,6 +370,11 @@ def deps(framework, orm, database, auth):
         vyte deps FastAPI
         vyte deps Flask-Restx --orm SQLAlchemy --database PostgreSQL
     """
+    from rich.table import Table
+
+    from ..core.config import ProjectConfig, get_compatible_orms
+    from ..core.dependencies import CATEGORIES, CATEGORY_LABELS, DependencyManager
+
     # Use defaults if not specified
     if not orm:
         orm = get_compatible_orms(framework)[0]
@@ -243,8 +394,8 @@ def deps(framework, orm, database, auth):
     )
 
     # Get dependencies
-    dependencies = DependencyManager.get_all_dependencies(config)
-    deps_info = DependencyManager.get_dependency_info(config)
+    resolved = DependencyManager.resolve(config)
+    counts = resolved.counts()
 
     # Display
     console.print(
@@ -256,18 +407,15 @@ def deps(framework, orm, database, auth):
     stats_table.add_column("Category", style="cyan")
     stats_table.add_column("Count", style="green", justify="right")
 
-    stats_table.add_row("Total Dependencies", str(deps_info["total"]))
-    stats_table.add_row("Base", str(deps_info["base"]))
-    stats_table.add_row("Framework", str(deps_info["framework"]))
-    stats_table.add_row("ORM", str(deps_info["orm"]))
-    stats_table.add_row("Testing", str(deps_info["testing"]))
-    if auth:
-        stats_table.add_row("Authentication", str(deps_info["auth"]))
+    stats_table.add_row("Total Dependencies", str(counts["total"]))
+    for category in CATEGORIES:
+        if counts[category]:
+            stats_table.add_row(CATEGORY_LABELS[category], str(counts[category]))
 
     console.print(stats_table)
     console.print("\n[bold]Package List:[/bold]\n")
 
-    for dep in dependencies:
+    for dep in resolved.requirements:
         console.print(f"  • {dep}")
 
     console.print("\n")
@@ -278,6 +426,10 @@ def list_frameworks():
     """
     List all available frameworks and ORMs
     """
+    from rich.table import Table
+
+    from ..core.config import COMPATIBILITY_MATRIX
+
     console.print("\n[bold cyan]📚 Available Frameworks and ORMs[/bold cyan]\n")
 
     table = Table(show_header=True, header_style="bold magenta")
@@ -303,6 +455,8 @@ def validate(project_path):
     Examples:
         vyte validate ./my-api
     """
+    from rich.table import Table
+
     project_path = Path(project_path)
 
     console.print(f"\n[cyan]🔍 Validating project: {project_path.name}[/cyan]\n")
@@ -354,30 +508,59 @@ def docs():
     webbrowser.open(url)
 
 
-def _init_git(project_path: Path):
-    """Initialize git repository"""
-    import subprocess
+def _create_from_manifest(
+    manifest: Path, workers: int | None, git_cli: bool = False, cache: bool = True
+):
+    """Generate every project in a manifest and report per-project results"""
+    from ..core.batch import GenerationResult, load_manifest
+    from ..core.generator import ProjectGenerator
+    from .display import show_batch_report, show_error
 
     try:
-        # Initialize git
-        subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)
+        configs = load_manifest(manifest)
+    except (ConfigurationError, OSError) as e:
+        show_error("Invalid Manifest", [str(e)])
+        sys.exit(1)
 
-        # Initial commit
-        subprocess.run(["git", "add", "."], cwd=project_path, check=True, capture_output=True)
+    console.print(f"\n[cyan]🏭 Generating {len(configs)} projects from {manifest}[/cyan]\n")
 
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit from vyte"],
-            cwd=project_path,
-            check=True,
-            capture_output=True,
-        )
+    generator = ProjectGenerator(cache=cache)
+    report = generator.generate_many(configs, workers=workers)
 
-        console.print("[green]✅ Git repository initialized[/green]")
+    # Initialize git for the projects that asked for it
+    configs_by_name = {
+        config.name: config for config in configs if not isinstance(config, GenerationResult)
+    }
+    for result in report.succeeded:
+        if configs_by_name[result.name].git_init:
+            _init_git(generator, result.project_path, git_cli)
+
+    show_batch_report(report)
+
+    if not report.ok:
+        sys.exit(1)
+
+
+def _report_profile(profiler, profile_output: Path | None):
+    """Show the generation profile and write it as JSON if requested"""
+    if profiler is None:
+        return
 
-    except subprocess.CalledProcessError:
-        console.print("[yellow]⚠️  Git initialization failed (git may not be installed)[/yellow]")
-    except FileNotFoundError:
-        console.print("[yellow]⚠️  Git not found. Please install git to use this feature[/yellow]")
+    from .display import show_profile
+
+    show_profile(profiler)
+    if profile_output is not None:
+        profiler.to_json(profile_output)
+        console.print(f"[dim]Profile written to {profile_output}[/dim]\n")
+
+
+def _init_git(generator, project_path: Path, use_cli: bool = False, events=None):
+    """Initialize git repository"""
+    try:
+        generator.init_git(project_path, use_cli=use_cli, events=events)
+        console.print("[green]✅ Git repository initialized[/green]")
+    except GitError as e:
+        console.print(f"[yellow]⚠️  Git initialization failed: {e}[/yellow]")
 
 
 if __name__ == "__main__":
@@ -2,20 +2,33 @@
 """
 Display utilities using Rich
 """
-import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from ..core.config import ProjectConfig
-from ..core.generator import ProjectGenerator
+if TYPE_CHECKING:
+    from ..core.config import ProjectConfig
+    from ..core.events import EventBus
+    from ..core.generator import ProjectGenerator
+    from ..core.output import OutputBackend
+    from ..core.profiler import GenerationProfiler
 
 console = Console()
 
+# Progress bar label of each generation phase
+PHASE_DESCRIPTIONS = {
+    "structure": "📁 Creating directories...",
+    "templates": "📝 Generating files...",
+    "framework_files": "⚙️  Configuring project...",
+    "dependencies": "📦 Setting up dependencies...",
+    # Replaces every other phase when the project comes from the generation cache
+    "cache": "♻️  Restoring cached project...",
+}
+
 
 def show_welcome():
     """Show welcome banner"""
@@ -33,7 +46,7 @@ def show_welcome():
     console.print(Panel.fit(banner, border_style="cyan", padding=(0, 2)))
 
 
-def show_summary(config: ProjectConfig):
+def show_summary(config: "ProjectConfig"):
     """Show project configuration summary"""
     table = Table(title="📋 Project Configuration", show_header=False, border_style="cyan")
     table.add_column("Setting", style="cyan", width=20)
@@ -54,13 +67,32 @@ def show_summary(config: ProjectConfig):
     console.print("\n")
 
 
-def show_generation_progress(generator: ProjectGenerator, config: ProjectConfig) -> Path:
+def show_generation_progress(
+    generator: "ProjectGenerator",
+    config: "ProjectConfig",
+    output: "OutputBackend | None" = None,
+    events: "EventBus | None" = None,
+) -> Path:
     """
     Show generation progress with spinner
 
+    Args:
+        generator: Project generator
+        config: Project configuration
+        output: Backend receiving the files (default: the project directory)
+        events: Bus with extra listeners (e.g. a profiler) to report to as well
+
     Returns:
         Path to generated project
     """
+    from ..core.events import EventBus
+
+    if events is None:
+        events = EventBus()
+
+    # One step per rendered file, plus one per other phase (but not "cache")
+    total = len(generator.get_render_plan(config)) + len(PHASE_DESCRIPTIONS) - 2
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -68,33 +100,139 @@ def show_generation_progress(generator: ProjectGenerator, config: ProjectConfig)
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         console=console,
     ) as progress:
-        task = progress.add_task("🔨 Generating project...", total=100)
+        task = progress.add_task("🔨 Generating project...", total=total)
 
-        # Start generation
-        progress.update(task, advance=10, description="📁 Creating directories...")
-        time.sleep(0.3)
+        def on_event(event):
+            if event.kind == "phase_started":
+                progress.update(task, description=PHASE_DESCRIPTIONS.get(event.phase, event.phase))
+            # The templates phase advances once per rendered file instead
+            elif event.kind in ("file_rendered", "phase_finished") and event.phase != "templates":
+                progress.advance(task)
 
-        progress.update(task, advance=20, description="📝 Generating files...")
-        time.sleep(0.3)
+        events.subscribe(on_event)
+        try:
+            project_path = generator.generate(config, output=output, events=events)
+        finally:
+            events.unsubscribe(on_event)
 
-        progress.update(task, advance=20, description="⚙️  Configuring project...")
+        progress.update(task, description="✅ Complete!", completed=total)
 
-        # Actually generate
-        project_path = generator.generate(config)
+    return project_path
 
-        progress.update(task, advance=30, description="📦 Setting up dependencies...")
-        time.sleep(0.2)
 
-        progress.update(task, advance=20, description="✨ Finalizing...")
-        time.sleep(0.2)
+def show_profile(profiler: "GenerationProfiler", limit: int = 10):
+    """
+    Show where generation time went
 
-        progress.update(task, advance=0, description="✅ Complete!", completed=100)
+    Args:
+        profiler: Profiler that listened to the generation
+        limit: Number of templates to list, slowest first
+    """
+    table = Table(title="⏱️  Generation Profile", show_header=True, header_style="bold magenta")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Time", justify="right")
+    table.add_column("Details")
+
+    for phase, duration in profiler.phases.items():
+        table.add_row(f"phase: {phase}", f"{duration * 1000:.1f} ms", "")
+    for step, duration in profiler.steps.items():
+        table.add_row(f"step: {step}", f"{duration * 1000:.1f} ms", "")
+    table.add_row(
+        "writes",
+        f"{profiler.write_time * 1000:.1f} ms",
+        f"{profiler.files_written} files, {profiler.bytes_written:,} bytes, "
+        f"{profiler.directories} directories",
+    )
+    table.add_row("[bold]total[/bold]", f"[bold]{profiler.total * 1000:.1f} ms[/bold]", "")
 
-    return project_path
+    templates = Table(
+        title=f"📝 Slowest Templates (top {limit})", show_header=True, header_style="bold magenta"
+    )
+    templates.add_column("Template", style="cyan")
+    templates.add_column("Load", justify="right")
+    templates.add_column("Render", justify="right")
+    templates.add_column("Bytes", justify="right")
+
+    for name, timing in profiler.slowest_templates(limit):
+        templates.add_row(
+            name,
+            f"{timing.load * 1000:.2f} ms",
+            f"{timing.render * 1000:.2f} ms",
+            f"{timing.size:,}",
+        )
+
+    console.print("\n")
+    console.print(table)
+    if profiler.templates:
+        console.print(templates)
+    elif "cache" in profiler.phases:
+        console.print("[dim]Served from the generation cache: no templates rendered[/dim]")
+    console.print("\n")
 
 
-def show_next_steps(project_path: Path, config: ProjectConfig):
+def show_batch_report(report):
+    """Show per-project results of a batch generation"""
+    table = Table(title="🏭 Batch Generation", show_header=True, header_style="bold magenta")
+    table.add_column("Project", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Time", justify="right")
+    table.add_column("Details")
+
+    for result in report.results:
+        if result.ok:
+            table.add_row(result.name, "✅", f"{result.duration:.2f}s", str(result.project_path))
+        else:
+            table.add_row(
+                result.name,
+                "❌",
+                f"{result.duration:.2f}s",
+                f"[red]{result.error_type}: {result.error}[/red]",
+            )
+
+    console.print("\n")
+    console.print(table)
+    console.print(
+        f"\n[bold]{len(report.succeeded)} succeeded[/bold], "
+        f"[bold red]{len(report.failed)} failed[/bold red]\n"
+    )
+
+
+def show_regeneration_report(report):
+    """Show what regenerating a project changed"""
+    title = "🔄 Regeneration (dry run)" if report.dry_run else "🔄 Regeneration"
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    table.add_column("File", style="cyan")
+    table.add_column("Status")
+
+    for status, paths, style in (
+        ("created", report.created, "green"),
+        ("updated", report.updated, "green"),
+        ("removed", report.removed, "yellow"),
+        ("modified by you, kept", report.modified, "red"),
+    ):
+        for path in paths:
+            table.add_row(path, f"[{style}]{status}[/{style}]")
+
+    console.print("\n")
+    if table.row_count:
+        console.print(table)
+    else:
+        console.print("[green]✅ Project is up to date[/green]")
+    console.print(
+        f"\n[bold]{report.rendered}[/bold] templates rendered, "
+        f"[bold]{len(report.unchanged)}[/bold] files unchanged\n"
+    )
+    if report.modified:
+        console.print(
+            "[yellow]⚠️  Files you edited were not overwritten; "
+            "merge the changes vyte would make by hand.[/yellow]\n"
+        )
+
+
+def show_next_steps(project_path: Path, config: "ProjectConfig"):
     """Show next steps after generation"""
+    from rich.markdown import Markdown
+
     steps = f"""
 # 🎉 Success! Your project is ready!
 
@@ -0,0 +1,43 @@
+"""
+Lazily loaded click command registry
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on first use
+
+    Subcommands are registered as "module:attribute" import paths, so
+    `vyte --version` or `vyte list` never import the modules (and heavy
+    dependencies) behind `vyte serve` or `vyte cache`.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        """
+        Initialize group
+
+        Args:
+            lazy_commands: Command name -> "package.module:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazily registered command"""
+        module_name, _, attribute = self.lazy_commands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' is not a click command: {command!r}")
+        return command
@@ -0,0 +1,84 @@
+"""
+`vyte lock` command
+"""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ..exceptions import ConfigurationError, DependencyError
+
+console = Console()
+
+
+@click.command()
+@click.argument(
+    "project_path",
+    default=".",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.option(
+    "--index",
+    "index_dir",
+    required=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of wheels and source distributions to resolve against",
+)
+@click.option(
+    "--python-version",
+    metavar="X.Y",
+    help="Python version the lockfile targets (default: the project's Docker image)",
+)
+def lock(project_path, index_dir, python_version):
+    """
+    Pin every requirement of a project, with hashes, into requirements.lock
+
+    Resolves requirements.txt and all transitive dependencies against a
+    local package index snapshot, without network access. Releases whose
+    Requires-Python or wheel tags exclude the target Python and platform are
+    skipped, and older releases are tried when the newest ones conflict.
+    Install with
+    `pip install --no-index --find-links INDEX --require-hashes -r requirements.lock`.
+
+    Examples:
+        pip download -r my-api/requirements.txt -d wheels/
+        vyte lock my-api --index wheels/
+    """
+    from ..core.lockfile import (
+        LOCKFILE_NAME,
+        PackageIndex,
+        read_requirements,
+        resolve_lockfile,
+        target_environment,
+        target_tags,
+    )
+    from ..core.manifest import ProjectManifest
+    from .display import show_error, show_success
+
+    if python_version is None:
+        try:
+            python_version = (
+                ProjectManifest.load(project_path).project_config().get_python_version()
+            )
+        except ConfigurationError:
+            python_version = None  # Not generated by vyte: target this interpreter
+
+    try:
+        requirements = read_requirements(project_path / "requirements.txt")
+        lockfile = resolve_lockfile(
+            requirements,
+            PackageIndex(index_dir),
+            target_environment(python_version),
+            target_tags(python_version),
+        )
+        (project_path / LOCKFILE_NAME).write_text(lockfile.to_text(), encoding="utf-8")
+    except DependencyError as e:
+        show_error("Cannot Lock Dependencies", [str(e)])
+        sys.exit(1)
+    except OSError as e:
+        show_error("File System Error", [str(e)])
+        sys.exit(1)
+
+    show_success(f"Pinned {len(lockfile.packages)} packages in {project_path / LOCKFILE_NAME}")
@@ -0,0 +1,65 @@
+"""
+`vyte regenerate` command
+"""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ..exceptions import ConfigurationError, FileSystemError, GenerationError
+
+console = Console()
+
+
+@click.command()
+@click.argument(
+    "project_path",
+    default=".",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.option("--auth/--no-auth", default=None, help="Change JWT authentication")
+@click.option("--docker/--no-docker", default=None, help="Change Docker support")
+@click.option("--tests/--no-tests", default=None, help="Change the testing suite")
+@click.option("--dry-run", is_flag=True, help="Show what would change without writing anything")
+def regenerate(project_path, auth, docker, tests, dry_run):
+    """
+    Update a generated project after upgrading vyte or changing a flag
+
+    Only files whose template or configuration changed are rendered again,
+    and only files whose content changed are rewritten. Files you edited
+    are reported and left untouched.
+
+    Examples:
+        vyte regenerate my-api --dry-run
+        vyte regenerate my-api --no-docker
+    """
+    from ..core.generator import ProjectGenerator
+    from ..core.manifest import ProjectManifest
+    from .display import show_error, show_regeneration_report
+
+    overrides = {
+        field: value
+        for field, value in (
+            ("auth_enabled", auth),
+            ("docker_support", docker),
+            ("testing_suite", tests),
+        )
+        if value is not None
+    }
+
+    try:
+        config = ProjectManifest.load(project_path).project_config(**overrides)
+        report = ProjectGenerator(cache=False).regenerate(project_path, config, dry_run=dry_run)
+    except ConfigurationError as e:
+        show_error("Cannot Regenerate", [str(e)])
+        sys.exit(1)
+    except (FileSystemError, OSError) as e:
+        show_error("File System Error", [str(e), "Check permissions and disk space."])
+        sys.exit(1)
+    except GenerationError as e:
+        show_error("Regeneration Failed", [str(e)])
+        sys.exit(1)
+
+    show_regeneration_report(report)
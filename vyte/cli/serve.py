@@ -0,0 +1,77 @@
+"""
+`vyte serve` command
+"""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ..exceptions import FileSystemError
+
+console = Console()
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Host to bind")
+@click.option("--port", "-p", default=8765, show_default=True, type=int, help="Port to bind")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Listen on a Unix domain socket instead of TCP",
+)
+@click.option("--warm/--no-warm", default=True, help="Compile every template at startup")
+@click.option(
+    "--allow-root",
+    "allow_roots",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Let requests write projects inside this directory (repeatable)",
+)
+def serve(host, port, socket_path, warm, allow_roots):
+    """
+    Run a generation server with a warm generator
+
+    The server keeps one generator and its compiled templates in memory and
+    accepts ProjectConfig JSON over HTTP. Use `vyte-client` or any HTTP
+    client to generate projects. Projects come back as archives; writing
+    them to server paths is only allowed inside --allow-root directories.
+
+    Examples:
+        vyte serve --port 8765
+        vyte serve --socket /tmp/vyte.sock --allow-root ~/projects
+
+        curl -X POST localhost:8765/generate -o my-api.tar.gz \\
+            -H 'Content-Type: application/json' \\
+            -d '{"config": {"name": "my-api", "framework": "FastAPI",
+                            "orm": "SQLAlchemy", "database": "SQLite"}}'
+    """
+    from ..core.server import create_server
+    from .display import show_error
+
+    try:
+        server = create_server(
+            host=host,
+            port=port,
+            socket_path=socket_path,
+            warm=warm,
+            allow_roots=list(allow_roots),
+        )
+    except (FileSystemError, OSError) as e:
+        show_error("Cannot Start Server", [str(e)])
+        sys.exit(1)
+
+    address = socket_path or f"http://{host}:{server.server_address[1]}"
+    console.print(f"\n[green]🚀 vyte server listening on {address}[/green]")
+    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Server stopped[/yellow]\n")
+    finally:
+        server.server_close()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,174 @@
+"""
+Asyncio-native project generation
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from ..exceptions import FileSystemError
+from .config import ProjectConfig
+from .events import EventBus
+from .generator import ProjectGenerator
+from .output import ArchiveOutput, DiskOutput, MemoryOutput, OutputBackend
+
+
+class AsyncProjectGenerator:
+    """
+    Project generator for asyncio applications
+
+    Rendering runs on a worker thread into memory, then the tree is flushed
+    to its destination from a worker thread as well, so the event loop is
+    never blocked on template rendering or file I/O.
+
+    Cancelling generate() is safe at any point: nothing is left behind. A
+    flush in progress stops at the next file and the partial project
+    directory (or archive) is removed, like a failed synchronous generation.
+    """
+
+    def __init__(
+        self,
+        template_dir: Path | None = None,
+        io_workers: int | None = None,
+        output_root: Path | str | None = None,
+        generator: ProjectGenerator | None = None,
+    ):
+        """
+        Initialize generator
+
+        Args:
+            template_dir: Optional custom templates directory
+            io_workers: Threads used to render files (default: automatic)
+            output_root: Directory projects are created in (default: the
+                         current working directory at generation time)
+            generator: Synchronous generator to share (and its warm templates);
+                       the other arguments are ignored when given
+        """
+        self.generator = generator or ProjectGenerator(
+            template_dir, io_workers=io_workers, output_root=output_root
+        )
+
+    @property
+    def events(self) -> EventBus:
+        """Generator-wide event bus (see ProjectGenerator.events)"""
+        return self.generator.events
+
+    async def generate(
+        self,
+        config: ProjectConfig,
+        output: OutputBackend | None = None,
+        events: EventBus | None = None,
+    ) -> Path:
+        """
+        Generate a complete project without blocking the event loop
+
+        Args:
+            config: Project configuration
+            output: Backend receiving the files (default: DiskOutput at
+                    generator.get_output_path(config))
+            events: Bus receiving progress events (delivered from worker threads)
+
+        Returns:
+            Path to generated project directory
+
+        Raises:
+            FileExistsError: If project directory already exists
+            FileSystemError, GenerationError: As ProjectGenerator.generate
+            asyncio.CancelledError: If cancelled (after cleaning up)
+        """
+        if output is None:
+            output = DiskOutput(self.generator.get_output_path(config))
+
+        if await asyncio.to_thread(output.exists):
+            raise FileExistsError(
+                f"Directory already exists: {output.root}\n"
+                "Please choose a different name or delete the existing directory."
+            )
+        # Claim the destination right away, as the synchronous path does
+        await asyncio.to_thread(output.create_root)
+
+        memory = MemoryOutput(output.root)
+        try:
+            await asyncio.to_thread(self.generator.generate, config, memory, events)
+            await self._flush(memory, output)
+        except BaseException:
+            await asyncio.shield(asyncio.to_thread(output.remove))
+            raise
+
+        return output.root
+
+    async def generate_archive(
+        self,
+        config: ProjectConfig,
+        target: str | Path | BinaryIO,
+        archive_format: str | None = None,
+    ) -> Path:
+        """
+        Generate a project straight into a tar or zip archive
+
+        Args:
+            config: Project configuration
+            target: Archive path or writable binary stream
+            archive_format: 'tar.gz', 'zip', ... (default: from the target name)
+
+        Returns:
+            Project path the archive entries are rooted at
+        """
+        output = ArchiveOutput(self.generator.get_output_path(config), target, archive_format)
+        return await self.generate(config, output=output)
+
+    async def init_git(
+        self, project_path: Path, output: OutputBackend | None = None, use_cli: bool = False
+    ) -> str:
+        """
+        Initialize a git repository with an initial commit of the project
+
+        Args:
+            project_path: Project root
+            output: Backend the project was generated into (default: disk)
+            use_cli: Run the git CLI (as asyncio subprocesses) instead of the
+                     built-in writer
+
+        Returns:
+            Commit id
+
+        Raises:
+            GitError: If the repository cannot be created
+        """
+        if use_cli:
+            from ..utils.git import initialize_repo_cli_async
+
+            return await initialize_repo_cli_async(project_path)
+        return await asyncio.to_thread(self.generator.init_git, project_path, output)
+
+    @staticmethod
+    async def _flush(memory: MemoryOutput, output: OutputBackend):
+        """Copy a generated tree into its destination on a worker thread"""
+        stop = threading.Event()
+
+        def flush():
+            for relative in sorted(memory.directories):
+                output.mkdir(memory.root / relative)
+            for relative in sorted(memory.files):
+                if stop.is_set():
+                    return
+                output.write_bytes(
+                    memory.root / relative, memory.files[relative], memory.modes.get(relative)
+                )
+            output.close()
+
+        task = asyncio.ensure_future(asyncio.to_thread(flush))
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # The thread cannot be interrupted: stop it at the next file and
+            # wait for it, so cleanup doesn't race its writes
+            stop.set()
+            try:
+                await task
+            except Exception as e:  # noqa: BLE001 - cancellation wins over flush errors
+                raise asyncio.CancelledError() from e
+            raise
+        except OSError as e:
+            raise FileSystemError(f"Failed to create project structure: {e}") from e
@@ -0,0 +1,277 @@
+"""
+Batch project generation across a process pool
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..exceptions import ConfigurationError
+from .config import ProjectConfig
+
+
+@dataclass
+class GenerationResult:
+    """
+    Outcome of a single project generation inside a batch
+
+    Attributes:
+        name: Project name
+        project_path: Path to the generated project (None on failure)
+        error: Error message if generation failed
+        error_type: Exception class name if generation failed
+        duration: Wall time spent generating, in seconds
+    """
+
+    name: str
+    project_path: Path | None = None
+    error: str | None = None
+    error_type: str | None = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the project was generated successfully"""
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Per-project results of a batch generation, in input order"""
+
+    results: list[GenerationResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[GenerationResult]:
+        """Results of projects generated successfully"""
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[GenerationResult]:
+        """Results of projects that failed to generate"""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        """True if every project in the batch was generated"""
+        return not self.failed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable view of the report"""
+        return {
+            "total": len(self.results),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "results": [
+                {
+                    "name": r.name,
+                    "project_path": str(r.project_path) if r.project_path else None,
+                    "error": r.error,
+                    "error_type": r.error_type,
+                    "duration": round(r.duration, 4),
+                }
+                for r in self.results
+            ],
+        }
+
+
+# Generator owned by each worker process, built once by the pool initializer
+# so every task in that worker reuses the same warm Jinja2 environment.
+_worker_generator = None
+
+
+def _init_worker(template_dir: Path | None, output_root: Path | None = None, cache: bool = True):
+    """Process pool initializer: build the worker's generator"""
+    global _worker_generator
+    from .generator import ProjectGenerator
+
+    _worker_generator = ProjectGenerator(template_dir, output_root=output_root, cache=cache)
+
+
+def _generate_one(generator, config: ProjectConfig) -> GenerationResult:
+    """Generate a single project, capturing any error in the result"""
+    start = time.perf_counter()
+    try:
+        project_path = generator.generate(config)
+    except Exception as e:  # noqa: BLE001 - one failure must not abort the batch
+        return GenerationResult(
+            name=config.name,
+            error=str(e),
+            error_type=type(e).__name__,
+            duration=time.perf_counter() - start,
+        )
+
+    return GenerationResult(
+        name=config.name, project_path=project_path, duration=time.perf_counter() - start
+    )
+
+
+def _worker_generate(config: ProjectConfig) -> GenerationResult:
+    """Process pool task: generate with the worker's warm generator"""
+    return _generate_one(_worker_generator, config)
+
+
+def generate_many(
+    configs: list[ProjectConfig | GenerationResult],
+    workers: int | None = None,
+    template_dir: Path | None = None,
+    generator=None,
+    output_root: Path | None = None,
+    cache: bool = True,
+) -> BatchReport:
+    """
+    Generate several projects, fanning out across a process pool
+
+    A failing project is reported in its result and never aborts the rest
+    of the batch.
+
+    Args:
+        configs: Project configurations to generate; failed results (the
+                 invalid entries of a manifest) are reported as they are
+        workers: Number of worker processes. Defaults to the CPU count;
+                 1 generates serially in the current process
+        template_dir: Optional custom templates directory
+        generator: Generator to use for in-process (serial) generation
+        output_root: Directory projects are created in (default: the current
+                     working directory)
+        cache: Use the generation cache in worker processes
+
+    Returns:
+        BatchReport with one result per config, in input order
+    """
+    configs = list(configs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(configs) or 1))
+
+    results: list[GenerationResult | None] = [None] * len(configs)
+
+    # Two configs resolving to the same directory would race each other
+    seen: dict[Path, int] = {}
+    pending: list[int] = []
+    for index, config in enumerate(configs):
+        if isinstance(config, GenerationResult):
+            results[index] = config
+            continue
+        output_path = config.get_output_path(output_root)
+        if output_path in seen:
+            results[index] = GenerationResult(
+                name=config.name,
+                error=f"Duplicate project path in batch: {output_path}",
+                error_type="ConfigurationError",
+            )
+            continue
+        seen[output_path] = index
+        pending.append(index)
+
+    if workers == 1:
+        if generator is None:
+            from .generator import ProjectGenerator
+
+            generator = ProjectGenerator(template_dir, output_root=output_root, cache=cache)
+        for index in pending:
+            results[index] = _generate_one(generator, configs[index])
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(template_dir, output_root, cache),
+        ) as executor:
+            futures = {
+                index: executor.submit(_worker_generate, configs[index]) for index in pending
+            }
+            for index, future in futures.items():
+                try:
+                    results[index] = future.result()
+                except Exception as e:  # noqa: BLE001 - e.g. a worker process died
+                    results[index] = GenerationResult(
+                        name=configs[index].name, error=str(e), error_type=type(e).__name__
+                    )
+
+    return BatchReport(results=[r for r in results if r is not None])
+
+
+def load_manifest(manifest_path: Path) -> list[ProjectConfig | GenerationResult]:
+    """
+    Load project configurations from a YAML or JSON manifest
+
+    The manifest is either a list of projects or a mapping with optional
+    ``defaults`` applied to every entry of ``projects``::
+
+        defaults:
+          framework: FastAPI
+          orm: SQLAlchemy
+          database: PostgreSQL
+        projects:
+          - name: billing-api
+          - name: users-api
+            framework: Flask-Restx
+
+    An invalid entry doesn't abort the batch: it is returned, in its place,
+    as a failed GenerationResult that generate_many() reports as is.
+
+    Raises:
+        ConfigurationError: If the manifest cannot be read or lists no projects
+    """
+    manifest_path = Path(manifest_path)
+    text = manifest_path.read_text(encoding="utf-8")
+
+    if manifest_path.suffix.lower() == ".json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON manifest {manifest_path}: {e}") from e
+    else:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ConfigurationError(
+                "YAML manifests require PyYAML. Install it with: pip install vyte[manifest]"
+            ) from e
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Invalid YAML manifest {manifest_path}: {e}") from e
+
+    if isinstance(data, list):
+        defaults: dict[str, Any] = {}
+        projects = data
+    elif isinstance(data, dict):
+        defaults = data.get("defaults") or {}
+        projects = data.get("projects") or []
+    else:
+        raise ConfigurationError(f"Manifest {manifest_path} must be a list or a mapping")
+
+    if not projects:
+        raise ConfigurationError(f"Manifest {manifest_path} does not define any projects")
+
+    configs: list[ProjectConfig | GenerationResult] = []
+    for index, entry in enumerate(projects):
+        if not isinstance(entry, dict):
+            configs.append(
+                GenerationResult(
+                    name=f"#{index + 1}",
+                    error=f"Manifest entry #{index + 1} must be a mapping",
+                    error_type="ConfigurationError",
+                )
+            )
+            continue
+        try:
+            configs.append(ProjectConfig(**{**defaults, **entry}))
+        except PydanticValidationError as e:
+            label = str(entry.get("name", f"#{index + 1}"))
+            configs.append(
+                GenerationResult(
+                    name=label,
+                    error=f"Invalid manifest entry {label}: {e}",
+                    error_type="ConfigurationError",
+                )
+            )
+
+    return configs
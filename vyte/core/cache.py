@@ -0,0 +1,535 @@
+"""
+Persistent on-disk caches used to speed up repeated generations
+"""
+
+import fnmatch
+import functools
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+from ..__version__ import __version__
+from .output import MemoryOutput, OutputBackend
+from .template_graph import chain_digest
+
+if TYPE_CHECKING:
+    from .config import ProjectConfig
+    from .renderer import TemplateRenderer
+
+# now() called from a template expression or statement: output depends on the clock
+_CLOCK_CALL = re.compile(r"\{[{%][^}]*?(?<![.\w])now\s*\(")
+
+# SHA-256 of an empty (touched) file
+EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the root directory for vyte caches
+
+    Resolution order: ``$VYTE_CACHE_DIR``, ``$XDG_CACHE_HOME/vyte``, ``~/.cache/vyte``
+    """
+    override = os.environ.get("VYTE_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "vyte"
+
+
+def cache_enabled() -> bool:
+    """Caches are on unless ``$VYTE_NO_CACHE`` is set to a non-empty value"""
+    return not os.environ.get("VYTE_NO_CACHE")
+
+
+class LRUCacheDirectory:
+    """
+    Directory of cache files bounded by total size
+
+    Files matching ``pattern`` (a ``%s`` pattern) in ``directory`` are
+    evicted least recently used first, using their mtime as the access time.
+    """
+
+    directory: str
+    pattern: str
+    max_size: int
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Cache files currently on disk"""
+        try:
+            with os.scandir(self.directory) as it:
+                return [
+                    entry
+                    for entry in it
+                    if entry.is_file() and fnmatch.fnmatch(entry.name, self.pattern % "*")
+                ]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _mark_used(path: str):
+        """Record an access to a cache file"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits ``max_size``
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every cached entry
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get statistics about the cache
+
+        Returns:
+            Dictionary with directory, entry count and sizes
+        """
+        sizes = []
+        for entry in self._entries():
+            try:
+                sizes.append(entry.stat().st_size)
+            except OSError:
+                pass
+
+        return {
+            "directory": self.directory,
+            "entries": len(sizes),
+            "size": sum(sizes),
+            "max_size": self.max_size,
+        }
+
+
+class TemplateBytecodeCache(LRUCacheDirectory, FileSystemBytecodeCache):
+    """
+    Jinja2 bytecode cache persisted across CLI invocations
+
+    Entries are keyed by template path, source mtime and vyte version, so
+    editing a template or upgrading vyte never serves stale bytecode. The
+    cache is bounded by total size; least recently used entries are evicted
+    first.
+    """
+
+    DEFAULT_MAX_SIZE = 32 * 1024 * 1024  # 32 MiB
+    PATTERN = "__vyte_%s.cache"
+
+    def __init__(self, directory: Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize bytecode cache
+
+        Args:
+            directory: Cache directory (default: <cache dir>/bytecode)
+            max_size: Maximum total size of cached bytecode, in bytes
+        """
+        directory = Path(directory) if directory is not None else get_cache_dir() / "bytecode"
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory), self.PATTERN)
+        self.max_size = max_size
+
+    def get_cache_key(self, name: str, filename: str | None = None) -> str:
+        """Cache key from template path, source mtime and vyte version"""
+        mtime = 0
+        if filename:
+            try:
+                mtime = os.stat(filename).st_mtime_ns
+            except OSError:
+                pass
+        key = f"{__version__}|{name}|{filename or ''}|{mtime}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def load_bytecode(self, bucket: Bucket):
+        """Load bytecode and mark the entry as recently used"""
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            self._mark_used(self._get_cache_filename(bucket))
+
+    def dump_bytecode(self, bucket: Bucket):
+        """Store bytecode, then evict old entries if the cache is over its size bound"""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            # The cache is an optimization: a read-only or full disk must not break rendering
+            return
+        self.evict()
+
+
+class GenerationCache(LRUCacheDirectory):
+    """
+    Rendered project trees, addressed by a hash of everything they depend on
+
+    The key covers the project configuration (model_dump_safe()), the source
+    of every template the project renders (or, without a template list,
+    every template the renderer can load), the ``year`` template global
+    and the vyte version and code, so a repeated generation is replayed from the
+    cache instead of rendered. Templates calling now() make a project
+    uncacheable. Entries are evicted least recently used first once the
+    cache grows over ``max_size``.
+    """
+
+    DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB
+    PATTERN = "%s.tree"
+    FORMAT = 1
+
+    def __init__(self, directory: Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize generation cache
+
+        Args:
+            directory: Cache directory (default: <cache dir>/projects)
+            max_size: Maximum total size of cached trees, in bytes
+        """
+        directory = Path(directory) if directory is not None else get_cache_dir() / "projects"
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = str(directory)
+        self.pattern = self.PATTERN
+        self.max_size = max_size
+        # Template set fingerprints per renderer, revalidated with Jinja's uptodate checks
+        self._fingerprints: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        config: "ProjectConfig",
+        renderer: "TemplateRenderer",
+        templates: Iterable[str] | None = None,
+    ) -> str | None:
+        """
+        Cache key of the project a configuration renders to
+
+        Args:
+            config: Project configuration
+            renderer: Renderer the project would be rendered with
+            templates: Templates the project renders (default: every
+                       template the renderer can load). Only these and the
+                       templates they load are hashed, so editing an
+                       unrelated template keeps the entry valid.
+
+        Returns:
+            Hex digest, or None if the project cannot be cached
+        """
+        if templates is None:
+            fingerprint, uses_clock = self._fingerprint(renderer)
+        else:
+            fingerprint, uses_clock = self._plan_fingerprint(renderer, templates)
+        if uses_clock:
+            return None
+
+        inputs = {
+            "vyte": __version__,
+            "code": _code_fingerprint(),
+            "config": config.model_dump_safe(),
+            "templates": fingerprint,
+            "year": renderer.env.globals.get("year"),
+        }
+        document = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+    def load(self, key: str, root: Path) -> MemoryOutput | None:
+        """
+        Get a cached tree and mark it as recently used
+
+        Args:
+            key: Cache key from key()
+            root: Project root the tree is placed at
+
+        Returns:
+            The tree, or None on a miss (corrupt entries are discarded)
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            tree = self._decode(data, root)
+        except (ValueError, KeyError, TypeError):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        self._mark_used(path)
+        return tree
+
+    def store(self, key: str, tree: MemoryOutput) -> bool:
+        """
+        Cache a generated tree, then evict old entries if over the size bound
+
+        Args:
+            key: Cache key from key()
+            tree: Generated project
+
+        Returns:
+            True if the tree was stored
+        """
+        data = self._encode(tree)
+        if len(data) > self.max_size:
+            return False
+
+        # Write then rename, so concurrent readers never see a partial entry.
+        # The cache is an optimization: a read-only or full disk must not break generation
+        try:
+            fd, temp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp, self._path(key))
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return False
+
+        self.evict()
+        return True
+
+    def _path(self, key: str) -> str:
+        """Entry file of a key"""
+        return os.path.join(self.directory, self.pattern % key)
+
+    def _encode(self, tree: MemoryOutput) -> bytes:
+        """Serialize a tree: one JSON header line, then every file's content"""
+        names = sorted(tree.files)
+        payload = b"".join(tree.files[name] for name in names)
+        header = {
+            "format": self.FORMAT,
+            "directories": sorted(tree.directories),
+            "files": [[name, len(tree.files[name]), tree.modes.get(name)] for name in names],
+            "sha256": hashlib.sha256(payload).hexdigest(),
+        }
+        return json.dumps(header).encode("utf-8") + b"\n" + payload
+
+    def _decode(self, data: bytes, root: Path) -> MemoryOutput:
+        """
+        Deserialize a tree
+
+        Raises:
+            ValueError: If the entry is truncated, corrupt or from another format
+        """
+        line, _, payload = data.partition(b"\n")
+        header = json.loads(line)
+        if header["format"] != self.FORMAT:
+            raise ValueError(f"Unsupported cache entry format: {header['format']}")
+        if hashlib.sha256(payload).hexdigest() != header["sha256"]:
+            raise ValueError("Cache entry checksum mismatch")
+
+        tree = MemoryOutput(root)
+        tree.directories.update(header["directories"])
+        offset = 0
+        for name, size, mode in header["files"]:
+            tree.files[name] = payload[offset : offset + size]
+            if mode is not None:
+                tree.modes[name] = mode
+            offset += size
+        return tree
+
+    @staticmethod
+    def _plan_fingerprint(
+        renderer: "TemplateRenderer", templates: Iterable[str]
+    ) -> tuple[str, bool]:
+        """
+        Digest of a set of templates and of the templates they load
+
+        Returns:
+            (hex digest, whether any of them reads the now() global)
+        """
+        graph = renderer.graph
+        digest = hashlib.sha256()
+        uses_clock = False
+        for name in sorted(set(templates)):
+            chain = graph.chain(name)
+            digest.update(f"{name}\0{chain_digest(chain)}\n".encode())
+            uses_clock = uses_clock or graph.reads(name, "now", chain)
+        return digest.hexdigest(), uses_clock
+
+    def _fingerprint(self, renderer: "TemplateRenderer") -> tuple[str, bool]:
+        """
+        Digest of every template a renderer can load
+
+        Memoized per renderer. The memo is revalidated with the templates'
+        own uptodate checks plus the mtimes of their directories (which
+        change when a template is added or removed), so the template tree
+        is only listed and read again after it changed.
+
+        Returns:
+            (hex digest, whether any template calls now())
+        """
+        with self._lock:
+            known = self._fingerprints.get(renderer)
+        if known is not None and all(check() for check in known[0]):
+            return known[1], known[2]
+
+        env = renderer.env
+        digest = hashlib.sha256()
+        checks: list[Callable[[], bool]] = []
+        directories: set[str] = set()
+        uses_clock = False
+        for name in env.loader.list_templates():
+            source, filename, uptodate = env.loader.get_source(env, name)
+            digest.update(name.encode("utf-8") + b"\0" + source.encode("utf-8") + b"\0")
+            uses_clock = uses_clock or bool(_CLOCK_CALL.search(source))
+            checks.append(uptodate or _never)
+            if filename:
+                # Every directory between the template and its loader's search path
+                directories.update(str(p) for p in Path(filename).parents[: name.count("/") + 1])
+        checks.extend(mtime_check(directory) for directory in sorted(directories))
+
+        fingerprint = (checks, digest.hexdigest(), uses_clock)
+        with self._lock:
+            self._fingerprints[renderer] = fingerprint
+        return fingerprint[1], fingerprint[2]
+
+
+@functools.lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """
+    Digest of vyte's own modules (paths, sizes and mtimes)
+
+    Keeps editable installs from replaying trees generated by older code
+    under the same version number. Computed once per process.
+    """
+    package = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+    for path in sorted(package.rglob("*.py")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.relative_to(package)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _never() -> bool:
+    """Check of something that is never known to be up to date"""
+    return False
+
+
+def mtime_check(path: str) -> Callable[[], bool]:
+    """Check returning True while a path's mtime is unchanged"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return _never
+
+    def check() -> bool:
+        try:
+            return os.stat(path).st_mtime_ns == mtime
+        except OSError:
+            return False
+
+    return check
+
+
+class RecordingOutput(OutputBackend):
+    """
+    Output backend proxy recording the SHA-256 of every file written
+
+    The content itself is only kept (as a MemoryOutput copy) when asked to,
+    so generating to a streaming backend stays constant-memory unless the
+    result is going to be cached.
+    """
+
+    def __init__(self, inner: OutputBackend, keep_files: bool = False):
+        """
+        Initialize proxy
+
+        Args:
+            inner: Backend doing the actual writes
+            keep_files: Also keep a copy of the tree in ``tree``
+        """
+        super().__init__(inner.root)
+        self.inner = inner
+        self.hashes: dict[str, str] = {}
+        self.tree = MemoryOutput(inner.root) if keep_files else None
+        self.on_disk = inner.on_disk
+        self.thread_safe = inner.thread_safe
+
+    def exists(self, path: Path | None = None) -> bool:
+        return self.inner.exists(path)
+
+    def create_root(self):
+        self.inner.create_root()
+
+    def mkdir(self, path: Path):
+        self.inner.mkdir(path)
+        if self.tree is not None:
+            self.tree.mkdir(path)
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        self.inner.write_bytes(path, data, mode)
+        self.hashes[self.relative(path)] = hashlib.sha256(data).hexdigest()
+        if self.tree is not None:
+            self.tree.write_bytes(path, data, mode)
+
+    def touch(self, path: Path):
+        self.inner.touch(path)
+        self.hashes.setdefault(self.relative(path), EMPTY_HASH)
+        if self.tree is not None:
+            self.tree.touch(path)
+
+    def remove(self):
+        self.inner.remove()
+        self.hashes.clear()
+        if self.tree is not None:
+            self.tree.remove()
+
+    def close(self):
+        self.inner.close()
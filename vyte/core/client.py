@@ -0,0 +1,191 @@
+"""
+Thin client for the vyte generation server
+
+Only uses the standard library so that repeated generations skip the cost
+of importing the generator, templates and CLI.
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from ..exceptions import ConfigurationError, GenerationError
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket"""
+
+    def __init__(self, socket_path: str | Path, timeout: float = 60):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = str(socket_path)
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class VyteClient:
+    """
+    Client for a running `vyte serve` instance
+
+    Example:
+        client = VyteClient(socket_path="/tmp/vyte.sock")
+        data = client.generate_archive({"name": "my-api", "framework": "FastAPI",
+                                        "orm": "SQLAlchemy", "database": "SQLite"})
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        socket_path: str | Path | None = None,
+        timeout: float = 60,
+    ):
+        """
+        Initialize client
+
+        Args:
+            url: Server URL (ignored when socket_path is given)
+            socket_path: Unix domain socket of the server
+            timeout: Socket timeout in seconds
+        """
+        self.url = urlsplit(url)
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.socket_path is not None:
+            return UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        return http.client.HTTPConnection(
+            self.url.hostname, self.url.port or 80, timeout=self.timeout
+        )
+
+    def _request(self, method: str, path: str, body: dict | None = None) -> tuple[bytes, dict]:
+        """
+        Send a request and return (body, headers)
+
+        Raises:
+            ConfigurationError: If the server rejected the request
+            GenerationError: If generation failed or the server is unreachable
+        """
+        connection = self._connection()
+        try:
+            data = json.dumps(body).encode("utf-8") if body is not None else None
+            headers = {"Content-Type": "application/json"} if data is not None else {}
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+            response_headers = dict(response.getheaders())
+        except OSError as e:
+            raise GenerationError(f"Cannot reach vyte server: {e}") from e
+        finally:
+            connection.close()
+
+        if response.status >= 400:
+            try:
+                message = json.loads(content)["message"]
+            except (ValueError, KeyError):
+                message = content.decode("utf-8", "replace")
+            error = ConfigurationError if response.status < 500 else GenerationError
+            raise error(message)
+
+        return content, response_headers
+
+    def health(self) -> dict[str, Any]:
+        """Get server status"""
+        content, _ = self._request("GET", "/health")
+        return json.loads(content)
+
+    def generate_archive(self, config: dict[str, Any], archive_format: str = "tar.gz") -> bytes:
+        """
+        Generate a project and return it as an archive
+
+        Args:
+            config: ProjectConfig fields
+            archive_format: 'tar.gz', 'zip', ...
+
+        Returns:
+            Archive content
+        """
+        content, _ = self._request(
+            "POST", "/generate", {"config": config, "format": archive_format}
+        )
+        return content
+
+    def generate_to(self, config: dict[str, Any], path: str | Path) -> Path:
+        """
+        Generate a project into <path>/<name> on the server's filesystem
+
+        Returns:
+            Path to the generated project
+        """
+        content, _ = self._request(
+            "POST", "/generate", {"config": config, "path": str(Path(path).resolve())}
+        )
+        return Path(json.loads(content)["project_path"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the `vyte-client` command"""
+    parser = argparse.ArgumentParser(
+        prog="vyte-client", description="Generate projects through a running `vyte serve`"
+    )
+    parser.add_argument("--url", default=DEFAULT_URL, help="Server URL")
+    parser.add_argument("--socket", help="Server Unix domain socket")
+    parser.add_argument("--name", "-n", required=True, help="Project name")
+    parser.add_argument("--framework", "-f", required=True, help="Web framework")
+    parser.add_argument("--orm", "-o", required=True, help="ORM/ODM")
+    parser.add_argument("--database", "-d", required=True, help="Database type")
+    parser.add_argument("--no-auth", action="store_true", help="Exclude JWT authentication")
+    parser.add_argument("--no-docker", action="store_true", help="Exclude Docker support")
+    parser.add_argument("--no-tests", action="store_true", help="Exclude testing suite")
+    parser.add_argument("--format", default="tar.gz", help="Archive format (default: tar.gz)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--archive", help="Archive file to write ('-' for stdout)")
+    target.add_argument(
+        "--path",
+        help="Let the server write the project into this directory (inside one of its --allow-root)",
+    )
+    args = parser.parse_args(argv)
+
+    config = {
+        "name": args.name,
+        "framework": args.framework,
+        "orm": args.orm,
+        "database": args.database,
+        "auth_enabled": not args.no_auth,
+        "docker_support": not args.no_docker,
+        "testing_suite": not args.no_tests,
+    }
+    client = VyteClient(args.url, socket_path=args.socket)
+
+    try:
+        if args.path:
+            project_path = client.generate_to(config, args.path)
+            print(f"Project created at: {project_path}", file=sys.stderr)
+            return 0
+
+        data = client.generate_archive(config, args.format)
+    except (ConfigurationError, GenerationError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.archive == "-":
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    else:
+        archive = Path(args.archive or f"{args.name}.{args.format}")
+        archive.write_bytes(data)
+        print(f"Project archived to: {archive}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
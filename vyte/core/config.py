@@ -48,10 +48,6 @@ class ProjectConfig(BaseModel):
         if not v:
             raise ValueError("Project name cannot be empty")
 
-        # Check if already exists
-        if Path(v).exists():
-            raise ValueError(f"Directory '{v}' already exists")
-
         # Check valid characters
         if not all(c.isalnum() or c in "-_" for c in v):
             raise ValueError(
@@ -91,9 +87,15 @@ class ProjectConfig(BaseModel):
 
         return v
 
-    def get_output_path(self) -> Path:
-        """Get the output directory path"""
-        return Path.cwd() / self.name
+    def get_output_path(self, root: Path | str | None = None) -> Path:
+        """
+        Get the output directory path
+
+        Args:
+            root: Directory the project is created in (default: the current
+                  working directory, read at call time)
+        """
+        return Path(root if root is not None else Path.cwd()) / self.name
 
     def is_async_framework(self) -> bool:
         """Check if framework is async-based"""
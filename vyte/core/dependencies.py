@@ -2,9 +2,75 @@
 Dependency management system - Declarative and maintainable
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from packaging.utils import canonicalize_name
+
 from .config import ProjectConfig
+from .requirements import check_conflicts, merge_requirements, parse_requirement
+
+# Dependency categories, in requirements.txt order
+CATEGORIES = ("base", "framework", "auth", "server", "orm", "driver", "testing", "recommended")
+
+CATEGORY_LABELS = {
+    "base": "Base",
+    "framework": "Framework",
+    "auth": "Authentication",
+    "server": "Production server",
+    "orm": "ORM",
+    "driver": "Database driver",
+    "testing": "Testing",
+    "recommended": "Recommended",
+}
+
+
+@dataclass(frozen=True)
+class Dependency:
+    """
+    One requirement of a generated project
+
+    Attributes:
+        requirement: Requirement string (e.g. "fastapi>=0.109.0")
+        category: What it is needed for, one of CATEGORIES
+    """
+
+    requirement: str
+    category: str
+
+
+@dataclass(frozen=True)
+class DependencySet:
+    """
+    Resolved, categorized requirements of a project configuration
+
+    Immutable, so one resolution is shared by every caller (see
+    DependencyManager.resolve()).
+
+    Attributes:
+        entries: Requirements sorted by requirement string, one per package
+                 (see merge_requirements()); a package listed in several
+                 categories keeps the first one
+    """
+
+    entries: tuple[Dependency, ...]
+
+    @property
+    def requirements(self) -> tuple[str, ...]:
+        """Sorted requirement strings"""
+        return tuple(entry.requirement for entry in self.entries)
+
+    def category(self, category: str) -> tuple[str, ...]:
+        """Sorted requirement strings of one category"""
+        return tuple(entry.requirement for entry in self.entries if entry.category == category)
+
+    def counts(self) -> dict[str, int]:
+        """Number of requirements in total and in each category"""
+        counts = dict.fromkeys(CATEGORIES, 0)
+        for entry in self.entries:
+            counts[entry.category] += 1
+        return {"total": len(self.entries), **counts}
 
 
 class DependencyManager:
@@ -149,50 +215,41 @@ class DependencyManager:
     ]
 
     @classmethod
-    def get_all_dependencies(cls, config: ProjectConfig) -> list[str]:
+    def resolve(cls, config: ProjectConfig) -> DependencySet:
         """
-        Get complete list of dependencies for a project configuration
+        Get the categorized dependencies of a project configuration
+
+        Resolved once per framework/ORM/database/auth/testing combination;
+        the result is memoized and shared.
 
         Args:
             config: ProjectConfig instance
 
         Returns:
-            Sorted list of dependency strings
+            DependencySet
         """
-        deps: set[str] = set()
-
-        # Base dependencies
-        deps.update(cls.BASE_DEPS)
-
-        # Testing dependencies
-        if config.testing_suite:
-            deps.update(cls.TESTING_DEPS)
-
-        # Framework dependencies
-        framework_deps = cls.FRAMEWORK_DEPS.get(config.framework, {})
-        deps.update(framework_deps.get("base", []))
-
-        if config.auth_enabled:
-            deps.update(framework_deps.get("auth", []))
-
-        # Always include production server
-        deps.update(framework_deps.get("production", []))
-
-        # ORM dependencies
-        orm_deps = cls.ORM_DEPS.get(config.orm, {})
-        deps.update(orm_deps.get("base", []))
-        deps.update(orm_deps.get(config.framework, []))
+        return _resolve(
+            cls,
+            config.framework,
+            config.orm,
+            config.database,
+            config.is_async_framework(),
+            config.auth_enabled,
+            config.testing_suite,
+        )
 
-        # Database drivers
-        db_mode = "async" if config.is_async_framework() else "sync"
-        db_drivers = cls.DB_DRIVERS.get(config.database, {})
-        deps.update(db_drivers.get(db_mode, []))
+    @classmethod
+    def get_all_dependencies(cls, config: ProjectConfig) -> list[str]:
+        """
+        Get complete list of dependencies for a project configuration
 
-        # Recommended dependencies
-        deps.update(cls.RECOMMENDED_DEPS)
+        Args:
+            config: ProjectConfig instance
 
-        # Convert to sorted list
-        return sorted(deps)
+        Returns:
+            Sorted list of dependency strings
+        """
+        return list(cls.resolve(config).requirements)
 
     @classmethod
     def get_dev_dependencies(cls) -> list[str]:
@@ -216,8 +273,20 @@ class DependencyManager:
             output_dir: Directory to write requirements.txt
         """
         requirements_path = output_dir / "requirements.txt"
+        requirements_path.write_text(cls.render_requirements_txt(config), encoding="utf-8")
+
+    @classmethod
+    def render_requirements_txt(cls, config: ProjectConfig) -> str:
+        """
+        Build the content of requirements.txt
+
+        Args:
+            config: ProjectConfig instance
 
-        deps = cls.get_all_dependencies(config)
+        Returns:
+            requirements.txt content
+        """
+        resolved = cls.resolve(config)
 
         content = [
             "# Requirements generated by vytesto v2.0",
@@ -225,59 +294,66 @@ class DependencyManager:
             f"# Framework: {config.framework}",
             f"# ORM: {config.orm}",
             f"# Database: {config.database}",
-            "",
-            "# Base dependencies",
         ]
 
-        # Group dependencies by category
-        base_deps = [
-            d for d in deps if any(d.startswith(base.split(">=")[0]) for base in cls.BASE_DEPS)
-        ]
-
-        framework_name = config.framework.lower().replace("-", "")
-        framework_deps = [d for d in deps if framework_name in d.lower()]
-
-        orm_name = config.orm.lower()
-        orm_deps = [
-            d
-            for d in deps
-            if orm_name in d.lower() or "alembic" in d.lower() or "migrate" in d.lower()
-        ]
-
-        testing_deps = [d for d in deps if "pytest" in d.lower() or "cov" in d.lower()]
-
-        other_deps = [
-            d for d in deps if d not in base_deps + framework_deps + orm_deps + testing_deps
-        ]
+        headings = {
+            "base": "# Base dependencies",
+            "framework": f"# {config.framework} framework",
+            "auth": "# Authentication",
+            "server": "# Production server",
+            "orm": f"# {config.orm} ORM",
+            "driver": f"# {config.database} driver",
+            "testing": "# Testing",
+            "recommended": "# Recommended",
+        }
+        for category in CATEGORIES:
+            requirements = resolved.category(category)
+            if requirements:
+                content.extend(["", headings[category]])
+                content.extend(requirements)
 
-        # Write grouped dependencies
-        content.extend(base_deps)
+        content.append("")  # Empty line at end
 
-        if framework_deps:
-            content.extend(["", f"# {config.framework} framework"])
-            content.extend(framework_deps)
+        return "\n".join(content)
 
-        if orm_deps:
-            content.extend(["", f"# {config.orm} ORM"])
-            content.extend(orm_deps)
+    @classmethod
+    def render_lockfile(cls, config: ProjectConfig, index_dir: Path) -> str:
+        """
+        Build a requirements.lock pinning every dependency, with hashes
 
-        if testing_deps and config.testing_suite:
-            content.extend(["", "# Testing"])
-            content.extend(testing_deps)
+        Resolved offline against a package index snapshot, for the Python
+        version and platform of the generated Dockerfile.
 
-        if other_deps:
-            content.extend(["", "# Other dependencies"])
-            content.extend(other_deps)
+        Args:
+            config: ProjectConfig instance
+            index_dir: Directory of wheels and source distributions
 
-        content.append("")  # Empty line at end
+        Returns:
+            requirements.lock content
 
-        requirements_path.write_text("\n".join(content), encoding="utf-8")
+        Raises:
+            DependencyError: If the index can't satisfy the requirements
+        """
+        from .lockfile import PackageIndex, resolve_lockfile, target_environment, target_tags
+
+        python_version = config.get_python_version()
+        lockfile = resolve_lockfile(
+            cls.resolve(config).requirements,
+            PackageIndex(index_dir),
+            target_environment(python_version),
+            target_tags(python_version),
+        )
+        return lockfile.to_text()
 
     @classmethod
     def write_requirements_dev_txt(cls, output_dir: Path):
         """Write requirements-dev.txt for development dependencies"""
         requirements_dev_path = output_dir / "requirements-dev.txt"
+        requirements_dev_path.write_text(cls.render_requirements_dev_txt(), encoding="utf-8")
 
+    @classmethod
+    def render_requirements_dev_txt(cls) -> str:
+        """Build the content of requirements-dev.txt"""
         dev_deps = cls.get_dev_dependencies()
 
         content = [
@@ -290,7 +366,7 @@ class DependencyManager:
         content.extend(dev_deps)
         content.append("")
 
-        requirements_dev_path.write_text("\n".join(content), encoding="utf-8")
+        return "\n".join(content)
 
     @classmethod
     def get_dependency_info(cls, config: ProjectConfig) -> dict[str, int]:
@@ -298,49 +374,85 @@ class DependencyManager:
         Get statistics about dependencies
 
         Returns:
-            Dictionary with counts of different dependency types
+            Dictionary with the total and the count of each category
         """
-        all_deps = cls.get_all_dependencies(config)
-
-        return {
-            "total": len(all_deps),
-            "base": len(cls.BASE_DEPS),
-            "framework": len(cls.FRAMEWORK_DEPS.get(config.framework, {}).get("base", [])),
-            "orm": len(cls.ORM_DEPS.get(config.orm, {}).get("base", [])),
-            "testing": len(cls.TESTING_DEPS) if config.testing_suite else 0,
-            "auth": (
-                len(cls.FRAMEWORK_DEPS.get(config.framework, {}).get("auth", []))
-                if config.auth_enabled
-                else 0
-            ),
-        }
+        return cls.resolve(config).counts()
 
     @classmethod
     def check_dependency_conflicts(cls, deps: list[str]) -> list[str]:
         """
         Check for potential dependency conflicts
 
+        Requirements are parsed as PEP 508 and checked with
+        requirements.check_conflicts(): unsatisfiable specifiers (including
+        those implied by extras and the bundled package metadata), known
+        incompatible releases and mixed ORMs or frameworks.
+
         Args:
             deps: List of dependency strings
 
         Returns:
             List of potential conflicts/warnings
         """
-        warnings = []
-
-        # Extract package names (without versions)
-        packages = [dep.split(">=")[0].split("==")[0].lower() for dep in deps]
-
-        # Check for potential conflicts
-        if "sqlalchemy" in packages and "tortoise-orm" in packages:
-            warnings.append(
-                "Warning: Using both SQLAlchemy and TortoiseORM. " "Consider using only one ORM."
-            )
+        return check_conflicts(deps)
+
+
+@lru_cache(maxsize=128)
+def _resolve(
+    manager: type[DependencyManager],
+    framework: str,
+    orm: str,
+    database: str,
+    async_driver: bool,
+    auth_enabled: bool,
+    testing_suite: bool,
+) -> DependencySet:
+    """
+    Resolve the dependencies of a combination from a manager's constants
+
+    Args:
+        manager: DependencyManager (or subclass) providing the constants
+        framework: Framework name
+        orm: ORM name
+        database: Database name
+        async_driver: Whether to use the async database driver
+        auth_enabled: Whether authentication is enabled
+        testing_suite: Whether to include testing dependencies
+
+    Returns:
+        DependencySet
+    """
+    framework_deps = manager.FRAMEWORK_DEPS.get(framework, {})
+    orm_deps = manager.ORM_DEPS.get(orm, {})
+    db_drivers = manager.DB_DRIVERS.get(database, {})
+
+    sources = [
+        ("base", manager.BASE_DEPS),
+        ("framework", framework_deps.get("base", [])),
+        ("auth", framework_deps.get("auth", []) if auth_enabled else []),
+        # Always include production server
+        ("server", framework_deps.get("production", [])),
+        ("orm", [*orm_deps.get("base", []), *orm_deps.get(framework, [])]),
+        ("driver", db_drivers.get("async" if async_driver else "sync", [])),
+        ("testing", manager.TESTING_DEPS if testing_suite else []),
+        ("recommended", manager.RECOMMENDED_DEPS),
+    ]
 
-        if "django" in packages and any(p in packages for p in ["flask", "fastapi"]):
-            warnings.append(
-                "Warning: Mixing Django with other frameworks. "
-                "This is unusual and may cause conflicts."
+    # A package listed in several places keeps its first category; its
+    # requirements are merged into one
+    categories: dict[str, str] = {}
+    for category, requirements in sources:
+        for requirement in requirements:
+            categories.setdefault(canonicalize_name(parse_requirement(requirement).name), category)
+
+    merged = merge_requirements(
+        requirement for _, requirements in sources for requirement in requirements
+    )
+    return DependencySet(
+        tuple(
+            Dependency(
+                requirement, categories[canonicalize_name(parse_requirement(requirement).name)]
             )
-
-        return warnings
+            for requirement in sorted(merged)
+        )
+    )
@@ -0,0 +1,171 @@
+"""
+Structured generation events: phases, directories and files with timings
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from .output import OutputBackend
+
+EventKind = Literal[
+    "phase_started",
+    "phase_finished",
+    "directory_created",
+    "file_rendered",
+    "file_written",
+    "template_loaded",
+    "step_finished",
+]
+
+
+@dataclass(frozen=True)
+class GenerationEvent:
+    """
+    Something that happened while generating a project
+
+    Attributes:
+        kind: Event type
+        phase: Phase name ('structure', 'templates', 'framework_files', 'dependencies')
+        path: Directory or file the event is about
+        template: Template loaded or rendered
+        step: Named operation outside file writes ('git_init', 'git_add', ...)
+        duration: Seconds spent (load, render, write, step or phase time)
+        size: Bytes written or rendered
+        total: Number of files the phase will render (phase_started only, if known)
+        timestamp: time.perf_counter() when the event was emitted
+    """
+
+    kind: EventKind
+    phase: str | None = None
+    path: Path | None = None
+    template: str | None = None
+    step: str | None = None
+    duration: float = 0.0
+    size: int = 0
+    total: int | None = None
+    timestamp: float = field(default_factory=time.perf_counter)
+
+
+Listener = Callable[[GenerationEvent], None]
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe channel for generation events
+
+    Listeners are called in subscription order, one event at a time (emit
+    is safe to call from worker threads). Emitting without listeners costs
+    next to nothing.
+    """
+
+    def __init__(self, *listeners: Listener):
+        """
+        Initialize bus
+
+        Args:
+            listeners: Listeners to subscribe right away
+        """
+        self._listeners: list[Listener] = list(listeners)
+        self._lock = threading.RLock()
+
+    @property
+    def active(self) -> bool:
+        """Whether any listener is subscribed"""
+        return bool(self._listeners)
+
+    def subscribe(self, listener: Listener) -> Listener:
+        """Register a listener (returned, so this works as a decorator)"""
+        self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener: Listener):
+        """Remove a listener"""
+        self._listeners.remove(listener)
+
+    def emit(self, kind: EventKind, **fields):
+        """Build an event and deliver it to every listener"""
+        if not self._listeners:
+            return
+        event = GenerationEvent(kind, **fields)
+        with self._lock:
+            for listener in self._listeners:
+                listener(event)
+
+    @contextmanager
+    def phase(self, name: str, total: int | None = None) -> Iterator[None]:
+        """
+        Emit phase_started/phase_finished around a block
+
+        phase_finished is only emitted if the block succeeds.
+        """
+        self.emit("phase_started", phase=name, total=total)
+        start = time.perf_counter()
+        yield
+        self.emit("phase_finished", phase=name, duration=time.perf_counter() - start)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Emit step_finished after a block, with its duration
+
+        Steps time operations that are not file writes (subprocesses, git).
+        step_finished is only emitted if the block succeeds.
+        """
+        start = time.perf_counter()
+        yield
+        self.emit("step_finished", step=name, duration=time.perf_counter() - start)
+
+
+class EventedOutput(OutputBackend):
+    """Output backend proxy reporting directories and files to an EventBus"""
+
+    def __init__(self, inner: OutputBackend, events: EventBus):
+        """
+        Initialize proxy
+
+        Args:
+            inner: Backend doing the actual writes
+            events: Bus receiving directory_created/file_written events
+        """
+        super().__init__(inner.root)
+        self.inner = inner
+        self.events = events
+        self.on_disk = inner.on_disk
+        self.thread_safe = inner.thread_safe
+
+    def exists(self, path: Path | None = None) -> bool:
+        return self.inner.exists(path)
+
+    def create_root(self):
+        self.inner.create_root()
+        self.events.emit("directory_created", path=self.root)
+
+    def mkdir(self, path: Path):
+        self.inner.mkdir(path)
+        self.events.emit("directory_created", path=Path(path))
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        start = time.perf_counter()
+        self.inner.write_bytes(path, data, mode)
+        self.events.emit(
+            "file_written",
+            path=Path(path),
+            size=len(data),
+            duration=time.perf_counter() - start,
+        )
+
+    def touch(self, path: Path):
+        start = time.perf_counter()
+        self.inner.touch(path)
+        self.events.emit("file_written", path=Path(path), duration=time.perf_counter() - start)
+
+    def remove(self):
+        self.inner.remove()
+
+    def close(self):
+        self.inner.close()
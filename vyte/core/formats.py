@@ -0,0 +1,17 @@
+"""
+Archive formats projects can be streamed into
+
+Plain data, apart from output.py, so the CLI can offer the choices
+without importing tarfile and zipfile at startup.
+"""
+
+# Archive format -> tarfile stream mode (None for zip)
+ARCHIVE_FORMATS = {
+    "tar": "w|",
+    "tar.gz": "w|gz",
+    "tgz": "w|gz",
+    "tar.bz2": "w|bz2",
+    "tar.xz": "w|xz",
+    "zip": None,
+}
+DEFAULT_ARCHIVE_FORMAT = "tar.gz"
@@ -2,22 +2,38 @@
 Main project generator using Strategy Pattern
 """
 
-import shutil
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
 from ..exceptions import FileSystemError, GenerationError
 from ..strategies.django_rest import DjangoRestStrategy
 from ..strategies.fastapi import FastAPIStrategy
 from ..strategies.flask_restx import FlaskRestxStrategy
+from .cache import GenerationCache, RecordingOutput, cache_enabled
 from .config import ProjectConfig
 from .dependencies import DependencyManager
+from .events import EventBus, EventedOutput
+from .manifest import MANIFEST_PATH, ProjectManifest
+from .output import ArchiveOutput, DiskOutput, OutputBackend
+from .plan import COMMON_RULES, RenderPlan, compile_render_plan
 from .renderer import TemplateRegistry, TemplateRenderer
 
+if TYPE_CHECKING:
+    from .batch import GenerationResult
+
 
 class ProjectGenerator:
     """
     Main project generator
     Orchestrates the project creation using appropriate strategy
+
+    A generator is reentrant: one instance may run any number of generate()
+    calls concurrently from threads (or asyncio executors). Generation never
+    changes the working directory or other process-wide state, and only
+    reads the working directory when no output root or backend is given.
+    Shared state (compiled templates, render plans, the event bus) is
+    either immutable or guarded by locks.
     """
 
     # Strategy registry
@@ -27,22 +43,59 @@ class ProjectGenerator:
         "Django-Rest": DjangoRestStrategy,
     }
 
-    def __init__(self, template_dir: Path | None = None):
+    def __init__(
+        self,
+        template_dir: Path | None = None,
+        io_workers: int | None = None,
+        output_root: Path | str | None = None,
+        cache: bool = True,
+    ):
         """
         Initialize generator
 
         Args:
             template_dir: Optional custom templates directory
+            io_workers: Threads used to render and write files (default: automatic,
+                        1 = serial)
+            output_root: Directory projects are created in (default: the
+                         current working directory at generation time)
+            cache: Replay repeated generations from the on-disk generation
+                   cache (disabled when $VYTE_NO_CACHE is set)
         """
         self.renderer = TemplateRenderer(template_dir)
         self.template_dir = template_dir
-
-    def generate(self, config: ProjectConfig) -> Path:
+        self.io_workers = io_workers
+        self.output_root = Path(output_root).resolve() if output_root is not None else None
+        # Generator-wide hooks: listeners see every project this generator builds
+        self.events = EventBus()
+
+        # Rendered trees of previous generations, keyed by config and templates
+        self.cache: GenerationCache | None = None
+        if cache and cache_enabled():
+            try:
+                self.cache = GenerationCache()
+            except OSError:
+                # Unwritable cache location: render every project
+                self.cache = None
+
+    def generate(
+        self,
+        config: ProjectConfig,
+        output: OutputBackend | None = None,
+        events: EventBus | None = None,
+    ) -> Path:
         """
         Generate a complete project
 
         Args:
             config: Project configuration
+            output: Backend receiving the files (default: DiskOutput at
+                    get_output_path(config)). Pass a MemoryOutput to generate
+                    without touching disk.
+            events: Bus receiving progress events (phases, directories,
+                    templates, files and steps, with timings). Defaults to
+                    the generator-wide self.events. A generation replayed
+                    from the cache runs a single "cache" phase.
 
         Returns:
             Path to generated project directory
@@ -51,76 +104,283 @@ class ProjectGenerator:
             ValueError: If framework is not supported
             FileExistsError: If project directory already exists
         """
+        if output is None:
+            output = DiskOutput(self.get_output_path(config))
+        if events is None:
+            events = self.events
+        if events.active:
+            output = EventedOutput(output, events)
+
         # Get project path
-        project_path = config.get_output_path()
+        project_path = output.root
 
         # Verify directory doesn't exist
-        if project_path.exists():
+        if output.exists():
             raise FileExistsError(
                 f"Directory already exists: {project_path}\n"
                 "Please choose a different name or delete the existing directory."
             )
 
         # Create project directory
-        project_path.mkdir(parents=True)
+        output.create_root()
 
         try:
-            # Get appropriate strategy
-            strategy_class = self.STRATEGIES.get(config.framework)
-            if not strategy_class:
-                raise ValueError(
-                    f"Unsupported framework: {config.framework}\n"
-                    f"Supported frameworks: {', '.join(self.STRATEGIES.keys())}"
-                )
-
-            # Initialize strategy
-            strategy = strategy_class(config, self.renderer)
-
-            # Generate project structure
-            self._create_base_structure(project_path, config)
-
-            # Let strategy generate framework-specific files
-            strategy.generate_structure(project_path)
-            strategy.generate_files(project_path)
-
-            # Generate common files
-            self._generate_common_files(project_path, config)
-
-            # Generate dependencies
-            self._generate_dependencies(project_path, config)
-
-            # Generate Docker if enabled
-            if config.docker_support:
-                self._generate_docker_files(project_path, config)
-
+            # Replay an identical earlier generation
+            key = None
+            if self.cache is not None:
+                templates = self.get_render_plan(config).templates
+                key = self.cache.key(config, self.renderer, templates)
+            if key is not None:
+                cached = self.cache.load(key, project_path)
+                if cached is not None:
+                    with events.phase("cache"):
+                        cached.copy_into(output)
+                    output.close()
+                    return project_path
+
+            # Hash every file for the manifest; keep a copy only for the cache
+            recorder = output = RecordingOutput(output, keep_files=key is not None)
+            templates = self.populate(config, output, events)
+
+            # Record how every file was produced, for `vyte regenerate`
+            manifest = ProjectManifest.build(config, self.renderer, recorder.hashes, templates)
+            manifest_path = project_path / MANIFEST_PATH
+            output.mkdir(manifest_path.parent)
+            output.write_text(manifest_path, manifest.to_json())
+
+            output.close()
+            if key is not None:
+                self.cache.store(key, recorder.tree)
             return project_path
 
         except (OSError, PermissionError) as e:
             # Clean up on file system failure
-            if project_path.exists():
-                try:
-                    shutil.rmtree(project_path)
-                except (OSError, PermissionError):
-                    pass  # Best effort cleanup
+            output.remove()
             raise FileSystemError(f"Failed to create project structure: {e}") from e
         except (GenerationError, FileSystemError):
             # Re-raise our custom exceptions
-            if project_path.exists():
-                try:
-                    shutil.rmtree(project_path)
-                except (OSError, PermissionError):
-                    pass  # Best effort cleanup
+            output.remove()
             raise
         except Exception as e:
             # Clean up and wrap unexpected errors
-            if project_path.exists():
-                try:
-                    shutil.rmtree(project_path)
-                except (OSError, PermissionError):
-                    pass  # Best effort cleanup
+            output.remove()
             raise GenerationError(f"Project generation failed: {e}") from e
 
-    def _create_base_structure(self, project_path: Path, config: ProjectConfig):
+    def populate(
+        self,
+        config: ProjectConfig,
+        output: OutputBackend,
+        events: EventBus | None = None,
+        select: Callable[[str, Path], bool] | None = None,
+    ) -> dict[str, str]:
+        """
+        Write the files of a project into an output whose root exists
+
+        Args:
+            config: Project configuration
+            output: Backend receiving the files, rooted at the project path
+            events: Bus receiving phase and file events (default: self.events)
+            select: Optional predicate on (template, output_path) choosing
+                    which templated files to render; the others are skipped
+
+        Returns:
+            Template of every templated file in the plan, by path relative
+            to the project root (skipped files included)
+
+        Raises:
+            ValueError: If framework is not supported
+        """
+        if events is None:
+            events = self.events
+        project_path = output.root
+
+        # Get appropriate strategy
+        strategy_class = self.STRATEGIES.get(config.framework)
+        if not strategy_class:
+            raise ValueError(
+                f"Unsupported framework: {config.framework}\n"
+                f"Supported frameworks: {', '.join(self.STRATEGIES.keys())}"
+            )
+
+        # Initialize strategy
+        strategy = strategy_class(config, self.renderer, output, events)
+
+        # Generate project structure
+        with events.phase("structure"):
+            self._create_base_structure(output, project_path, config)
+            strategy.generate_structure(project_path)
+
+        # Render every templated file (framework, tests, common, Docker)
+        plan = self.get_render_plan(config)
+        context = config.model_dump_safe()
+        with events.phase("templates", total=len(plan)):
+            plan.execute(
+                self.renderer,
+                project_path,
+                context,
+                max_workers=self.io_workers,
+                output=output,
+                events=events,
+                select=select,
+            )
+
+        # Let strategy generate files that are not templated
+        with events.phase("framework_files"):
+            strategy.generate_files(project_path)
+
+        # Generate dependencies
+        with events.phase("dependencies"):
+            self._generate_dependencies(output, project_path, config)
+
+        return plan.destinations(context)
+
+    def regenerate(
+        self,
+        project_path: Path,
+        config: ProjectConfig | None = None,
+        dry_run: bool = False,
+        events: EventBus | None = None,
+    ):
+        """
+        Update an existing project after a template or configuration change
+
+        Only templates whose inputs changed are rendered, only files whose
+        content changed are written, and files the user edited are reported
+        instead of overwritten.
+
+        Args:
+            project_path: Root of a project generated by vyte
+            config: New configuration (default: the one recorded in the
+                    project's .vyte/manifest.json)
+            dry_run: Report what would change without writing anything
+            events: Bus receiving progress events (default: self.events)
+
+        Returns:
+            RegenerationReport
+
+        Raises:
+            ConfigurationError: If the project has no valid manifest
+        """
+        from .regenerate import regenerate_project
+
+        return regenerate_project(self, project_path, config, dry_run=dry_run, events=events)
+
+    def generate_archive(
+        self,
+        config: ProjectConfig,
+        target: str | Path | BinaryIO,
+        archive_format: str | None = None,
+    ) -> Path:
+        """
+        Generate a project straight into a tar or zip archive
+
+        Files are streamed into the archive as they are rendered; nothing is
+        written to the project directory.
+
+        Args:
+            config: Project configuration
+            target: Archive path or writable binary stream (e.g. stdout)
+            archive_format: 'tar.gz', 'zip', ... (default: from the target name)
+
+        Returns:
+            Project path the archive entries are rooted at
+        """
+        output = ArchiveOutput(self.get_output_path(config), target, archive_format)
+        return self.generate(config, output=output)
+
+    def init_git(
+        self,
+        project_path: Path,
+        output: OutputBackend | None = None,
+        use_cli: bool = False,
+        events: EventBus | None = None,
+    ) -> str:
+        """
+        Initialize a git repository with an initial commit of the project
+
+        The repository is written in-process (same objects as `git init`,
+        `git add .` and `git commit`), into the output the project was
+        generated into: a MemoryOutput gets its .git in memory.
+
+        Args:
+            project_path: Project root
+            output: Backend the project was generated into (default: disk)
+            use_cli: Run the git CLI instead (disk only)
+            events: Bus receiving a git_init step (default: self.events)
+
+        Returns:
+            Commit id
+
+        Raises:
+            GitError: If the repository cannot be created
+        """
+        from ..utils.git import initialize_repo
+
+        events = events if events is not None else self.events
+        with events.step("git_init"):
+            return initialize_repo(project_path, output=output, use_cli=use_cli)
+
+    def get_output_path(self, config: ProjectConfig) -> Path:
+        """Directory a project is generated into: <output_root>/<name>"""
+        return config.get_output_path(self.output_root)
+
+    def get_render_plan(self, config: ProjectConfig) -> RenderPlan:
+        """
+        Get the compiled render plan for a configuration
+
+        Plans are memoized per framework/ORM/flag combination.
+
+        Raises:
+            ValueError: If framework is not supported
+        """
+        strategy_class = self.STRATEGIES.get(config.framework)
+        if not strategy_class:
+            raise ValueError(
+                f"Unsupported framework: {config.framework}\n"
+                f"Supported frameworks: {', '.join(self.STRATEGIES.keys())}"
+            )
+
+        return compile_render_plan(
+            strategy_class.RENDER_RULES + COMMON_RULES,
+            config.framework,
+            config.orm,
+            config.auth_enabled,
+            config.testing_suite,
+            config.docker_support,
+        )
+
+    def generate_many(
+        self, configs: list["ProjectConfig | GenerationResult"], workers: int | None = None
+    ):
+        """
+        Generate several projects, fanning out across a process pool
+
+        Each worker process builds one generator and reuses its template
+        environment for every project it is handed. Failures are collected
+        per project instead of aborting the batch.
+
+        Args:
+            configs: Project configurations to generate, or failed results
+                     of invalid manifest entries (see load_manifest())
+            workers: Number of worker processes (default: CPU count, 1 = serial)
+
+        Returns:
+            BatchReport with one GenerationResult per config, in input order
+        """
+        from .batch import generate_many
+
+        return generate_many(
+            configs,
+            workers=workers,
+            template_dir=self.template_dir,
+            generator=self,
+            output_root=self.output_root,
+            cache=self.cache is not None,
+        )
+
+    def _create_base_structure(
+        self, output: OutputBackend, project_path: Path, config: ProjectConfig
+    ):
         """Create basic directory structure"""
 
         # Django tiene su propia estructura, skip base structure
@@ -128,8 +388,8 @@ class ProjectGenerator:
             # Solo crear tests/ si tiene testing
             if config.testing_suite:
                 tests_dir = project_path / "tests"
-                tests_dir.mkdir(exist_ok=True)
-                (tests_dir / "__init__.py").touch()
+                output.mkdir(tests_dir)
+                output.touch(tests_dir / "__init__.py")
             return
 
         # Para Flask y FastAPI, crear estructura src/
@@ -146,104 +406,47 @@ class ProjectGenerator:
             dirs.extend(["tests", "tests/integration"])
 
         for dir_name in dirs:
-            (project_path / dir_name).mkdir(parents=True, exist_ok=True)
+            output.mkdir(project_path / dir_name)
 
             # Create __init__.py in Python packages
             if dir_name.startswith("src/") or dir_name == "tests":
-                (project_path / dir_name / "__init__.py").touch()
+                output.touch(project_path / dir_name / "__init__.py")
 
-    def _generate_common_files(self, project_path: Path, config: ProjectConfig):
-        """Generate files common to all projects"""
-        context = config.model_dump_safe()
-
-        # .gitignore
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["gitignore"], project_path / ".gitignore", context
-        )
-
-        # .env.example
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["env_example"], project_path / ".env.example", context
-        )
-
-        # README.md
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["readme"], project_path / "README.md", context
-        )
-
-        # LICENSE
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["license"], project_path / "LICENSE", context
-        )
-
-        # security.py (if auth enabled)
-        if config.auth_enabled:
-            # Para Django-Rest, crear en la raíz del proyecto
-            if config.framework == "Django-Rest":
-                security_path = project_path / "security.py"
-            else:
-                # Para Flask y FastAPI, crear en src/
-                security_path = project_path / "src" / "security.py"
-
-                self.renderer.render_to_file(
-                    TemplateRegistry.COMMON_TEMPLATES["security"], security_path, context
-                )
-
-        # pyproject.toml (modern Python packaging)
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["pyproject_toml"],
-            project_path / "pyproject.toml",
-            context,
-        )
-
-        # pytest.ini (common test configuration) - place at project root
-        if config.testing_suite:
-            self.renderer.render_to_file(
-                TemplateRegistry.COMMON_TEMPLATES["pytest_ini"],
-                project_path / "pytest.ini",
-                context,
-            )
-
-    def _generate_dependencies(self, project_path: Path, config: ProjectConfig):
+    def _generate_dependencies(
+        self, output: OutputBackend, project_path: Path, config: ProjectConfig
+    ):
         """Generate dependency files"""
         # requirements.txt
-        DependencyManager.write_requirements_txt(config, project_path)
-
-        # requirements-dev.txt
-        DependencyManager.write_requirements_dev_txt(project_path)
-
-    def _generate_docker_files(self, project_path: Path, config: ProjectConfig):
-        """Generate Docker configuration"""
-        context = config.model_dump_safe()
-
-        # Dockerfile
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["dockerfile"], project_path / "Dockerfile", context
+        output.write_text(
+            project_path / "requirements.txt", DependencyManager.render_requirements_txt(config)
         )
 
-        # docker-compose.yml
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["docker_compose"],
-            project_path / "docker-compose.yml",
-            context,
-        )
-
-        # .dockerignore
-        self.renderer.render_to_file(
-            TemplateRegistry.COMMON_TEMPLATES["dockerignore"],
-            project_path / ".dockerignore",
-            context,
+        # requirements-dev.txt
+        output.write_text(
+            project_path / "requirements-dev.txt", DependencyManager.render_requirements_dev_txt()
         )
 
-    def validate_before_generate(self, config: ProjectConfig) -> tuple[bool, list[str]]:
+    def validate_before_generate(
+        self, config: ProjectConfig, output: OutputBackend | None = None
+    ) -> tuple[bool, list[str]]:
         """
         Validate configuration before generating
 
+        Args:
+            config: Project configuration
+            output: Backend the project will be generated into (default: the
+                    project directory). An existing directory only matters
+                    to backends writing to disk.
+
         Returns:
             (is_valid, list_of_errors)
         """
         errors = []
 
+        output_path = self.get_output_path(config)
+        if (output is None or output.on_disk) and output_path.exists():
+            errors.append(f"Directory already exists: {output_path}")
+
         # Check if templates exist
         templates_exist, missing = TemplateRegistry.validate_templates_exist(
             self.renderer, config.framework, config.orm
@@ -289,7 +492,7 @@ class ProjectGenerator:
             },
             "dependencies": deps_info,
             "templates_count": len(templates),
-            "output_path": str(config.get_output_path()),
+            "output_path": str(self.get_output_path(config)),
         }
 
 
@@ -332,4 +535,7 @@ def quick_generate(
     )
 
     generator = ProjectGenerator()
-    return generator.generate(config)
+    project_path = generator.generate(config)
+    if git:
+        generator.init_git(project_path)
+    return project_path
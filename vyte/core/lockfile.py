@@ -0,0 +1,532 @@
+"""
+Offline lockfiles: pinned, hashed requirements resolved against a local package index
+"""
+
+import hashlib
+import platform
+import tarfile
+import zipfile
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from email.message import Message
+from email.parser import HeaderParser
+from pathlib import Path
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.tags import Tag, compatible_tags, cpython_tags, sys_tags
+from packaging.utils import (
+    InvalidSdistFilename,
+    InvalidWheelFilename,
+    NormalizedName,
+    canonicalize_name,
+    parse_sdist_filename,
+    parse_wheel_filename,
+)
+from packaging.version import Version
+
+from ..exceptions import DependencyError
+
+LOCKFILE_NAME = "requirements.lock"
+
+# Source distributions the index understands, besides wheels
+SDIST_SUFFIXES = (".tar.gz", ".zip")
+
+# Rounds of re-pinning (and backing off conflicting pins) before giving up
+MAX_ROUNDS = 200
+
+# glibc of the python:X.Y-slim images (Debian bookworm) generated Dockerfiles use
+TARGET_GLIBC = (2, 36)
+
+# Legacy manylinux tags and the glibc version they stand for
+LEGACY_MANYLINUX = {(2, 17): "manylinux2014", (2, 12): "manylinux2010", (2, 5): "manylinux1"}
+
+# Requirement source shown in "via" annotations for top-level requirements
+ROOT = "-r requirements.txt"
+
+
+def target_environment(python_version: str | None = None) -> dict[str, str]:
+    """
+    Marker environment of the machine a lockfile is installed on
+
+    Args:
+        python_version: "X.Y" of the target interpreter (default: this one).
+                        Given a version, the target is a Linux container, as
+                        in the generated Dockerfile.
+
+    Returns:
+        PEP 508 marker environment
+    """
+    environment = default_environment()
+    if python_version is not None:
+        environment.update(
+            python_version=python_version,
+            python_full_version=f"{python_version}.0",
+            implementation_name="cpython",
+            platform_python_implementation="CPython",
+            os_name="posix",
+            sys_platform="linux",
+            platform_system="Linux",
+        )
+    return environment
+
+
+def target_tags(python_version: str | None = None) -> frozenset[Tag]:
+    """
+    Wheel tags installable on the machine a lockfile is installed on
+
+    Args:
+        python_version: "X.Y" of the target interpreter (default: this one).
+                        Given a version, the target is a CPython Linux
+                        container (see target_environment) on this machine's
+                        architecture.
+
+    Returns:
+        Supported tags
+    """
+    if python_version is None:
+        return frozenset(sys_tags())
+
+    major, minor = (int(part) for part in python_version.split(".")[:2])
+    arch = platform.machine().lower()
+    arch = {"amd64": "x86_64", "arm64": "aarch64"}.get(arch, arch)
+    platforms = []
+    for glibc_minor in range(TARGET_GLIBC[1], 4, -1):
+        platforms.append(f"manylinux_{TARGET_GLIBC[0]}_{glibc_minor}_{arch}")
+        legacy = LEGACY_MANYLINUX.get((TARGET_GLIBC[0], glibc_minor))
+        if legacy:
+            platforms.append(f"{legacy}_{arch}")
+    platforms.append(f"linux_{arch}")
+
+    return frozenset(
+        [
+            *cpython_tags(python_version=(major, minor), platforms=platforms),
+            *compatible_tags(
+                python_version=(major, minor), interpreter=f"cp{major}{minor}", platforms=platforms
+            ),
+        ]
+    )
+
+
+def read_requirements(path: Path) -> list[str]:
+    """
+    Requirements listed in a requirements file
+
+    Comments, blank lines and pip options (-r, --index-url, ...) are skipped.
+    """
+    requirements = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if line and not line.startswith(("#", "-")):
+            requirements.append(line)
+    return requirements
+
+
+class PackageIndex:
+    """
+    Package index snapshot: a directory of wheels and source distributions
+
+    Any layout works, flat (``pip download -d DIR``, a wheel cache) or nested
+    (a PEP 503 mirror with one directory per project): every distribution
+    file below the directory is found. Files are hashed and their metadata
+    read once, on first use.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize index
+
+        Args:
+            directory: Snapshot directory
+
+        Raises:
+            DependencyError: If the directory doesn't exist
+        """
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise DependencyError(f"Package index directory not found: {self.directory}")
+        self._files: dict[NormalizedName, dict[Version, list[Path]]] | None = None
+        self._metadata: dict[tuple[NormalizedName, Version], Message] = {}
+        self._requires: dict[tuple[NormalizedName, Version], list[Requirement]] = {}
+        self._hashes: dict[Path, str] = {}
+
+    @property
+    def files(self) -> dict[NormalizedName, dict[Version, list[Path]]]:
+        """Distribution files by project and version"""
+        if self._files is None:
+            files: dict[NormalizedName, dict[Version, list[Path]]] = {}
+            for path in sorted(self.directory.rglob("*")):
+                parsed = _parse_filename(path.name) if path.is_file() else None
+                if parsed is not None:
+                    name, version = parsed
+                    files.setdefault(name, {}).setdefault(version, []).append(path)
+            self._files = files
+        return self._files
+
+    def versions(self, name: str) -> list[Version]:
+        """Versions of a project in the index, newest first"""
+        return sorted(self.files.get(canonicalize_name(name), {}), reverse=True)
+
+    def hashes(self, name: str, version: Version) -> list[str]:
+        """SHA-256 of every file of a release, sorted"""
+        digests = []
+        for path in self.files[canonicalize_name(name)][version]:
+            if path not in self._hashes:
+                with open(path, "rb") as f:
+                    self._hashes[path] = hashlib.file_digest(f, "sha256").hexdigest()
+            digests.append(self._hashes[path])
+        return sorted(digests)
+
+    def installable(self, name: str, version: Version, tags: Collection[Tag]) -> bool:
+        """Check if a release has a source distribution, or a wheel for one of the tags"""
+        for path in self.files[canonicalize_name(name)][version]:
+            if not path.name.endswith(".whl"):
+                return True
+            if not parse_wheel_filename(path.name)[3].isdisjoint(tags):
+                return True
+        return False
+
+    def metadata(self, name: str, version: Version) -> Message:
+        """
+        Core metadata of a release
+
+        Read from a wheel if there is one, else from a source distribution's
+        PKG-INFO.
+
+        Raises:
+            DependencyError: If no file of the release has readable metadata
+        """
+        key = (canonicalize_name(name), version)
+        if key not in self._metadata:
+            paths = sorted(self.files[key[0]][version], key=lambda p: not p.name.endswith(".whl"))
+            for path in paths:
+                metadata = _read_metadata(path)
+                if metadata is not None:
+                    break
+            else:
+                raise DependencyError(
+                    f"No readable metadata for {name} {version} in {self.directory}"
+                )
+            self._metadata[key] = HeaderParser().parsestr(metadata)
+        return self._metadata[key]
+
+    def requires(self, name: str, version: Version) -> list[Requirement]:
+        """
+        Requirements declared by a release (Requires-Dist), markers included
+
+        Raises:
+            DependencyError: If the metadata is missing or invalid
+        """
+        key = (canonicalize_name(name), version)
+        if key not in self._requires:
+            try:
+                self._requires[key] = [
+                    Requirement(line)
+                    for line in self.metadata(name, version).get_all("Requires-Dist", [])
+                ]
+            except InvalidRequirement as e:
+                raise DependencyError(f"Invalid requirement in {name} {version}: {e}") from e
+        return self._requires[key]
+
+    def requires_python(self, name: str, version: Version) -> SpecifierSet:
+        """
+        Python versions a release supports (Requires-Python; empty if any)
+
+        Raises:
+            DependencyError: If the metadata is missing or invalid
+        """
+        value = self.metadata(name, version).get("Requires-Python") or ""
+        try:
+            return SpecifierSet(value)
+        except InvalidSpecifier as e:
+            raise DependencyError(f"Invalid Requires-Python in {name} {version}: {e}") from e
+
+
+@dataclass(frozen=True)
+class LockedPackage:
+    """
+    One pinned package of a lockfile
+
+    Attributes:
+        name: Canonical project name
+        version: Pinned version
+        extras: Extras requested for it
+        hashes: SHA-256 of every file of the release
+        via: What requires it (project names, or ROOT)
+    """
+
+    name: str
+    version: Version
+    extras: tuple[str, ...]
+    hashes: tuple[str, ...]
+    via: tuple[str, ...]
+
+    @property
+    def requirement(self) -> str:
+        """Pinned requirement, e.g. uvicorn[standard]==0.27.0"""
+        extras = f"[{','.join(self.extras)}]" if self.extras else ""
+        return f"{self.name}{extras}=={self.version}"
+
+
+@dataclass(frozen=True)
+class Lockfile:
+    """Pinned requirements with hashes, sorted by name"""
+
+    packages: tuple[LockedPackage, ...]
+
+    def to_text(self) -> str:
+        """
+        Serialize in the pip-tools ``--generate-hashes`` format
+
+        Installable with ``pip install --require-hashes -r requirements.lock``.
+        Output only depends on the requirements and the index content.
+        """
+        lines = [
+            "#",
+            "# Generated by vyte from requirements.txt against a local package index.",
+            "# Install offline with:",
+            "#",
+            "#    pip install --no-index --find-links <index> --require-hashes -r requirements.lock",
+            "#",
+        ]
+        for package in self.packages:
+            lines.append(f"{package.requirement} \\")
+            lines.extend(
+                f"    --hash=sha256:{digest}" + (" \\" if i < len(package.hashes) - 1 else "")
+                for i, digest in enumerate(package.hashes)
+            )
+            if len(package.via) == 1:
+                lines.append(f"    # via {package.via[0]}")
+            else:
+                lines.append("    # via")
+                lines.extend(f"    #   {parent}" for parent in package.via)
+        return "\n".join(lines) + "\n"
+
+
+def resolve_lockfile(
+    requirements: Iterable[str],
+    index: PackageIndex,
+    environment: dict[str, str] | None = None,
+    tags: Collection[Tag] | None = None,
+) -> Lockfile:
+    """
+    Pin requirements and everything they depend on to releases of an index
+
+    Each project gets the newest version allowed by every requirement on it
+    (pre-releases only if nothing else matches) that installs on the target:
+    its Requires-Python accepts the target Python, and it has a source
+    distribution or a wheel for one of the target tags. Pins are refined
+    until the requirements of the pinned releases stop changing. When the
+    pinned releases conflict, the release requiring the conflicting version
+    is excluded and an older one tried; no network access.
+
+    Args:
+        requirements: Top-level requirement strings
+        index: Package index snapshot
+        environment: Marker environment (default: target_environment())
+        tags: Wheel tags of the target (default: target_tags())
+
+    Returns:
+        Lockfile
+
+    Raises:
+        DependencyError: If a requirement is invalid, or no release of the
+                         index satisfies it
+    """
+    if environment is None:
+        environment = target_environment()
+    if tags is None:
+        tags = target_tags()
+    try:
+        roots = [Requirement(requirement) for requirement in requirements]
+    except InvalidRequirement as e:
+        raise DependencyError(f"Invalid requirement: {e}") from e
+
+    pins: dict[NormalizedName, Version] = {}
+    excluded: dict[NormalizedName, set[Version]] = {}
+    conflict: _ConflictError | None = None
+    for _ in range(MAX_ROUNDS):
+        wanted = _collect(roots, pins, index, environment)
+        try:
+            chosen = {
+                name: _choose(name, wanted[name][1], index, environment, tags, excluded.get(name))
+                for name in wanted
+            }
+        except _ConflictError as e:
+            conflict = conflict or e
+            culprit = _culprit(e, pins, index)
+            if culprit is None:
+                # Report the first conflict: later ones come from backing off
+                raise DependencyError(str(conflict)) from None
+            excluded.setdefault(culprit, set()).add(pins.pop(culprit))
+            continue
+        if chosen == pins:
+            break
+        pins = chosen
+    else:
+        raise DependencyError(f"Requirements did not settle after {MAX_ROUNDS} rounds")
+
+    return Lockfile(
+        tuple(
+            LockedPackage(
+                name=name,
+                version=version,
+                extras=tuple(sorted(wanted[name][0])),
+                hashes=tuple(index.hashes(name, version)),
+                via=tuple(sorted(wanted[name][2], key=lambda parent: (parent != ROOT, parent))),
+            )
+            for name, version in sorted(pins.items())
+        )
+    )
+
+
+def _collect(
+    roots: list[Requirement],
+    pins: dict[NormalizedName, Version],
+    index: PackageIndex,
+    environment: dict[str, str],
+) -> dict[NormalizedName, tuple[set[str], list[tuple[Requirement, str]], set[str]]]:
+    """
+    Requirements applying to each project, given the current pins
+
+    Returns:
+        Extras, (requirement, required by) pairs and parents, by project
+    """
+    wanted: dict[NormalizedName, tuple[set[str], list[tuple[Requirement, str]], set[str]]] = {}
+    pending: list[tuple[Requirement, str, set[str]]] = [(root, ROOT, {""}) for root in roots]
+    visited: set[tuple[NormalizedName, frozenset[str]]] = set()
+
+    while pending:
+        requirement, parent, parent_extras = pending.pop(0)
+        if requirement.marker is not None and not any(
+            requirement.marker.evaluate({**environment, "extra": extra}) for extra in parent_extras
+        ):
+            continue
+        if requirement.url:
+            raise DependencyError(f"Cannot lock direct reference '{requirement}'")
+
+        name = canonicalize_name(requirement.name)
+        extras, constraints, parents = wanted.setdefault(name, (set(), [], set()))
+        extras.update(requirement.extras)
+        constraints.append((requirement, parent))
+        parents.add(parent)
+
+        key = (name, frozenset(extras))
+        if name not in pins or key in visited:
+            continue
+        visited.add(key)
+        pending.extend(
+            (dependency, name, extras | {""}) for dependency in index.requires(name, pins[name])
+        )
+    return wanted
+
+
+class _ConflictError(DependencyError):
+    """Raised when no release of a project satisfies the current constraints"""
+
+    def __init__(self, message: str, name: NormalizedName, constraints: list):
+        super().__init__(message)
+        self.name = name
+        self.constraints = constraints
+
+
+def _choose(
+    name: NormalizedName,
+    constraints: list[tuple[Requirement, str]],
+    index: PackageIndex,
+    environment: dict[str, str],
+    tags: Collection[Tag],
+    excluded: set[Version] | None = None,
+) -> Version:
+    """Newest installable version of a project satisfying every constraint"""
+    versions = index.versions(name)
+    if not versions:
+        parents = ", ".join(sorted({parent for _, parent in constraints}))
+        raise DependencyError(f"{name} (required by {parents}) is not in {index.directory}")
+
+    python = environment["python_full_version"]
+    skipped = []
+    for version in sorted(_allowed(constraints, versions), reverse=True):
+        if excluded and version in excluded:
+            continue
+        if not index.installable(name, version, tags):
+            skipped.append(f"{version} (no wheel for the target)")
+        elif python not in index.requires_python(name, version):
+            requires_python = index.requires_python(name, version)
+            skipped.append(f"{version} (Requires-Python {requires_python})")
+        else:
+            return version
+
+    details = "; ".join(f"{requirement} (from {parent})" for requirement, parent in constraints)
+    message = f"No release of {name} in {index.directory} satisfies {details}\n"
+    if skipped:
+        message += f"Not installable on Python {python}: {', '.join(skipped)}\n"
+    message += f"Available: {', '.join(str(version) for version in versions)}"
+    raise _ConflictError(message, name, constraints)
+
+
+def _allowed(constraints: list[tuple[Requirement, str]], versions: list[Version]) -> list[Version]:
+    """Versions satisfying every constraint"""
+    specifier = SpecifierSet()
+    for requirement, _ in constraints:
+        specifier &= requirement.specifier
+    return list(specifier.filter(versions))
+
+
+def _culprit(
+    conflict: _ConflictError, pins: dict[NormalizedName, Version], index: PackageIndex
+) -> NormalizedName | None:
+    """
+    Pinned project to back off from to get past a conflict
+
+    The first pinned parent without whose requirement the constraints can
+    be satisfied, else the first pinned parent; None when only top-level
+    requirements are involved.
+    """
+    parents = sorted({parent for _, parent in conflict.constraints if parent in pins})
+    versions = index.versions(conflict.name)
+    for parent in parents:
+        others = [(requirement, by) for requirement, by in conflict.constraints if by != parent]
+        if _allowed(others, versions):
+            return parent
+    return parents[0] if parents else None
+
+
+def _parse_filename(filename: str) -> tuple[NormalizedName, Version] | None:
+    """Project and version of a distribution file name, or None for other files"""
+    try:
+        if filename.endswith(".whl"):
+            name, version, _, _ = parse_wheel_filename(filename)
+            return name, version
+        if filename.endswith(SDIST_SUFFIXES):
+            return parse_sdist_filename(filename)
+    except (InvalidWheelFilename, InvalidSdistFilename):
+        pass
+    return None
+
+
+def _read_metadata(path: Path) -> str | None:
+    """Core metadata of a wheel (METADATA) or source distribution (PKG-INFO)"""
+    try:
+        if path.name.endswith(".whl") or path.name.endswith(".zip"):
+            with zipfile.ZipFile(path) as archive:
+                member = _metadata_member(archive.namelist(), path.name.endswith(".whl"))
+                return archive.read(member).decode("utf-8") if member else None
+        with tarfile.open(path) as archive:
+            member = _metadata_member(archive.getnames(), wheel=False)
+            extracted = archive.extractfile(member) if member else None
+            return extracted.read().decode("utf-8") if extracted else None
+    except (OSError, zipfile.BadZipFile, tarfile.TarError, UnicodeDecodeError):
+        return None
+
+
+def _metadata_member(names: list[str], wheel: bool) -> str | None:
+    """Archive member holding the core metadata"""
+    for name in names:
+        parts = name.split("/")
+        if wheel and len(parts) == 2 and parts[0].endswith(".dist-info") and parts[1] == "METADATA":
+            return name
+        if not wheel and len(parts) == 2 and parts[1] == "PKG-INFO":
+            return name
+    return None
@@ -0,0 +1,229 @@
+"""
+Project manifests: what vyte generated, from which inputs
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..__version__ import __version__
+from ..exceptions import ConfigurationError
+from .config import ProjectConfig
+from .renderer import TemplateRenderer
+
+# Manifest location inside generated projects
+MANIFEST_PATH = ".vyte/manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 of file content, as recorded in manifests"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def render_context(config: ProjectConfig, renderer: TemplateRenderer) -> dict[str, Any]:
+    """
+    Everything templates of a project can read: the config and the globals
+
+    Args:
+        config: Project configuration
+        renderer: Renderer the project is rendered with
+
+    Returns:
+        JSON-serializable context (config.model_dump_safe() plus `year`)
+    """
+    return {**config.model_dump_safe(), "year": renderer.env.globals.get("year")}
+
+
+def context_hash(context: dict[str, Any]) -> str:
+    """SHA-256 of a render context"""
+    return hashlib.sha256(json.dumps(context, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class FileRecord:
+    """
+    How one generated file was produced
+
+    Attributes:
+        output: SHA-256 of the content vyte generated
+        context: Hash of the render context the content is valid for
+        template: Template rendered into the file (None for files that are
+                  not templated, like __init__.py or requirements.txt)
+        source: SHA-256 of the template source
+    """
+
+    output: str
+    context: str
+    template: str | None = None
+    source: str | None = None
+
+
+@dataclass
+class ProjectManifest:
+    """
+    Record of a generated project, stored at .vyte/manifest.json
+
+    Lets `vyte regenerate` tell which files must be rendered again (their
+    template or the context values it reads changed) and which ones the
+    user edited since (their content no longer matches ``output``).
+    """
+
+    config: dict[str, Any]
+    context: dict[str, Any]
+    files: dict[str, FileRecord] = field(default_factory=dict)
+    vyte: str = __version__
+
+    @classmethod
+    def build(
+        cls,
+        config: ProjectConfig,
+        renderer: TemplateRenderer,
+        hashes: dict[str, str],
+        templates: dict[str, str],
+    ) -> "ProjectManifest":
+        """
+        Describe a freshly generated project
+
+        Args:
+            config: Project configuration
+            renderer: Renderer the project was rendered with
+            hashes: SHA-256 of every file of the project, by relative path
+            templates: Template of each templated file, by relative path
+
+        Returns:
+            Manifest of the project
+        """
+        context = render_context(config, renderer)
+        digest = context_hash(context)
+        files = {}
+        for relative in sorted(hashes):
+            if relative == MANIFEST_PATH:
+                continue
+            template = templates.get(relative)
+            files[relative] = FileRecord(
+                output=hashes[relative],
+                context=digest,
+                template=template,
+                source=renderer.source_hash(template) if template else None,
+            )
+        return cls(config=config.model_dump(mode="json"), context=context, files=files)
+
+    @classmethod
+    def load(cls, project_path: Path) -> "ProjectManifest":
+        """
+        Read the manifest of a generated project
+
+        Raises:
+            ConfigurationError: If the project has no manifest, or it is invalid
+                                (including file paths outside the project)
+        """
+        path = Path(project_path) / MANIFEST_PATH
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise ConfigurationError(
+                f"No vyte manifest found at {path}\n"
+                "Only projects generated by this version of vyte or later can be regenerated."
+            ) from e
+        except (OSError, ValueError) as e:
+            raise ConfigurationError(f"Invalid vyte manifest {path}: {e}") from e
+
+        try:
+            if document["format"] != MANIFEST_FORMAT:
+                raise ConfigurationError(
+                    f"Unsupported vyte manifest format {document['format']} in {path}"
+                )
+            root = Path(project_path).resolve()
+            for relative in document["files"]:
+                if not (root / relative).resolve().is_relative_to(root):
+                    raise ConfigurationError(
+                        f"Invalid vyte manifest {path}: {relative!r} is outside the project"
+                    )
+            return cls(
+                config=document["config"],
+                context=document["context"],
+                files={
+                    relative: FileRecord(**record) for relative, record in document["files"].items()
+                },
+                vyte=document["vyte"],
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ConfigurationError(f"Invalid vyte manifest {path}: {e}") from e
+
+    def to_json(self) -> str:
+        """
+        Serialize the manifest
+
+        Output is deterministic (so projects cache and diff well), with one
+        line per file.
+        """
+        head = {
+            "format": MANIFEST_FORMAT,
+            "vyte": self.vyte,
+            "config": dict(sorted(self.config.items())),
+            "context": dict(sorted(self.context.items())),
+        }
+        # Hashes are hex digests; only paths need JSON escaping
+        files = ",\n".join(
+            f'    {json.dumps(relative)}: {{"output": "{record.output}", '
+            f'"context": "{record.context}", "template": {json.dumps(record.template)}, '
+            f'"source": {json.dumps(record.source)}}}'
+            for relative, record in sorted(self.files.items())
+        )
+        # Close the head object after appending the files
+        return json.dumps(head, indent=2)[:-2] + f',\n  "files": {{\n{files}\n  }}\n}}\n'
+
+    def project_config(self, **overrides: Any) -> ProjectConfig:
+        """
+        Configuration the project was generated with
+
+        Args:
+            **overrides: Fields to change (e.g. auth_enabled=False)
+
+        Raises:
+            ConfigurationError: If the resulting configuration is invalid
+        """
+        try:
+            return ProjectConfig(**{**self.config, **overrides})
+        except PydanticValidationError as e:
+            raise ConfigurationError(f"Invalid project configuration: {e}") from e
+
+    def needs_render(
+        self, relative: str, template: str, renderer: TemplateRenderer, context: dict[str, Any]
+    ) -> bool:
+        """
+        Check if a templated file must be rendered again
+
+        A file is up to date when it was rendered from the same template
+        source, by the same vyte version, and no context value the template
+        reads has changed. Files whose update a user edit kept back at an
+        earlier regeneration are never up to date.
+
+        Args:
+            relative: File path relative to the project root
+            template: Template the file is rendered from now
+            renderer: Renderer the project is regenerated with
+            context: New render context (from render_context())
+        """
+        record = self.files.get(relative)
+        if record is None or record.template != template or self.vyte != __version__:
+            return True
+        if record.source != renderer.source_hash(template):
+            return True
+        if record.context == context_hash(context):
+            return False
+        if record.context != context_hash(self.context):
+            # Kept back by a user edit at an earlier regeneration
+            return True
+
+        changed = {
+            name
+            for name in self.context.keys() | context.keys()
+            if self.context.get(name) != context.get(name)
+        }
+        return bool(changed & renderer.template_variables(template))
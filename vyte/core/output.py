@@ -0,0 +1,546 @@
+"""
+Output backends: where generated project files are written
+"""
+
+import importlib
+import importlib.abc
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from ..exceptions import ConfigurationError, FileSystemError
+from .formats import ARCHIVE_FORMATS, DEFAULT_ARCHIVE_FORMAT
+
+
+class OutputBackend(ABC):
+    """
+    Abstract destination for a generated project
+
+    Paths passed to a backend are absolute paths under ``root`` (the
+    project path), exactly like the paths the generator builds for the real
+    disk, so strategies stay agnostic of where files end up.
+    """
+
+    # True if files land on the real filesystem as they are written
+    on_disk = False
+
+    # False if writes must happen one at a time, in order
+    thread_safe = True
+
+    def __init__(self, root: Path):
+        """
+        Initialize backend
+
+        Args:
+            root: Project root path
+        """
+        self.root = Path(root)
+        self._root_prefix = os.path.join(os.fspath(self.root), "")
+
+    def relative(self, path: Path) -> str:
+        """
+        Get a path relative to the project root, in POSIX form
+
+        Raises:
+            FileSystemError: If the path is outside the project root
+        """
+        # Fast path for the paths generation builds: <root>/<relative>
+        text = os.fspath(path)
+        if (
+            text.startswith(self._root_prefix)
+            and os.sep + "." not in text
+            and os.sep * 2 not in text
+            and not text.endswith(os.sep)
+        ):
+            return text[len(self._root_prefix) :].replace(os.sep, "/")
+
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError as e:
+            raise FileSystemError(f"Path {path} is outside project root {self.root}") from e
+
+    @abstractmethod
+    def exists(self, path: Path | None = None) -> bool:
+        """Check if the project root (or a path inside it) exists"""
+
+    @abstractmethod
+    def create_root(self):
+        """
+        Create the project root
+
+        Raises:
+            FileExistsError: If the project root already exists
+        """
+
+    @abstractmethod
+    def mkdir(self, path: Path):
+        """Create a directory (and its parents) if it doesn't exist"""
+
+    @abstractmethod
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        """
+        Write a file, creating parent directories as needed
+
+        Args:
+            path: Destination path under the project root
+            data: File content
+            mode: Optional permission bits (e.g. 0o755 for scripts)
+        """
+
+    @abstractmethod
+    def touch(self, path: Path):
+        """Create an empty file if it doesn't exist"""
+
+    @abstractmethod
+    def remove(self):
+        """Discard everything written so far (best effort cleanup on failure)"""
+
+    def write_text(self, path: Path, content: str, mode: int | None = None):
+        """Write a UTF-8 text file"""
+        self.write_bytes(path, content.encode("utf-8"), mode)
+
+    def close(self):  # noqa: B027 - optional hook
+        """Finish writing (no-op for backends that write eagerly)"""
+
+
+class DiskOutput(OutputBackend):
+    """Writes files straight to the filesystem"""
+
+    on_disk = True
+
+    def exists(self, path: Path | None = None) -> bool:
+        return (self.root if path is None else Path(path)).exists()
+
+    def create_root(self):
+        self.root.mkdir(parents=True)
+
+    def mkdir(self, path: Path):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        path = Path(path)
+        path.write_bytes(data)
+        if mode is not None:
+            path.chmod(mode)
+
+    def touch(self, path: Path):
+        Path(path).touch()
+
+    def remove(self):
+        if self.root.exists():
+            try:
+                shutil.rmtree(self.root)
+            except (OSError, PermissionError):
+                pass  # Best effort cleanup
+
+
+class MemoryOutput(OutputBackend):
+    """
+    Keeps the generated tree in memory
+
+    The tree can be inspected (``files``, ``read_text``), imported
+    (``activate_imports``) and later written out in one bulk operation to
+    disk (``materialize``), a tarball (``to_tar``) or a zip (``to_zip``).
+    Safe to write from several threads.
+    """
+
+    DEFAULT_FILE_MODE = 0o644
+
+    def __init__(self, root: Path):
+        super().__init__(root)
+        self.files: dict[str, bytes] = {}
+        self.modes: dict[str, int] = {}
+        self.directories: set[str] = set()
+        self._created = False
+        self._lock = threading.Lock()
+
+    def exists(self, path: Path | None = None) -> bool:
+        if path is None:
+            return self._created
+        relative = self.relative(path)
+        return relative in ("", ".") or relative in self.files or relative in self.directories
+
+    def create_root(self):
+        if self._created:
+            raise FileExistsError(f"Directory already exists: {self.root}")
+        self._created = True
+
+    def _add_parents(self, relative: str):
+        """Record every ancestor directory of a relative path"""
+        parent = relative.rpartition("/")[0]
+        # Ancestors of a known directory are known too
+        while parent and parent not in self.directories:
+            self.directories.add(parent)
+            parent = parent.rpartition("/")[0]
+
+    def mkdir(self, path: Path):
+        relative = self.relative(path)
+        if relative in ("", "."):
+            return
+        with self._lock:
+            self.directories.add(relative)
+            self._add_parents(relative)
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        relative = self.relative(path)
+        with self._lock:
+            self.files[relative] = bytes(data)
+            if mode is not None:
+                self.modes[relative] = mode
+            self._add_parents(relative)
+
+    def touch(self, path: Path):
+        relative = self.relative(path)
+        with self._lock:
+            self.files.setdefault(relative, b"")
+            self._add_parents(relative)
+
+    def remove(self):
+        with self._lock:
+            self.files.clear()
+            self.modes.clear()
+            self.directories.clear()
+            self._created = False
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        """Read a file by absolute path or path relative to the root"""
+        relative = self.relative(path) if Path(path).is_absolute() else PurePosixPath(path)
+        return self.files[str(relative)]
+
+    def read_text(self, path: str | Path) -> str:
+        """Read a UTF-8 file by absolute path or path relative to the root"""
+        return self.read_bytes(path).decode("utf-8")
+
+    def mode(self, relative: str) -> int:
+        """Permission bits of a file"""
+        return self.modes.get(relative, self.DEFAULT_FILE_MODE)
+
+    def materialize(self, destination: Path | None = None) -> Path:
+        """
+        Write the whole tree to disk in one pass
+
+        Args:
+            destination: Target directory (default: the backend root)
+
+        Returns:
+            Path to the written project
+
+        Raises:
+            FileExistsError: If the destination already exists
+        """
+        destination = Path(destination) if destination is not None else self.root
+        destination.mkdir(parents=True)
+
+        for relative in sorted(self.directories, key=lambda d: d.count("/")):
+            (destination / relative).mkdir(parents=True, exist_ok=True)
+
+        for relative, data in self.files.items():
+            path = destination / relative
+            path.write_bytes(data)
+            if relative in self.modes:
+                path.chmod(self.modes[relative])
+
+        return destination
+
+    def to_tar(self, target: Path | BinaryIO, compression: str = "gz"):
+        """
+        Write the tree as a tarball, rooted at the project name
+
+        Args:
+            target: Output path or writable binary file object
+            compression: '' (plain tar), 'gz', 'bz2' or 'xz'
+        """
+        self._replay(
+            ArchiveOutput(self.root, target, f"tar.{compression}" if compression else "tar")
+        )
+
+    def to_zip(self, target: Path | BinaryIO):
+        """
+        Write the tree as a zip archive, rooted at the project name
+
+        Args:
+            target: Output path or writable binary file object
+        """
+        self._replay(ArchiveOutput(self.root, target, "zip"))
+
+    def copy_into(self, output: OutputBackend):
+        """
+        Write every directory and file into another backend, in sorted order
+
+        The target's root must already exist; paths are re-rooted at it.
+        """
+        for relative in sorted(self.directories):
+            output.mkdir(output.root / relative)
+        for relative in sorted(self.files):
+            output.write_bytes(
+                output.root / relative, self.files[relative], self.modes.get(relative)
+            )
+
+    def _replay(self, output: OutputBackend):
+        """Copy the whole tree into another backend, in sorted order"""
+        output.create_root()
+        self.copy_into(output)
+        output.close()
+
+    @contextmanager
+    def activate_imports(self):
+        """
+        Make the in-memory project importable
+
+        Inside the context, top-level packages of the project (e.g. ``src``)
+        import straight from memory, shadowing any module of the same name
+        already imported. Modules loaded this way are removed from
+        ``sys.modules`` on exit and shadowed modules are restored.
+
+        Example:
+            with output.activate_imports():
+                config = importlib.import_module("src.config.config")
+        """
+        finder = _MemoryFinder(self)
+        top_level = {
+            PurePosixPath(relative).parts[0].removesuffix(".py")
+            for relative in [*self.files, *self.directories]
+        }
+        shadowed = {
+            name: module
+            for name, module in sys.modules.items()
+            if name.split(".", 1)[0] in top_level
+        }
+        for name in shadowed:
+            del sys.modules[name]
+
+        sys.meta_path.insert(0, finder)
+        try:
+            yield finder
+        finally:
+            sys.meta_path.remove(finder)
+            for name in finder.loaded:
+                sys.modules.pop(name, None)
+            sys.modules.update(shadowed)
+            importlib.invalidate_caches()
+
+
+class ArchiveOutput(OutputBackend):
+    """
+    Streams the generated tree straight into a tar or zip archive
+
+    Each file becomes an archive entry as soon as it is written, so nothing
+    is staged on disk and the target may be a pipe (e.g. stdout). Entries
+    can't be rewritten once streamed: empty files created with ``touch`` are
+    held back until ``close`` in case a later write fills the same path.
+    """
+
+    # Archive format -> tarfile stream mode (None for zip)
+    FORMATS = ARCHIVE_FORMATS
+    DEFAULT_FORMAT = DEFAULT_ARCHIVE_FORMAT
+    DEFAULT_FILE_MODE = 0o644
+    DIRECTORY_MODE = 0o755
+
+    thread_safe = False
+
+    def __init__(
+        self,
+        root: Path,
+        target: str | Path | BinaryIO,
+        archive_format: str | None = None,
+    ):
+        """
+        Initialize backend
+
+        Args:
+            root: Project root path; entries are stored under its name
+            target: Archive path or writable binary file object
+            archive_format: One of FORMATS (default: detected from the target
+                            file name, falling back to tar.gz)
+
+        Raises:
+            ConfigurationError: If the archive format is not supported
+        """
+        super().__init__(root)
+        archive_format = archive_format or self.detect_format(target)
+        if archive_format not in self.FORMATS:
+            raise ConfigurationError(
+                f"Unsupported archive format: {archive_format}\n"
+                f"Supported formats: {', '.join(self.FORMATS)}"
+            )
+
+        self.target = target
+        self.archive_format = archive_format
+        self.entries: set[str] = set()
+        self._pending: list[str] = []
+        self._stream: BinaryIO | None = None
+        self._owns_stream = isinstance(target, str | Path)
+        self._archive: tarfile.TarFile | zipfile.ZipFile | None = None
+        self._mtime = time.time()
+        self._started = False
+
+    @classmethod
+    def detect_format(cls, target: str | Path | BinaryIO) -> str:
+        """Guess the archive format from a target file name"""
+        if isinstance(target, str | Path):
+            name = Path(target).name.lower()
+            for archive_format in sorted(cls.FORMATS, key=len, reverse=True):
+                if name.endswith(f".{archive_format}"):
+                    return archive_format
+        return cls.DEFAULT_FORMAT
+
+    def _entry_name(self, relative: str) -> str:
+        return f"{self.root.name}/{relative}" if relative not in ("", ".") else self.root.name
+
+    def exists(self, path: Path | None = None) -> bool:
+        if path is None:
+            return self._started
+        relative = self.relative(path)
+        return relative in self.entries or relative in self._pending
+
+    def create_root(self):
+        if self._started:
+            raise FileExistsError(f"Archive already started for: {self.root}")
+        self._started = True
+
+        self._stream = open(self.target, "wb") if self._owns_stream else self.target  # noqa: SIM115
+        mode = self.FORMATS[self.archive_format]
+        if mode is None:
+            self._archive = zipfile.ZipFile(self._stream, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._archive = tarfile.open(fileobj=self._stream, mode=mode)  # noqa: SIM115
+
+        self._add_directory("")
+
+    def _add_directory(self, relative: str):
+        """Stream a directory entry (and its missing ancestors) once"""
+        missing = [
+            str(parent)
+            for parent in [PurePosixPath(relative), *PurePosixPath(relative).parents]
+            if str(parent) not in self.entries
+        ]
+        for directory in reversed(missing):
+            self.entries.add(directory)
+            name = self._entry_name(directory)
+            if isinstance(self._archive, zipfile.ZipFile):
+                info = zipfile.ZipInfo(f"{name}/", date_time=time.localtime(self._mtime)[:6])
+                info.external_attr = ((0o040000 | self.DIRECTORY_MODE) << 16) | 0x10
+                self._archive.writestr(info, b"")
+            else:
+                info = tarfile.TarInfo(name)
+                info.type = tarfile.DIRTYPE
+                info.mode = self.DIRECTORY_MODE
+                info.mtime = self._mtime
+                self._archive.addfile(info)
+
+    def mkdir(self, path: Path):
+        self._add_directory(self.relative(path))
+
+    def write_bytes(self, path: Path, data: bytes, mode: int | None = None):
+        relative = self.relative(path)
+        if relative in self.entries:
+            raise FileSystemError(f"File already written to archive: {relative}")
+        if relative in self._pending:
+            self._pending.remove(relative)
+
+        self._add_directory(str(PurePosixPath(relative).parent))
+        self.entries.add(relative)
+
+        name = self._entry_name(relative)
+        mode = self.DEFAULT_FILE_MODE if mode is None else mode
+        if isinstance(self._archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.external_attr = (0o100000 | mode) << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = self._mtime
+            self._archive.addfile(info, io.BytesIO(data))
+
+    def touch(self, path: Path):
+        relative = self.relative(path)
+        if relative not in self.entries and relative not in self._pending:
+            self._pending.append(relative)
+
+    def close(self):
+        """Flush held-back empty files and finish the archive"""
+        if self._archive is None:
+            return
+
+        for relative in list(self._pending):
+            self.write_bytes(self.root / relative, b"")
+
+        self._archive.close()
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+        self._archive = None
+
+    def remove(self):
+        """Abort the archive; a partial archive file is deleted"""
+        if self._archive is not None:
+            try:
+                self._archive.close()
+            except (OSError, tarfile.TarError, zipfile.BadZipFile):
+                pass  # Best effort cleanup
+            self._archive = None
+            if self._owns_stream:
+                self._stream.close()
+
+        if self._owns_stream:
+            Path(self.target).unlink(missing_ok=True)
+        self.entries.clear()
+        self._pending.clear()
+
+
+class _MemoryFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import hook serving modules from a MemoryOutput"""
+
+    def __init__(self, output: MemoryOutput):
+        self.output = output
+        self.loaded: list[str] = []
+
+    def _locate(self, fullname: str) -> tuple[str, bool] | None:
+        """Find the file backing a module: (relative path, is_package)"""
+        base = fullname.replace(".", "/")
+        if f"{base}/__init__.py" in self.output.files:
+            return f"{base}/__init__.py", True
+        if f"{base}.py" in self.output.files:
+            return f"{base}.py", False
+        if base in self.output.directories:
+            # Directory without __init__.py: namespace-like package
+            return base, True
+        return None
+
+    def find_spec(self, fullname, path, target=None):  # noqa: ARG002 - finder protocol
+        located = self._locate(fullname)
+        if located is None:
+            return None
+
+        relative, is_package = located
+        origin = str(self.output.root / relative)
+        spec = importlib.util.spec_from_loader(fullname, self, origin=origin, is_package=is_package)
+        if is_package:
+            package_dir = relative[: -len("/__init__.py")] if relative.endswith(".py") else relative
+            spec.submodule_search_locations = [str(self.output.root / package_dir)]
+        spec.has_location = True
+        return spec
+
+    def create_module(self, spec):  # noqa: ARG002 - loader protocol
+        return None  # Default module creation
+
+    def exec_module(self, module):
+        relative = self.output.relative(Path(module.__spec__.origin))
+        self.loaded.append(module.__name__)
+        source = self.output.files.get(relative, b"")
+        module.__file__ = module.__spec__.origin
+        exec(compile(source, module.__file__, "exec"), module.__dict__)  # nosec B102
@@ -0,0 +1,205 @@
+"""
+Render plans: a declarative manifest of every templated file in a project
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .events import EventBus
+from .output import OutputBackend
+from .renderer import TemplateRegistry, TemplateRenderer
+from .writer import ParallelFileWriter
+
+
+class PlanRule(NamedTuple):
+    """
+    Declarative rule mapping a registry template to an output file
+
+    Attributes:
+        group: Registry group holding the template ('framework', 'tests' or 'common')
+        key: Template key inside the group (rule is skipped if the key is absent)
+        destination: Output path relative to the project root; may use {app_name}
+        condition: ProjectConfig flag that must be enabled for the rule to apply
+    """
+
+    group: str
+    key: str
+    destination: str
+    condition: str | None = None
+
+
+class RenderStep(NamedTuple):
+    """A single compiled (template, destination, condition) entry of a plan"""
+
+    template: str
+    destination: str
+    condition: str | None = None
+
+
+# Files rendered for every project, after the framework-specific ones
+COMMON_RULES: tuple[PlanRule, ...] = (
+    PlanRule("common", "gitignore", ".gitignore"),
+    PlanRule("common", "env_example", ".env.example"),
+    PlanRule("common", "readme", "README.md"),
+    PlanRule("common", "license", "LICENSE"),
+    PlanRule("common", "pyproject_toml", "pyproject.toml"),
+    PlanRule("common", "pytest_ini", "pytest.ini", "testing_suite"),
+    PlanRule("common", "dockerfile", "Dockerfile", "docker_support"),
+    PlanRule("common", "docker_compose", "docker-compose.yml", "docker_support"),
+    PlanRule("common", "dockerignore", ".dockerignore", "docker_support"),
+)
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """
+    Compiled, ordered list of templated files for one configuration
+
+    Plans are immutable and shared between generations of the same
+    framework/ORM/flag combination. Destinations are relative to the
+    project root and may still contain the {app_name} placeholder.
+    """
+
+    framework: str
+    orm: str
+    steps: tuple[RenderStep, ...]
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    @property
+    def templates(self) -> list[str]:
+        """Unique template paths used by the plan, in plan order"""
+        return list(dict.fromkeys(step.template for step in self.steps))
+
+    def resolve(self, project_path: Path, context: dict[str, Any]) -> list[tuple[str, Path]]:
+        """
+        Resolve destinations for a concrete project
+
+        Returns:
+            List of (template, output_path) pairs in plan order
+        """
+        app_name = context["name"].replace("-", "_")
+        return [
+            (step.template, project_path / step.destination.format(app_name=app_name))
+            for step in self.steps
+        ]
+
+    def destinations(self, context: dict[str, Any]) -> dict[str, str]:
+        """
+        Get the template of every destination, by path relative to the project root
+        """
+        app_name = context["name"].replace("-", "_")
+        return {step.destination.format(app_name=app_name): step.template for step in self.steps}
+
+    def execute(
+        self,
+        renderer: TemplateRenderer,
+        project_path: Path,
+        context: dict[str, Any],
+        max_workers: int | None = None,
+        output: OutputBackend | None = None,
+        events: EventBus | None = None,
+        select: Callable[[str, Path], bool] | None = None,
+    ) -> list[Path]:
+        """
+        Render every step of the plan into the project
+
+        Templates are rendered and written through a ParallelFileWriter.
+
+        Args:
+            renderer: Template renderer instance
+            project_path: Root path of the project
+            context: Template context
+            max_workers: I/O thread pool size (1 = serial)
+            output: Backend receiving the files (default: the real filesystem)
+            events: Bus receiving a file_rendered event per file
+            select: Optional predicate on (template, output_path); steps it
+                    rejects are not rendered
+
+        Returns:
+            Paths of the written files, in plan order
+        """
+        targets = self.resolve(project_path, context)
+        if select is not None:
+            targets = [(template, path) for template, path in targets if select(template, path)]
+        writer = ParallelFileWriter(renderer, max_workers=max_workers, output=output, events=events)
+        return writer.write(targets, context)
+
+    def diff(self, other: "RenderPlan") -> dict[str, list[str]]:
+        """
+        Compare the destinations of two plans
+
+        Returns:
+            Dictionary with 'added', 'removed' and 'changed' destinations
+            (changed = same destination rendered from a different template)
+        """
+        mine = {step.destination: step.template for step in self.steps}
+        theirs = {step.destination: step.template for step in other.steps}
+
+        return {
+            "added": sorted(theirs.keys() - mine.keys()),
+            "removed": sorted(mine.keys() - theirs.keys()),
+            "changed": sorted(d for d in mine.keys() & theirs.keys() if mine[d] != theirs[d]),
+        }
+
+
+@lru_cache(maxsize=128)
+def compile_render_plan(
+    rules: tuple[PlanRule, ...],
+    framework: str,
+    orm: str,
+    auth_enabled: bool,
+    testing_suite: bool,
+    docker_support: bool,
+) -> RenderPlan:
+    """
+    Compile plan rules into a flat render plan
+
+    Conditions are evaluated and registry keys resolved once per
+    combination; the result is memoized. When several rules write the same
+    destination, the last one wins, matching the order files used to be
+    overwritten in.
+
+    Args:
+        rules: Ordered plan rules (framework rules followed by COMMON_RULES)
+        framework: Framework name
+        orm: ORM name
+        auth_enabled: Whether authentication is enabled
+        testing_suite: Whether to include tests
+        docker_support: Whether to include Docker files
+
+    Returns:
+        Compiled RenderPlan
+    """
+    flags = {
+        "auth_enabled": auth_enabled,
+        "testing_suite": testing_suite,
+        "docker_support": docker_support,
+    }
+    groups = {
+        "framework": TemplateRegistry.TEMPLATES.get(framework, {}).get(orm, {}),
+        "tests": TemplateRegistry.TEST_TEMPLATES.get(framework, {}).get(orm, {}),
+        "common": TemplateRegistry.COMMON_TEMPLATES,
+    }
+
+    steps: dict[str, RenderStep] = {}
+    for rule in rules:
+        if rule.condition is not None and not flags[rule.condition]:
+            continue
+
+        template = groups[rule.group].get(rule.key)
+        if template is None:
+            continue
+
+        # Later rules overwrite earlier ones for the same destination
+        steps.pop(rule.destination, None)
+        steps[rule.destination] = RenderStep(template, rule.destination, rule.condition)
+
+    return RenderPlan(framework=framework, orm=orm, steps=tuple(steps.values()))
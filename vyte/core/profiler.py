@@ -0,0 +1,148 @@
+"""
+Generation profiling: where the time and bytes of a generation go
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .events import GenerationEvent
+
+
+@dataclass
+class TemplateTiming:
+    """
+    Aggregated timings of one template
+
+    Attributes:
+        load: Seconds spent loading the template (compiling it on first use)
+        render: Seconds spent rendering, load included
+        renders: Number of files rendered from the template
+        size: Bytes rendered
+    """
+
+    load: float = 0.0
+    render: float = 0.0
+    renders: int = 0
+    size: int = 0
+
+
+class GenerationProfiler:
+    """
+    Event listener recording per-phase, per-template and per-step timings
+
+    Subscribe it to the EventBus passed to ProjectGenerator.generate() (or to
+    generator.events), then read report() or to_json().
+
+    Example:
+        >>> profiler = GenerationProfiler()
+        >>> generator.generate(config, events=EventBus(profiler))
+        >>> profiler.report()["total"]
+    """
+
+    def __init__(self):
+        """Initialize an empty profile"""
+        self.phases: dict[str, float] = {}
+        self.steps: dict[str, float] = {}
+        self.templates: dict[str, TemplateTiming] = {}
+        # A path can be written (or created) more than once, e.g. touched then rendered
+        self._files: set[Path] = set()
+        self._directories: set[Path] = set()
+        self.bytes_written = 0
+        self.write_time = 0.0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, event: GenerationEvent):
+        """Record an event"""
+        with self._lock:
+            if self.started is None:
+                self.started = event.timestamp
+            self.finished = event.timestamp
+
+            if event.kind == "phase_finished":
+                self.phases[event.phase] = self.phases.get(event.phase, 0.0) + event.duration
+            elif event.kind == "step_finished":
+                self.steps[event.step] = self.steps.get(event.step, 0.0) + event.duration
+            elif event.kind == "template_loaded":
+                self.templates.setdefault(event.template, TemplateTiming()).load += event.duration
+            elif event.kind == "file_rendered":
+                timing = self.templates.setdefault(event.template, TemplateTiming())
+                timing.render += event.duration
+                timing.renders += 1
+                timing.size += event.size
+            elif event.kind == "file_written":
+                self._files.add(event.path)
+                self.bytes_written += event.size
+                self.write_time += event.duration
+            elif event.kind == "directory_created":
+                self._directories.add(event.path)
+
+    @property
+    def files_written(self) -> int:
+        """Number of distinct files written"""
+        return len(self._files)
+
+    @property
+    def directories(self) -> int:
+        """Number of distinct directories created"""
+        return len(self._directories)
+
+    @property
+    def total(self) -> float:
+        """Wall time between the first and the last event"""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def slowest_templates(self, limit: int | None = None) -> list[tuple[str, TemplateTiming]]:
+        """Templates sorted by render time, slowest first"""
+        ranked = sorted(self.templates.items(), key=lambda item: item[1].render, reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def report(self) -> dict[str, Any]:
+        """
+        Get the profile as plain data
+
+        Returns:
+            Dictionary with total, phases, steps, templates and writes
+            (seconds and bytes), ready for json.dumps()
+        """
+        return {
+            "total": self.total,
+            "phases": dict(self.phases),
+            "steps": dict(self.steps),
+            "templates": {
+                name: {
+                    "load": timing.load,
+                    "render": timing.render,
+                    "renders": timing.renders,
+                    "size": timing.size,
+                }
+                for name, timing in self.slowest_templates()
+            },
+            "writes": {
+                "directories": self.directories,
+                "files": self.files_written,
+                "bytes": self.bytes_written,
+                "time": self.write_time,
+            },
+        }
+
+    def to_json(self, path: Path | None = None) -> str:
+        """
+        Serialize the report
+
+        Args:
+            path: Optional file to write the JSON to
+
+        Returns:
+            JSON document
+        """
+        document = json.dumps(self.report(), indent=2)
+        if path is not None:
+            Path(path).write_text(document + "\n", encoding="utf-8")
+        return document
@@ -0,0 +1,235 @@
+"""
+Incremental regeneration of existing projects
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import ConfigurationError, FileSystemError, GenerationError, VyteError
+from .config import ProjectConfig
+from .events import EventBus
+from .manifest import (
+    MANIFEST_PATH,
+    FileRecord,
+    ProjectManifest,
+    content_hash,
+    context_hash,
+    render_context,
+)
+from .output import MemoryOutput
+
+if TYPE_CHECKING:
+    from .generator import ProjectGenerator
+
+
+@dataclass
+class RegenerationReport:
+    """
+    What regenerating a project changed, by path relative to the project root
+
+    Attributes:
+        project_path: Project root
+        created: Files added (new in the project's render plan)
+        updated: Files rewritten because their template or context changed
+        removed: Files deleted because the project no longer generates them
+        modified: Files edited by the user that would have changed; left untouched
+        unchanged: Files whose generated content is the same as before
+        rendered: Number of templates rendered
+        dry_run: True if nothing was written
+    """
+
+    project_path: Path
+    created: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    rendered: int = 0
+    dry_run: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """True if files were (or, on a dry run, would be) written or removed"""
+        return bool(self.created or self.updated or self.removed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable view of the report"""
+        return {
+            "project_path": str(self.project_path),
+            "created": self.created,
+            "updated": self.updated,
+            "removed": self.removed,
+            "modified": self.modified,
+            "unchanged": len(self.unchanged),
+            "rendered": self.rendered,
+            "dry_run": self.dry_run,
+        }
+
+
+def regenerate_project(
+    generator: "ProjectGenerator",
+    project_path: Path,
+    config: ProjectConfig | None = None,
+    dry_run: bool = False,
+    events: EventBus | None = None,
+) -> RegenerationReport:
+    """
+    Bring a generated project up to date with its configuration and templates
+
+    Only templates whose source, or a context value they read, changed since
+    the last (re)generation are rendered. Files are rewritten only if their
+    content changes and the user has not edited them since vyte wrote them;
+    edited files are reported and left alone.
+
+    Args:
+        generator: Generator providing the renderer and strategies
+        project_path: Root of a project generated by vyte
+        config: New configuration (default: the one in the project manifest)
+        dry_run: Report what would change without writing anything
+        events: Bus receiving progress events of the render
+
+    Returns:
+        RegenerationReport
+
+    Raises:
+        ConfigurationError: If the project has no valid manifest, or the
+                            configuration renames the project
+        FileSystemError, GenerationError: As ProjectGenerator.generate
+    """
+    project_path = Path(project_path).resolve()
+    manifest = ProjectManifest.load(project_path)
+    if config is None:
+        config = manifest.project_config()
+    if config.name != manifest.config.get("name"):
+        raise ConfigurationError(
+            f"Cannot rename project '{manifest.config.get('name')}' to '{config.name}' "
+            "by regenerating it"
+        )
+
+    renderer = generator.renderer
+    context = render_context(config, renderer)
+    digest = context_hash(context)
+
+    # Render the project in memory, skipping templated files that are up to date
+    rendered: list[str] = []
+
+    def select(template: str, path: Path) -> bool:
+        relative = path.relative_to(project_path).as_posix()
+        if manifest.needs_render(relative, template, renderer, context):
+            rendered.append(relative)
+            return True
+        return False
+
+    tree = MemoryOutput(project_path)
+    tree.create_root()
+    try:
+        templates = generator.populate(config, tree, events=events, select=select)
+    except VyteError:
+        raise
+    except Exception as e:
+        raise GenerationError(f"Project regeneration failed: {e}") from e
+
+    report = RegenerationReport(project_path, rendered=len(rendered), dry_run=dry_run)
+    records: dict[str, FileRecord] = {}
+
+    # Skipped templated files: still valid, now for the new context
+    for relative, template in templates.items():
+        if relative not in tree.files:
+            records[relative] = FileRecord(
+                manifest.files[relative].output, digest, template, renderer.source_hash(template)
+            )
+            report.unchanged.append(relative)
+
+    writes: dict[str, bytes] = {}
+    for relative in sorted(tree.files):
+        data = tree.files[relative]
+        template = templates.get(relative)
+        record = FileRecord(
+            content_hash(data),
+            digest,
+            template,
+            renderer.source_hash(template) if template else None,
+        )
+
+        previous = manifest.files.get(relative)
+        current = _file_hash(project_path / relative)
+        if current == record.output:
+            report.unchanged.append(relative)
+        elif previous is None and current is None:
+            report.created.append(relative)
+            writes[relative] = data
+        elif previous is not None and current == previous.output:
+            report.updated.append(relative)
+            writes[relative] = data
+        else:
+            # Edited (or deleted) since vyte wrote it, or created by the user:
+            # keep the old record (or none), so the pending change is reported
+            # again until the user merges it
+            report.modified.append(relative)
+            if previous is not None:
+                records[relative] = previous
+            continue
+        records[relative] = record
+
+    # Files the project no longer generates
+    deletions = []
+    for relative, previous in sorted(manifest.files.items()):
+        if relative in records:
+            continue
+        current = _file_hash(project_path / relative)
+        if current == previous.output:
+            report.removed.append(relative)
+            deletions.append(relative)
+        elif current is not None:
+            report.modified.append(relative)
+
+    report.unchanged.sort()
+    report.modified.sort()
+    if dry_run:
+        return report
+
+    try:
+        for relative in sorted(tree.directories):
+            (project_path / relative).mkdir(parents=True, exist_ok=True)
+        for relative, data in writes.items():
+            path = project_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            if relative in tree.modes:
+                path.chmod(tree.modes[relative])
+        for relative in deletions:
+            _remove_file(project_path, relative)
+
+        updated = ProjectManifest(
+            config=config.model_dump(mode="json"), context=context, files=records
+        )
+        manifest_path = project_path / MANIFEST_PATH
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(updated.to_json(), encoding="utf-8")
+    except OSError as e:
+        raise FileSystemError(f"Failed to update project: {e}") from e
+
+    return report
+
+
+def _file_hash(path: Path) -> str | None:
+    """Content hash of a file on disk, or None if it doesn't exist"""
+    try:
+        return content_hash(path.read_bytes())
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def _remove_file(project_path: Path, relative: str):
+    """Delete a file, then the directories it leaves empty (up to the project root)"""
+    path = project_path / relative
+    path.unlink()
+    for parent in path.parents:
+        if parent == project_path:
+            break
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
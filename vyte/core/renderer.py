@@ -3,11 +3,83 @@ Template rendering system using Jinja2
 """
 
 import datetime
+import fnmatch
+import importlib.resources
+import os
 import re
+import threading
+import time
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from jinja2 import ChoiceLoader, Environment, FileSystemLoader, PackageLoader, TemplateNotFound
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    PackageLoader,
+    TemplateNotFound,
+)
+from jinja2.loaders import split_template_path
+
+from .cache import TemplateBytecodeCache, cache_enabled, mtime_check
+from .template_graph import TemplateGraph
+
+if TYPE_CHECKING:
+    from .config import ProjectConfig
+    from .events import EventBus
+
+
+class ResourceLoader(BaseLoader):
+    """
+    Loads templates from package resources through importlib.resources
+
+    Works for packages Jinja's PackageLoader cannot read, like apps frozen
+    or bundled by custom importers. Resources are not expected to change
+    while the process runs.
+    """
+
+    def __init__(self, package: str, package_path: str = "templates"):
+        """
+        Initialize loader
+
+        Args:
+            package: Importable package holding the templates
+            package_path: Templates directory inside the package
+
+        Raises:
+            ValueError: If the package has no such resource directory
+        """
+        self.root = importlib.resources.files(package).joinpath(package_path)
+        if not self.root.is_dir():
+            raise ValueError(f"No '{package_path}' resources in package '{package}'")
+
+    def get_source(
+        self, environment: Environment, template: str  # noqa: ARG002 - BaseLoader API
+    ) -> tuple[str, str, Callable[[], bool]]:
+        """Read a template resource"""
+        resource = self.root
+        for part in split_template_path(template):
+            resource = resource.joinpath(part)
+        try:
+            source = resource.read_text(encoding="utf-8")
+        except OSError as exc:
+            raise TemplateNotFound(template) from exc
+        return source, str(resource), lambda: True
+
+    def list_templates(self) -> list[str]:
+        """Name of every resource under the templates directory"""
+        names = []
+        pending = [(self.root, "")]
+        while pending:
+            directory, prefix = pending.pop()
+            for child in directory.iterdir():
+                if child.is_dir():
+                    pending.append((child, f"{prefix}{child.name}/"))
+                else:
+                    names.append(f"{prefix}{child.name}")
+        return sorted(names)
 
 
 class TemplateRenderer:
@@ -15,13 +87,15 @@ class TemplateRenderer:
     Renders Jinja2 templates with project configuration
     """
 
-    def __init__(self, template_dir: Path | None = None):
+    def __init__(self, template_dir: Path | None = None, bytecode_cache: bool = True):
         """
         Initialize template renderer
 
         Args:
             template_dir: Path to templates directory.
                          If None, uses default templates/ in package
+            bytecode_cache: Persist compiled templates on disk between runs
+                            (disabled when $VYTE_NO_CACHE is set)
         """
         # Resolve template loader(s).
         # Priority:
@@ -29,6 +103,7 @@ class TemplateRenderer:
         # 2. package-internal `vyte/templates` -> FileSystemLoader
         # 3. top-level `templates/` (repo-style) -> FileSystemLoader
         # 4. PackageLoader('vyte', 'templates') as fallback for installed packages
+        #    (including zip files and zipapps), else importlib.resources
 
         package_dir = Path(__file__).parent.parent
         fs_template_pkg = package_dir / "templates"  # vyte/templates
@@ -58,8 +133,11 @@ class TemplateRenderer:
             try:
                 loaders.append(PackageLoader("vyte", "templates"))
             except (ImportError, ValueError, ModuleNotFoundError):
-                # Ignore if PackageLoader cannot be created (e.g., in development)
-                pass
+                # Importers PackageLoader doesn't know may still expose resources
+                try:
+                    loaders.append(ResourceLoader("vyte", "templates"))
+                except (ImportError, ValueError, OSError):
+                    pass
 
         if not loaders:
             raise FileNotFoundError(
@@ -70,9 +148,19 @@ class TemplateRenderer:
 
         loader = ChoiceLoader(loaders) if len(loaders) > 1 else loaders[0]
 
+        # Persistent bytecode cache so repeated runs skip template compilation
+        self.bytecode_cache: TemplateBytecodeCache | None = None
+        if bytecode_cache and cache_enabled():
+            try:
+                self.bytecode_cache = TemplateBytecodeCache()
+            except OSError:
+                # Unwritable cache location: fall back to compiling every run
+                self.bytecode_cache = None
+
         # Configure Jinja2 environment with chosen loader(s)
         self.env = Environment(
             loader=loader,
+            bytecode_cache=self.bytecode_cache,
             trim_blocks=False,
             lstrip_blocks=False,
             keep_trailing_newline=True,
@@ -88,6 +176,13 @@ class TemplateRenderer:
         self.env.globals["now"] = datetime.datetime.now
         self.env.globals["year"] = datetime.datetime.now().year
 
+        # What each template loads and reads, parsed once per source
+        self.graph = TemplateGraph(self.env)
+
+        # Names of every loadable template, with checks telling when to list again
+        self._index: tuple[list[Callable[[], bool]], frozenset[str]] | None = None
+        self._index_lock = threading.Lock()
+
     @staticmethod
     def _pascal_case(text: str) -> str:
         """Convert text to PascalCase"""
@@ -114,13 +209,17 @@ class TemplateRenderer:
         """Convert text to Title Case"""
         return text.replace("_", " ").replace("-", " ").title()
 
-    def render(self, template_path: str, context: dict[str, Any]) -> str:
+    def render(
+        self, template_path: str, context: dict[str, Any], events: "EventBus | None" = None
+    ) -> str:
         """
         Render a template with given context
 
         Args:
             template_path: Relative path to template (e.g., 'flask_restx/init.py.j2')
             context: Dictionary of variables to pass to template
+            events: Bus receiving a template_loaded event with the time spent
+                    loading (and compiling, on first use) the template
 
         Returns:
             Rendered template as string
@@ -129,13 +228,57 @@ class TemplateRenderer:
             TemplateNotFound: If template doesn't exist
         """
         try:
-            template = self.env.get_template(template_path)
+            if events is None:
+                template = self.env.get_template(template_path)
+            else:
+                start = time.perf_counter()
+                template = self.env.get_template(template_path)
+                events.emit(
+                    "template_loaded",
+                    template=template_path,
+                    duration=time.perf_counter() - start,
+                )
             return template.render(**context)
         except TemplateNotFound as exc:
             raise TemplateNotFound(
                 f"Template not found: {template_path}\n" f"Looking in: {self.template_dir}"
             ) from exc
 
+    def source_hash(self, template_path: str) -> str:
+        """
+        Get a digest of a template's source and of every template it loads
+
+        Changes when the template, or a template it extends, includes or
+        imports, is edited.
+
+        Raises:
+            TemplateNotFound: If template doesn't exist
+        """
+        try:
+            return self.graph.fingerprint(template_path)
+        except TemplateNotFound as exc:
+            raise TemplateNotFound(
+                f"Template not found: {template_path}\n" f"Looking in: {self.template_dir}"
+            ) from exc
+
+    def template_variables(self, template_path: str) -> frozenset[str]:
+        """
+        Get the names a template reads from its context or the globals
+
+        Found from the AST of the template and of every template it loads,
+        so names used in any expression or statement count, including ones
+        only read in unreachable branches.
+
+        Raises:
+            TemplateNotFound: If template doesn't exist
+        """
+        try:
+            return self.graph.variables(template_path)
+        except TemplateNotFound as exc:
+            raise TemplateNotFound(
+                f"Template not found: {template_path}\n" f"Looking in: {self.template_dir}"
+            ) from exc
+
     def render_to_file(
         self,
         template_path: str,
@@ -160,59 +303,106 @@ class TemplateRenderer:
         output_path.write_text(content, encoding="utf-8")
 
     def template_exists(self, template_path: str) -> bool:
-        """Check if a template exists"""
-        try:
-            self.env.get_template(template_path)
-            return True
-        except TemplateNotFound:
-            return False
+        """Check if a template exists, without loading or compiling it"""
+        return template_path in self.template_index()
+
+    def template_index(self) -> frozenset[str]:
+        """
+        Get the name of every template the loaders provide
+
+        Built once from the loaders' list_templates() and listed again only
+        after a directory of a filesystem loader changed (a template was
+        added, removed or renamed).
+        """
+        with self._index_lock:
+            index = self._index
+        if index is not None and all(check() for check in index[0]):
+            return index[1]
+
+        loader = self.env.loader
+        loaders = loader.loaders if isinstance(loader, ChoiceLoader) else [loader]
+        searchpaths = [
+            path
+            for each in loaders
+            if isinstance(each, FileSystemLoader)
+            for path in each.searchpath
+        ]
+        # Directories first: a change during listing invalidates the index
+        checks = [
+            mtime_check(directory)
+            for searchpath in searchpaths
+            for directory, _, _ in os.walk(searchpath)
+        ]
+        names = frozenset(loader.list_templates())
+
+        with self._index_lock:
+            self._index = (checks, names)
+        return names
+
+    def warm_up(self, templates: Iterable[str] | None = None) -> int:
+        """
+        Compile templates ahead of use, into the environment's template cache
+
+        Args:
+            templates: Templates to compile (default: every template)
+
+        Returns:
+            Number of templates compiled (or loaded from the bytecode cache)
+        """
+        names = sorted(self.template_index()) if templates is None else list(templates)
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
 
     def list_templates(self, pattern: str | None = None) -> list[str]:
         """
         List all available templates
 
+        Templates of every loader are listed (a name provided by several
+        loaders is listed once; the first loader's template is the one
+        rendered). Served from template_index().
+
         Args:
-            pattern: Optional glob pattern to filter templates (e.g., 'flask_*/*.j2')
+            pattern: Optional glob pattern to filter templates (e.g., 'flask_*/*.j2');
+                     '*' stays within one directory, '**' spans any number
 
         Returns:
-            List of template paths
+            List of template paths (all .j2 templates without a pattern)
         """
-        templates = []
-
+        index = self.template_index()
         if pattern:
-            templates = [
-                str(p.relative_to(self.template_dir))
-                for p in self.template_dir.glob(pattern)
-                if p.is_file()
-            ]
-        else:
-            templates = [
-                str(p.relative_to(self.template_dir))
-                for p in self.template_dir.rglob("*.j2")
-                if p.is_file()
-            ]
-
-        return sorted(templates)
+            return sorted(name for name in index if _glob_match(name, pattern))
+        return sorted(name for name in index if name.endswith(".j2"))
 
     def get_template_info(self, template_path: str) -> dict[str, Any]:
         """
         Get information about a template
 
+        Describes the template the renderer would load: with several loaders,
+        the first one providing it.
+
         Returns:
-            Dictionary with template metadata
-        """
-        full_path = self.template_dir / template_path
+            Dictionary with template metadata ('modified' is None for
+            templates read from an archive)
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
+        Raises:
+            FileNotFoundError: If no loader provides the template
+        """
+        try:
+            source, filename, _ = self.env.loader.get_source(self.env, template_path)
+        except TemplateNotFound as exc:
+            raise FileNotFoundError(f"Template not found: {template_path}") from exc
 
-        stat = full_path.stat()
+        try:
+            modified = datetime.datetime.fromtimestamp(os.stat(filename).st_mtime)
+        except (OSError, TypeError):
+            modified = None
 
         return {
             "path": template_path,
-            "full_path": str(full_path),
-            "size": stat.st_size,
-            "modified": datetime.datetime.fromtimestamp(stat.st_mtime),
+            "full_path": str(filename),
+            "size": len(source.encode("utf-8")),
+            "modified": modified,
             "exists": True,
         }
 
@@ -220,24 +410,50 @@ class TemplateRenderer:
         """
         Validate if context has all required variables for template
 
+        Variables come from the AST of the template and of the templates it
+        loads (memoized per template source): names read in any expression or
+        statement, minus loop variables, assignments, macro arguments and the
+        environment globals. Names only read through ``| default(...)`` or
+        ``is defined`` are optional.
+
         Returns:
             List of missing variables (empty if all present)
         """
-
         try:
-            template = self.env.get_template(template_path)
-            source = template.source
+            required = self.graph.required_variables(template_path)
+        except TemplateNotFound:
+            return []
 
-            # Find all variables used in template
-            var_pattern = r"\{\{\s*(\w+)"
-            used_vars = set(re.findall(var_pattern, source))
+        return sorted(required - context.keys() - self.env.globals.keys())
 
-            # Check which are missing from context
-            missing = used_vars - set(context.keys())
+    def validate_all(
+        self, config: "ProjectConfig", templates: Iterable[str] | None = None
+    ) -> dict[str, list[str]]:
+        """
+        Validate the context of a project against every template it renders
 
-            return sorted(missing)
-        except TemplateNotFound:
-            return []
+        Args:
+            config: Project configuration (rendered with model_dump_safe())
+            templates: Templates to check (default: the registry's templates
+                       for the configuration; pass
+                       ProjectGenerator.get_render_plan(config).templates
+                       for the exact render plan)
+
+        Returns:
+            Missing variables by template, for templates missing any
+        """
+        if templates is None:
+            templates = TemplateRegistry.get_templates_for_config(
+                config.framework, config.orm, config.auth_enabled, config.testing_suite
+            ).values()
+
+        context = config.model_dump_safe()
+        problems = {}
+        for template_path in dict.fromkeys(templates):
+            missing = self.validate_context(template_path, context)
+            if missing:
+                problems[template_path] = missing
+        return problems
 
 
 class TemplateRegistry:
@@ -274,6 +490,9 @@ class TemplateRegistry:
                 "routes": "fastapi/sqlalchemy/routes.py.j2",
                 "config": "fastapi/sqlalchemy/config.py.j2",
                 "schemas": "fastapi/sqlalchemy/schemas.py.j2",
+                "alembic_ini": "fastapi/sqlalchemy/alembic.ini.j2",
+                "alembic_env": "fastapi/sqlalchemy/alembic_env.py.j2",
+                "alembic_script": "fastapi/sqlalchemy/script.py.mako.j2",
             },
             "TortoiseORM": {
                 "main": "fastapi/tortoise/main.py.j2",
@@ -409,17 +628,25 @@ class TemplateRegistry:
         cls, renderer: TemplateRenderer, framework: str, orm: str
     ) -> tuple[bool, list[str]]:
         """
-        Validate that all required templates exist
+        Validate that all required templates, and the templates they load, exist
+
+        Checked against the template index, then the dependency graph for
+        templates loaded by includes: nothing is compiled.
 
         Returns:
             (all_exist, list_of_missing_templates)
         """
         required = cls.get_required_templates(framework, orm)
+        index = renderer.template_index()
         missing = []
 
         for template_path in required:
-            if not renderer.template_exists(template_path):
+            if template_path not in index:
                 missing.append(template_path)
+                continue
+            for name in renderer.graph.missing(template_path):
+                if name not in missing:
+                    missing.append(name)
 
         return len(missing) == 0, missing
 
@@ -438,3 +665,21 @@ def quick_render(template_path: str, context: dict[str, Any]) -> str:
     """
     renderer = TemplateRenderer()
     return renderer.render(template_path, context)
+
+
+def _glob_match(name: str, pattern: str) -> bool:
+    """Match a template name against a glob pattern, like Path.glob relative to the root"""
+    return _match_parts(name.split("/"), pattern.split("/"))
+
+
+def _match_parts(parts: list[str], patterns: list[str]) -> bool:
+    """Match path segments against pattern segments ('**' matches any number)"""
+    if not patterns:
+        return not parts
+    if patterns[0] == "**":
+        return any(_match_parts(parts[i:], patterns[1:]) for i in range(len(parts) + 1))
+    return (
+        bool(parts)
+        and fnmatch.fnmatchcase(parts[0], patterns[0])
+        and _match_parts(parts[1:], patterns[1:])
+    )
@@ -0,0 +1,356 @@
+"""
+PEP 508 requirement sets: merging duplicates and finding conflicts
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, Specifier, SpecifierSet
+from packaging.utils import NormalizedName, canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+from ..exceptions import DependencyError
+
+
+@dataclass(frozen=True)
+class PackageMetadata:
+    """
+    What vyte knows about a range of releases of a package
+
+    Attributes:
+        versions: Releases the entry describes
+        requires: Requirements of those releases
+        extras: Additional requirements of each extra
+    """
+
+    versions: str
+    requires: tuple[str, ...] = ()
+    extras: tuple[tuple[str, tuple[str, ...]], ...] = ()
+
+
+@dataclass(frozen=True)
+class Incompatibility:
+    """Releases of two packages that install together but don't work together"""
+
+    package: str
+    versions: str
+    other: str
+    other_versions: str
+    reason: str
+
+
+# Bundled metadata of the packages generated projects depend on (from their
+# published Requires-Dist), so checks never need network access. Open ranges
+# describe the releases known when the table was last updated.
+PACKAGE_METADATA: dict[str, tuple[PackageMetadata, ...]] = {
+    "passlib": (PackageMetadata("<2", extras=(("bcrypt", ("bcrypt>=3.1.0",)),)),),
+    "python-jose": (
+        PackageMetadata(">=3.3.0", extras=(("cryptography", ("cryptography>=3.4.0",)),)),
+    ),
+    "sqlalchemy": (PackageMetadata(">=2.0.0", extras=(("asyncio", ("greenlet!=0.4.17",)),)),),
+    "fastapi": (
+        PackageMetadata(
+            ">=0.100.0",
+            requires=("pydantic>=1.7.4,!=1.8,!=1.8.1,!=2.0.0,!=2.0.1,!=2.1.0,<3.0.0",),
+        ),
+    ),
+    "pydantic-settings": (
+        PackageMetadata(">=2.1.0", requires=("pydantic>=2.3.0", "python-dotenv>=0.21.0")),
+    ),
+    "flask-sqlalchemy": (
+        PackageMetadata(">=3.1.0", requires=("flask>=2.2.5", "sqlalchemy>=2.0.16")),
+    ),
+    "flask-migrate": (
+        PackageMetadata(">=4.0.0", requires=("flask>=0.9", "flask-sqlalchemy>=1.0")),
+    ),
+    "flask-restx": (PackageMetadata(">=1.3.0", requires=("flask>=0.8,!=2.0.0",)),),
+    "djangorestframework": (PackageMetadata(">=3.14.0", requires=("django>=3.0",)),),
+    "djangorestframework-simplejwt": (
+        PackageMetadata(">=5.3.0", requires=("django>=3.2", "djangorestframework>=3.12")),
+    ),
+    "drf-spectacular": (
+        PackageMetadata(">=0.27.0", requires=("django>=2.2", "djangorestframework>=3.10.3")),
+    ),
+}
+
+INCOMPATIBILITIES: tuple[Incompatibility, ...] = (
+    Incompatibility(
+        "passlib",
+        "<=1.7.4",
+        "bcrypt",
+        ">=4.1.0",
+        "passlib 1.7.4 fails to read the version of bcrypt 4.1 and later",
+    ),
+)
+
+# Packages a project should use only one of
+ALTERNATIVES: tuple[tuple[frozenset[str], str], ...] = (
+    (
+        frozenset({"sqlalchemy", "tortoise-orm"}),
+        "Warning: Using both SQLAlchemy and TortoiseORM. Consider using only one ORM.",
+    ),
+    (
+        frozenset({"django", "flask"}),
+        "Warning: Mixing Django with other frameworks. This is unusual and may cause conflicts.",
+    ),
+    (
+        frozenset({"django", "fastapi"}),
+        "Warning: Mixing Django with other frameworks. This is unusual and may cause conflicts.",
+    ),
+)
+
+
+def parse_requirement(requirement: str) -> Requirement:
+    """
+    Parse a PEP 508 requirement string
+
+    Raises:
+        DependencyError: If the requirement is invalid
+    """
+    try:
+        return Requirement(requirement)
+    except InvalidRequirement as e:
+        raise DependencyError(f"Invalid requirement '{requirement}': {e}") from e
+
+
+def merge_requirements(requirements: Iterable[str]) -> list[str]:
+    """
+    Merge requirements on the same package into one
+
+    Extras are combined and specifiers intersected, dropping redundant
+    bounds: ``sqlalchemy>=2.0.0`` and ``sqlalchemy[asyncio]>=2.0.0`` become
+    ``sqlalchemy[asyncio]>=2.0.0``. Requirements with different environment
+    markers are kept apart.
+
+    Args:
+        requirements: Requirement strings
+
+    Returns:
+        Merged requirements, in the order each package first appears
+
+    Raises:
+        DependencyError: If a requirement is invalid
+    """
+    groups: dict[tuple[NormalizedName, str], list[Requirement]] = {}
+    for requirement in requirements:
+        parsed = parse_requirement(requirement)
+        groups.setdefault((canonicalize_name(parsed.name), str(parsed.marker or "")), []).append(
+            parsed
+        )
+    return [_format(group) for group in groups.values()]
+
+
+def check_conflicts(requirements: Iterable[str]) -> list[str]:
+    """
+    Find requirements that can't be installed, or work, together
+
+    Specifiers on each package are intersected, including those the bundled
+    PACKAGE_METADATA says listed packages (and their extras) impose. Known
+    INCOMPATIBILITIES and mixed ALTERNATIVES are reported as warnings.
+
+    Args:
+        requirements: Requirement strings
+
+    Returns:
+        Conflict and warning messages (empty if the set is consistent)
+
+    Raises:
+        DependencyError: If a requirement is invalid
+    """
+    listed = [parse_requirement(requirement) for requirement in requirements]
+    names = {canonicalize_name(requirement.name) for requirement in listed}
+
+    # Every constraint on each listed package, with where it comes from
+    constraints: dict[NormalizedName, list[tuple[Requirement, str]]] = {}
+    for requirement in listed:
+        constraints.setdefault(canonicalize_name(requirement.name), []).append(
+            (requirement, "requirements")
+        )
+    for requirement in listed:
+        for implied in _implied(requirement):
+            name = canonicalize_name(implied.name)
+            if name in names:
+                constraints[name].append((implied, str(requirement)))
+
+    messages = []
+    ranges = {name: _intersection(sources) for name, sources in constraints.items()}
+    for name, sources in constraints.items():
+        if not satisfiable(ranges[name]):
+            details = ", ".join(
+                str(requirement) if origin == "requirements" else f"{requirement} (from {origin})"
+                for requirement, origin in sources
+            )
+            messages.append(f"Conflict: no version of {name} satisfies {details}")
+
+    for incompatibility in INCOMPATIBILITIES:
+        package, other = incompatibility.package, incompatibility.other
+        if (
+            package in ranges
+            and other in ranges
+            and satisfiable(ranges[package] & SpecifierSet(incompatibility.versions))
+            and satisfiable(ranges[other] & SpecifierSet(incompatibility.other_versions))
+        ):
+            messages.append(
+                f"Warning: {package}{ranges[package]} allows {other}"
+                f"{incompatibility.other_versions}: {incompatibility.reason}"
+            )
+
+    reported = set()
+    for packages, message in ALTERNATIVES:
+        if packages <= names and message not in reported:
+            reported.add(message)
+            messages.append(message)
+
+    return messages
+
+
+def satisfiable(specifier: SpecifierSet) -> bool:
+    """
+    Check if any version can satisfy every clause of a specifier set
+
+    Bounds are compared (``>=2,<1`` is empty); ``!=`` clauses only matter
+    when the bounds leave a single version.
+    """
+    lower: tuple[Version, bool] | None = None  # (version, inclusive)
+    upper: tuple[Version, bool] | None = None
+    pinned: set[Version] = set()
+    excluded: set[Version] = set()
+
+    for clause in specifier:
+        for operator, version in _clauses(clause):
+            if operator == "==":
+                pinned.add(version)
+            elif operator == "!=":
+                excluded.add(version)
+            elif operator in (">=", ">"):
+                bound = (version, operator == ">=")
+                if lower is None or bound[0] > lower[0] or (bound[0] == lower[0] and not bound[1]):
+                    lower = bound
+            elif operator in ("<=", "<"):
+                bound = (version, operator == "<=")
+                if upper is None or bound[0] < upper[0] or (bound[0] == upper[0] and not bound[1]):
+                    upper = bound
+
+    if pinned:
+        return len(pinned) == 1 and specifier.contains(next(iter(pinned)), prereleases=True)
+    if lower is None or upper is None:
+        return True
+    if lower[0] != upper[0]:
+        return lower[0] < upper[0]
+    return lower[1] and upper[1] and lower[0] not in excluded
+
+
+def _clauses(clause: Specifier) -> list[tuple[str, Version]]:
+    """A specifier as plain comparisons (~= and wildcards become bounds)"""
+    operator, text = clause.operator, clause.version
+    try:
+        if text.endswith(".*"):
+            prefix = Version(text[:-2])
+            if operator == "!=":
+                return []
+            return [(">=", Version(f"{prefix}.dev0")), ("<", _next_release(prefix.release))]
+        version = Version(text)
+    except InvalidVersion:
+        return []  # Legacy versions (===) can't be compared
+    if operator == "~=":
+        return [(">=", version), ("<", _next_release(version.release[:-1]))]
+    if operator == "===":
+        return [("==", version)]
+    return [(operator, version)]
+
+
+def _next_release(release: tuple[int, ...]) -> Version:
+    """First version after every release starting with `release`"""
+    return Version(".".join(str(part) for part in (*release[:-1], release[-1] + 1)) + ".dev0")
+
+
+def _implied(requirement: Requirement) -> list[Requirement]:
+    """Requirements the bundled metadata says a requirement brings along"""
+    implied = []
+    for metadata in PACKAGE_METADATA.get(canonicalize_name(requirement.name), ()):
+        covered = SpecifierSet(metadata.versions)
+        # Only if every release the requirement allows is described
+        if not _within(requirement.specifier, covered):
+            continue
+        implied.extend(Requirement(line) for line in metadata.requires)
+        for extra, lines in metadata.extras:
+            if extra in {canonicalize_name(e) for e in requirement.extras}:
+                implied.extend(Requirement(line) for line in lines)
+    return implied
+
+
+def _within(specifier: SpecifierSet, covered: SpecifierSet) -> bool:
+    """Check if a specifier only allows versions of a covered range"""
+    inside = specifier & covered
+    # Nothing outside: the specifier with the range's complement is empty
+    for clause in covered:
+        for operator, version in _clauses(clause):
+            opposite = {">=": "<", ">": "<=", "<": ">=", "<=": ">"}.get(operator)
+            if opposite and satisfiable(specifier & SpecifierSet(f"{opposite}{version}")):
+                return False
+    return satisfiable(inside)
+
+
+def _intersection(sources: list[tuple[Requirement, str]]) -> SpecifierSet:
+    """Combined specifier of several requirements on one package"""
+    specifier = SpecifierSet()
+    for requirement, _ in sources:
+        specifier &= requirement.specifier
+    return specifier
+
+
+def _format(group: list[Requirement]) -> str:
+    """One requirement equivalent to several on the same package and marker"""
+    first = group[0]
+    extras = sorted({extra for requirement in group for extra in requirement.extras})
+    specifier = _simplify(_intersection([(requirement, "") for requirement in group]))
+    text = first.name + (f"[{','.join(extras)}]" if extras else "") + str(specifier)
+    if first.marker is not None:
+        text += f"; {first.marker}"
+    return text
+
+
+def _simplify(specifier: SpecifierSet) -> SpecifierSet:
+    """Drop clauses implied by others (the weaker of two lower or upper bounds)"""
+    clauses = list(specifier)
+    pinned = [clause for clause in clauses if clause.operator in ("==", "===")]
+    if len(pinned) == 1 and satisfiable(specifier):
+        return SpecifierSet(str(pinned[0]))
+
+    kept = []
+    for clause in clauses:
+        operator = clause.operator
+        if operator in (">=", ">", "<=", "<"):
+            lower = operator.startswith(">")
+            try:
+                version = Version(clause.version)
+            except InvalidVersion:
+                kept.append(clause)
+                continue
+            stronger = [
+                other
+                for other in clauses
+                if other is not clause
+                and other.operator in ((">=", ">") if lower else ("<=", "<"))
+                and _stronger(other, version, operator, lower)
+            ]
+            if stronger:
+                continue
+        kept.append(clause)
+    try:
+        return SpecifierSet(",".join(str(clause) for clause in kept))
+    except InvalidSpecifier:
+        return specifier
+
+
+def _stronger(other: Specifier, version: Version, operator: str, lower: bool) -> bool:
+    """Check if a bound implies another one (a tighter bound on the same side)"""
+    try:
+        other_version = Version(other.version)
+    except InvalidVersion:
+        return False
+    if other_version != version:
+        return other_version > version if lower else other_version < version
+    # Same version: the exclusive bound is the stronger one
+    return other.operator in (">", "<") and operator in (">=", "<=")
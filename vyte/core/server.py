@@ -0,0 +1,359 @@
+"""
+Long-running generation server keeping a warm generator in memory
+"""
+
+import io
+import json
+import logging
+import socketserver
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..__version__ import __version__
+from ..exceptions import ConfigurationError, FileSystemError, VyteError
+from .config import ProjectConfig
+from .generator import ProjectGenerator
+from .output import ArchiveOutput, MemoryOutput
+
+logger = logging.getLogger(__name__)
+
+# Content types of the archives the server can return
+ARCHIVE_CONTENT_TYPES = {
+    "tar": "application/x-tar",
+    "tar.gz": "application/gzip",
+    "tgz": "application/gzip",
+    "tar.bz2": "application/x-bzip2",
+    "tar.xz": "application/x-xz",
+    "zip": "application/zip",
+}
+
+# Largest request body accepted (a ProjectConfig is a few hundred bytes)
+MAX_REQUEST_SIZE = 64 * 1024
+
+# Host names a server bound to a loopback or wildcard address is reached by
+LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "[::1]")
+
+
+class RequestError(VyteError):
+    """Raised when a generation request can't be served"""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API of the generation server
+
+    Endpoints:
+        GET  /health    Server status
+        POST /generate  Body: {"config": {...}, "format": "tar.gz"} returns an
+                        archive; {"config": {...}, "path": "/abs/dir"} writes
+                        the project to <path>/<name> and returns JSON
+
+    Requests to /generate must be ``application/json`` and come from no
+    browser origin but the server's own, so web pages can't send them
+    (cross-site form posts, DNS rebinding).
+    """
+
+    server_version = f"vyte/{__version__}"
+    protocol_version = "HTTP/1.1"
+
+    # True once the body of the current request has been consumed
+    _body_read = False
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        if self.path != "/health":
+            self._send_error(RequestError("Not found", HTTPStatus.NOT_FOUND))
+            return
+
+        self._send_json(
+            {
+                "status": "ok",
+                "version": __version__,
+                "requests": self.server.requests_served,
+                "uptime": round(time.monotonic() - self.server.started_at, 3),
+            }
+        )
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        self._body_read = False
+        if self.path != "/generate":
+            self._send_error(RequestError("Not found", HTTPStatus.NOT_FOUND))
+            return
+
+        start = time.perf_counter()
+        self.server.record_request()
+        try:
+            payload = self._read_json()
+            config = self._parse_config(payload)
+
+            if payload.get("path") is not None:
+                project_path = self.server.generate_to(config, Path(payload["path"]))
+                self._send_json({"project_path": str(project_path)}, start=start)
+            else:
+                archive_format = payload.get("format") or ArchiveOutput.DEFAULT_FORMAT
+                data = self.server.generate_archive(config, archive_format)
+                self._send_archive(config.name, archive_format, data, start)
+        except RequestError as e:
+            self._send_error(e)
+        except FileExistsError as e:
+            self._send_error(RequestError(str(e), HTTPStatus.CONFLICT))
+        except OSError as e:
+            self._send_error(
+                RequestError(f"Cannot write project: {e}", HTTPStatus.INTERNAL_SERVER_ERROR)
+            )
+        except ConfigurationError as e:
+            self._send_error(RequestError(str(e)))
+        except VyteError as e:
+            self._send_error(RequestError(str(e), HTTPStatus.INTERNAL_SERVER_ERROR))
+
+    def _read_json(self) -> dict:
+        """Check where the request comes from, then read and decode its JSON body"""
+        origin = self.headers.get("Origin")
+        if origin is not None and origin not in self.server.origins:
+            raise RequestError(
+                f"Cross-origin requests are not allowed: {origin}", HTTPStatus.FORBIDDEN
+            )
+
+        content_type = self.headers.get_content_type()
+        if content_type != "application/json":
+            raise RequestError(
+                f"Content-Type must be application/json, not {content_type}",
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            )
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError as e:
+            raise RequestError("Invalid Content-Length") from e
+
+        if length > MAX_REQUEST_SIZE:
+            raise RequestError("Request body too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        body = self.rfile.read(length)
+        self._body_read = True
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            raise RequestError(f"Invalid JSON: {e}") from e
+
+        if not isinstance(payload, dict) or not isinstance(payload.get("config"), dict):
+            raise RequestError("Request body must be an object with a 'config' object")
+        for key in ("path", "format"):
+            if payload.get(key) is not None and not isinstance(payload[key], str):
+                raise RequestError(f"'{key}' must be a string")
+        return payload
+
+    @staticmethod
+    def _parse_config(payload: dict) -> ProjectConfig:
+        """Validate the project configuration of a request"""
+        try:
+            return ProjectConfig(**{"git_init": False, **payload["config"]})
+        except PydanticValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+            )
+            raise RequestError(f"Invalid configuration: {errors}") from e
+
+    def _send_archive(self, name: str, archive_format: str, data: bytes, start: float):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", ARCHIVE_CONTENT_TYPES[archive_format])
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Disposition", f'attachment; filename="{name}.{archive_format}"')
+        self.send_header("X-Vyte-Duration-Ms", f"{(time.perf_counter() - start) * 1000:.1f}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(
+        self,
+        body: dict,
+        status: HTTPStatus = HTTPStatus.OK,
+        start: float | None = None,
+        close: bool = False,
+    ):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if close:
+            # Also sets close_connection: an unread body must not be taken
+            # for the next request on a keep-alive connection
+            self.send_header("Connection", "close")
+        self.send_header("Content-Length", str(len(data)))
+        if start is not None:
+            self.send_header("X-Vyte-Duration-Ms", f"{(time.perf_counter() - start) * 1000:.1f}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, error: RequestError):
+        self._send_json(
+            {"error": type(error.__cause__ or error).__name__, "message": str(error)},
+            error.status,
+            close=self.command == "POST" and not self._body_read,
+        )
+
+    def log_message(self, format, *args):  # noqa: A002 - http.server signature
+        logger.info("%s %s", self.command or "-", format % args)
+
+
+class GenerationServerMixin:
+    """
+    Shared state of the TCP and Unix socket servers
+
+    One ProjectGenerator (and its compiled templates) is shared by every
+    request thread. Projects are generated in memory and only then archived
+    or materialized, so requests never share a working directory.
+
+    Attributes:
+        allow_roots: Directories requests may write projects into; writing
+                     to server paths is disabled when empty
+    """
+
+    allow_roots: tuple[Path, ...] = ()
+
+    def setup_generator(self, generator: ProjectGenerator | None = None, warm: bool = True):
+        """
+        Attach the shared generator
+
+        Args:
+            generator: Generator to serve (default: a new one)
+            warm: Compile every template up front
+        """
+        self.generator = generator or ProjectGenerator()
+        self.requests_served = 0
+        self.started_at = time.monotonic()
+        self.origins = self._own_origins()
+        self._counter_lock = threading.Lock()
+        if warm:
+            self.warm_up()
+
+    def _own_origins(self) -> frozenset[str]:
+        """Origins of the server itself (none for a Unix socket)"""
+        if not isinstance(self.server_address, tuple):
+            return frozenset()
+        host, port = self.server_address[:2]
+        hosts = {f"[{host}]" if ":" in host else host}
+        if host in ("", "0.0.0.0", "::") or host.startswith("127.") or host == "::1":
+            hosts.update(LOOPBACK_HOSTS)
+        return frozenset(f"http://{name}:{port}" for name in hosts)
+
+    def record_request(self):
+        """Count a generation request"""
+        with self._counter_lock:
+            self.requests_served += 1
+
+    def warm_up(self) -> int:
+        """
+        Compile every template into the shared environment
+
+        Returns:
+            Number of templates loaded
+        """
+        return self.generator.renderer.warm_up()
+
+    def generate_archive(self, config: ProjectConfig, archive_format: str) -> bytes:
+        """Generate a project and return it as an archive"""
+        if archive_format not in ArchiveOutput.FORMATS:
+            raise RequestError(
+                f"Unsupported archive format: {archive_format}\n"
+                f"Supported formats: {', '.join(ArchiveOutput.FORMATS)}"
+            )
+
+        buffer = io.BytesIO()
+        self.generator.generate_archive(config, buffer, archive_format)
+        return buffer.getvalue()
+
+    def generate_to(self, config: ProjectConfig, parent: Path) -> Path:
+        """
+        Generate a project into <parent>/<name> on the server's filesystem
+
+        Raises:
+            RequestError: If parent is relative, or not inside an allowed root
+        """
+        if not parent.is_absolute():
+            raise RequestError("'path' must be an absolute directory")
+        if not self.allow_roots:
+            raise RequestError(
+                "Writing projects to server paths is disabled (start the server with --allow-root)",
+                HTTPStatus.FORBIDDEN,
+            )
+        if not any(parent.resolve().is_relative_to(root) for root in self.allow_roots):
+            raise RequestError(
+                f"'path' must be inside {', '.join(str(root) for root in self.allow_roots)}",
+                HTTPStatus.FORBIDDEN,
+            )
+
+        project_path = parent / config.name
+        if project_path.exists():
+            raise FileExistsError(f"Directory already exists: {project_path}")
+
+        output = MemoryOutput(project_path)
+        self.generator.generate(config, output=output)
+        return output.materialize()
+
+
+class GenerationServer(GenerationServerMixin, ThreadingHTTPServer):
+    """Threaded HTTP generation server on a TCP address"""
+
+    daemon_threads = True
+
+
+class UnixGenerationServer(
+    GenerationServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """Threaded HTTP generation server on a Unix domain socket"""
+
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # http.server expects a (host, port) client address
+        return request, ("unix", 0)
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+    generator: ProjectGenerator | None = None,
+    warm: bool = True,
+    allow_roots: list[Path] | None = None,
+) -> GenerationServer | UnixGenerationServer:
+    """
+    Create a generation server (call serve_forever() to run it)
+
+    Args:
+        host: TCP host to bind
+        port: TCP port to bind (0 = any free port)
+        socket_path: Bind a Unix domain socket instead of TCP
+        generator: Generator to serve (default: a new one)
+        warm: Compile every template before accepting requests
+        allow_roots: Directories requests may write projects into (default:
+                     none, only archives are served)
+
+    Returns:
+        Bound server instance
+
+    Raises:
+        FileSystemError: If socket_path exists and is not a socket
+    """
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.is_socket():
+            # Stale socket left by a previous server
+            socket_path.unlink()
+        elif socket_path.exists():
+            raise FileSystemError(f"Not a socket: {socket_path}")
+        server = UnixGenerationServer(str(socket_path), GenerationRequestHandler)
+    else:
+        server = GenerationServer((host, port), GenerationRequestHandler)
+
+    server.allow_roots = tuple(Path(root).resolve() for root in allow_roots or ())
+    server.setup_generator(generator, warm=warm)
+    return server
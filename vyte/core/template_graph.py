@@ -0,0 +1,333 @@
+"""
+Template dependency graph: which templates and context names each template reads
+"""
+
+import hashlib
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from jinja2 import Environment, TemplateNotFound, meta, nodes
+from jinja2.compiler import CodeGenerator
+
+# Tags that load other templates, after the block start string ("{%")
+_LOAD_TAG = r"[-+]?\s*(?:extends|include|import|from)\b"
+
+# Reads that handle an undefined name: `x | default(...)`, `x is defined`
+_GUARD_FILTERS = frozenset({"default", "d"})
+_GUARD_TESTS = frozenset({"defined", "undefined"})
+
+
+@dataclass(frozen=True)
+class TemplateNode:
+    """
+    One template of the graph, as found in its AST
+
+    Attributes:
+        name: Template name, as passed to the loader
+        digest: SHA-256 of the template source
+        references: Templates it extends, includes or imports (literal names)
+        variables: Names it reads from the context or the globals
+        required: Variables it reads other than through the default
+                  filter or an ``is defined`` test
+        dynamic: True if it loads a template whose name is only known at
+                 render time (it may then depend on any template)
+    """
+
+    name: str
+    digest: str
+    references: frozenset[str]
+    variables: frozenset[str]
+    required: frozenset[str] = frozenset()
+    dynamic: bool = False
+
+
+class TemplateGraph:
+    """
+    Dependency graph of the templates of a Jinja environment
+
+    Sources are kept until the loader reports a change (Jinja's uptodate
+    check). Templates are only parsed when a query needs their AST, once
+    per distinct source: dependency chains and fingerprints skip parsing
+    templates without a loading tag, which is most of them. Queries follow
+    ``{% extends %}``, ``{% include %}``, ``{% import %}`` and
+    ``{% from %}`` chains, so callers can invalidate exactly the outputs
+    whose inputs changed. Safe to use from several threads.
+    """
+
+    def __init__(self, env: Environment):
+        """
+        Initialize graph
+
+        Args:
+            env: Environment whose loader provides the templates
+        """
+        self.env = env
+        self._load_tag = re.compile(re.escape(env.block_start_string) + _LOAD_TAG)
+        self._sources: dict[str, tuple[Callable[[], bool], str, str]] = {}
+        self._parsed: dict[str, tuple[frozenset[str], frozenset[str], frozenset[str], bool]] = {}
+        self._links_by_digest: dict[str, tuple[frozenset[str], bool]] = {}
+        self._reads: dict[tuple[str, str], bool] = {}
+        self._lock = threading.Lock()
+
+    def source(self, name: str) -> tuple[str, str]:
+        """
+        Get the source of a template and its SHA-256, reloaded when the file changes
+
+        Raises:
+            TemplateNotFound: If the template doesn't exist
+        """
+        with self._lock:
+            known = self._sources.get(name)
+        if known is not None and known[0]():
+            return known[1], known[2]
+
+        source, _, uptodate = self.env.loader.get_source(self.env, name)
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._sources[name] = (uptodate or (lambda: False), source, digest)
+        return source, digest
+
+    def node(self, name: str) -> TemplateNode:
+        """
+        Get the node of a template, parsing it if it is new or changed
+
+        Raises:
+            TemplateNotFound: If the template doesn't exist
+            TemplateSyntaxError: If the template cannot be parsed
+        """
+        source, digest = self.source(name)
+        with self._lock:
+            parsed = self._parsed.get(digest)
+        if parsed is None:
+            ast = self.env.parse(source, name)
+            referenced = list(meta.find_referenced_templates(ast))
+            variables = frozenset(_undeclared_names(ast))
+            parsed = (
+                frozenset(ref for ref in referenced if ref is not None),
+                variables,
+                variables & _unguarded_names(ast),
+                None in referenced,
+            )
+            with self._lock:
+                self._parsed[digest] = parsed
+        return TemplateNode(name, digest, *parsed)
+
+    def chain(self, name: str) -> dict[str, str | None]:
+        """
+        Get a template and every template it loads, directly or through
+        other ones, with their source SHA-256
+
+        Templates loaded by name from a variable make every template of the
+        loader part of the chain. Referenced templates that don't exist
+        (``ignore missing`` includes) map to None.
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        chain: dict[str, str | None] = {}
+        pending = [name]
+        while pending:
+            member = pending.pop()
+            if member in chain:
+                continue
+            try:
+                chain[member], references, dynamic = self._links(member)
+            except TemplateNotFound:
+                if member == name:
+                    raise
+                chain[member] = None
+                continue
+            if dynamic:
+                references = references | frozenset(self.env.loader.list_templates())
+            pending.extend(reference for reference in references if reference not in chain)
+        return chain
+
+    def dependencies(self, name: str) -> frozenset[str]:
+        """
+        Get every existing template a template loads (see chain())
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        return frozenset(
+            member for member, digest in self.chain(name).items() if digest and member != name
+        )
+
+    def variables(self, name: str) -> frozenset[str]:
+        """
+        Get the names a template and its dependencies read from the context
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        return frozenset().union(
+            *(self.node(member).variables for member, digest in self.chain(name).items() if digest)
+        )
+
+    def required_variables(self, name: str) -> frozenset[str]:
+        """
+        Get the names a template chain needs from the context
+
+        Names only read through ``| default(...)`` or ``is defined`` tests
+        are optional and left out.
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        return frozenset().union(
+            *(self.node(member).required for member, digest in self.chain(name).items() if digest)
+        )
+
+    def reads(self, name: str, variable: str, chain: dict[str, str | None] | None = None) -> bool:
+        """
+        Check if a template chain reads a variable
+
+        Memoized per source; only templates mentioning the name inside a tag
+        are parsed.
+
+        Args:
+            name: Template
+            variable: Context or global name
+            chain: Result of chain(name), if already known
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        if chain is None:
+            chain = self.chain(name)
+        return any(
+            self._reads_directly(member, digest, variable)
+            for member, digest in chain.items()
+            if digest
+        )
+
+    def fingerprint(self, name: str) -> str:
+        """
+        Get a digest of the sources of a template and its dependencies
+
+        Changes when any template of the chain is edited, added or removed.
+        For a template without dependencies this is its source SHA-256.
+
+        Raises:
+            TemplateNotFound: If the template itself doesn't exist
+        """
+        return chain_digest(self.chain(name))
+
+    def missing(self, name: str) -> list[str]:
+        """
+        Get the templates of a chain that don't exist
+
+        Returns:
+            Sorted names (the template itself if it doesn't exist)
+        """
+        try:
+            chain = self.chain(name)
+        except TemplateNotFound:
+            return [name]
+        return sorted(member for member, digest in chain.items() if digest is None)
+
+    def _reads_directly(self, name: str, digest: str, variable: str) -> bool:
+        """Check if a template itself reads a variable, memoized per source"""
+        with self._lock:
+            known = self._reads.get((digest, variable))
+        if known is not None:
+            return known
+
+        source, digest = self.source(name)
+        env = self.env
+        starts = f"{re.escape(env.variable_start_string)}|{re.escape(env.block_start_string)}"
+        ends = f"{re.escape(env.variable_end_string)}|{re.escape(env.block_end_string)}"
+        # The name inside a {{ ... }} or {% ... %} tag
+        mention = re.compile(rf"(?:{starts})(?:(?!{ends}).)*?\b{re.escape(variable)}\b", re.DOTALL)
+        reads = bool(mention.search(source)) and variable in self.node(name).variables
+        with self._lock:
+            self._reads[(digest, variable)] = reads
+        return reads
+
+    def _links(self, name: str) -> tuple[str, frozenset[str], bool]:
+        """
+        Source digest of a template, the templates it loads, and whether it
+        loads templates by variable name
+
+        Sources without a loading tag are not parsed.
+        """
+        source, digest = self.source(name)
+        with self._lock:
+            links = self._links_by_digest.get(digest)
+        if links is None:
+            if self._load_tag.search(source):
+                node = self.node(name)
+                links = (node.references, node.dynamic)
+            else:
+                links = (frozenset(), False)
+            with self._lock:
+                self._links_by_digest[digest] = links
+        return digest, *links
+
+
+def chain_digest(chain: dict[str, str | None]) -> str:
+    """
+    Digest of a template chain (see TemplateGraph.chain())
+
+    The source SHA-256 itself for a single template.
+    """
+    if len(chain) == 1:
+        (digest,) = chain.values()
+        if digest is not None:
+            return digest
+    combined = hashlib.sha256()
+    for member, digest in sorted(chain.items()):
+        combined.update(f"{member}\0{digest or '-'}\n".encode())
+    return combined.hexdigest()
+
+
+class _NameTracker(meta.TrackingCodeGenerator):
+    """Undeclared names, including the environment globals (now, year, ...)"""
+
+    def enter_frame(self, frame):
+        CodeGenerator.enter_frame(self, frame)
+        for action, param in frame.symbols.loads.values():
+            if action == "resolve":
+                self.undeclared_identifiers.add(param)
+
+
+def _undeclared_names(ast: nodes.Template) -> set[str]:
+    """
+    Names a template looks up from its context at render time
+
+    Like jinja2.meta.find_undeclared_variables, which leaves out names
+    defined as environment globals even though templates read them.
+    """
+    tracker = _NameTracker(ast.environment)
+    tracker.visit(ast)
+    return tracker.undeclared_identifiers
+
+
+def _unguarded_names(ast: nodes.Template) -> set[str]:
+    """Names loaded at least once outside a guard"""
+    guarded = set()
+    for node in ast.find_all((nodes.Filter, nodes.Test)):
+        guards = _GUARD_FILTERS if isinstance(node, nodes.Filter) else _GUARD_TESTS
+        if node.name in guards and isinstance(node.node, nodes.Name):
+            guarded.add(id(node.node))
+    # `{% if x is defined %}{{ x }}{% endif %}`: the branch only runs with x set
+    for node in ast.find_all((nodes.If, nodes.CondExpr)):
+        test = node.test
+        if not (
+            isinstance(test, nodes.Test)
+            and test.name == "defined"
+            and isinstance(test.node, nodes.Name)
+        ):
+            continue
+        branch = node.body if isinstance(node, nodes.If) else [node.expr1]
+        for child in branch:
+            names = [child] if isinstance(child, nodes.Name) else []
+            names.extend(child.find_all(nodes.Name))
+            guarded.update(id(name) for name in names if name.name == test.node.name)
+    return {
+        node.name
+        for node in ast.find_all(nodes.Name)
+        if node.ctx == "load" and id(node) not in guarded
+    }
@@ -0,0 +1,152 @@
+"""
+Concurrent render-and-write pipeline for generated files
+"""
+
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+from .events import EventBus
+from .output import OutputBackend
+from .renderer import TemplateRenderer
+
+
+class ParallelFileWriter:
+    """
+    Renders templates on a thread pool and flushes the results in bulk
+
+    Templates are rendered concurrently, every parent directory is created
+    once, and files are then written concurrently. Output is deterministic:
+    results are collected in input order, the first error in input order is
+    the one raised, and when the same path appears twice the last entry wins.
+    """
+
+    def __init__(
+        self,
+        renderer: TemplateRenderer,
+        max_workers: int | None = None,
+        output: OutputBackend | None = None,
+        events: EventBus | None = None,
+    ):
+        """
+        Initialize writer
+
+        Args:
+            renderer: Template renderer instance
+            max_workers: Thread pool size (default: min(32, CPU count + 4));
+                         1 renders and writes serially
+            output: Backend receiving the files (default: the real filesystem)
+            events: Bus receiving one file_rendered event per file, emitted
+                    from the calling thread in input order as soon as the
+                    file and the ones before it are rendered (so progress
+                    is live), and the renderer's template_loaded events
+        """
+        self.renderer = renderer
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.output = output
+        self.events = events
+
+    def write(self, items: Iterable[tuple[str, Path]], context: dict[str, Any]) -> list[Path]:
+        """
+        Render and write a batch of templates
+
+        Args:
+            items: (template_path, output_path) pairs
+            context: Template context shared by every item
+
+        Returns:
+            Written paths, in input order (duplicates collapsed)
+        """
+        # Collapse duplicate destinations: the last template for a path wins
+        targets: dict[Path, str] = {}
+        for template_path, output_path in items:
+            targets.pop(output_path, None)
+            targets[output_path] = template_path
+
+        if not targets:
+            return []
+
+        paths = list(targets)
+
+        # Only hand the bus to the renderer when someone listens
+        hooks = {"events": self.events} if self.events is not None and self.events.active else {}
+
+        def render(path: Path) -> tuple[str, float]:
+            start = time.perf_counter()
+            content = self.renderer.render(targets[path], context, **hooks)
+            return content, time.perf_counter() - start
+
+        if self.max_workers == 1 or len(paths) == 1:
+            contents = []
+            for path in paths:
+                content, duration = render(path)
+                self._emit_rendered(path, targets[path], content, duration)
+                contents.append(content)
+            self._create_directories(paths)
+            for path, content in zip(paths, contents, strict=True):
+                self._write_file(path, content)
+            return paths
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+            # 1. Render concurrently, reporting files as they finish; the
+            #    first failure in input order is re-raised
+            futures = [executor.submit(render, path) for path in paths]
+            self._report_progress(futures, paths, targets)
+            contents = [future.result()[0] for future in futures]
+
+            # 2. One mkdir per distinct directory
+            self._create_directories(paths)
+
+            # 3. Flush files concurrently (in order for streaming backends)
+            if self.output is None or self.output.thread_safe:
+                list(executor.map(self._write_file, paths, contents))
+            else:
+                for path, content in zip(paths, contents, strict=True):
+                    self._write_file(path, content)
+
+        return paths
+
+    def _report_progress(self, futures: list[Future], paths: list[Path], targets: dict[Path, str]):
+        """Wait for every render, reporting each file once it and the ones before it are done"""
+        index = {future: i for i, future in enumerate(futures)}
+        done = [False] * len(futures)
+        reported = 0
+        for future in as_completed(futures):
+            done[index[future]] = True
+            while reported < len(futures) and done[reported]:
+                finished = futures[reported]
+                if finished.exception() is None:
+                    path = paths[reported]
+                    self._emit_rendered(path, targets[path], *finished.result())
+                reported += 1
+
+    def _emit_rendered(self, path: Path, template: str, content: str, duration: float):
+        """Report a rendered file"""
+        if self.events is None:
+            return
+        self.events.emit(
+            "file_rendered",
+            path=path,
+            template=template,
+            duration=duration,
+            size=len(content.encode("utf-8")),
+        )
+
+    def _create_directories(self, paths: list[Path]):
+        """Create each distinct parent directory once, shallowest first"""
+        directories = {path.parent for path in paths}
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            if self.output is not None:
+                self.output.mkdir(directory)
+            else:
+                directory.mkdir(parents=True, exist_ok=True)
+
+    def _write_file(self, path: Path, content: str):
+        """Write a rendered file"""
+        if self.output is not None:
+            self.output.write_text(path, content)
+        else:
+            path.write_text(content, encoding="utf-8")
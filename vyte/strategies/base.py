@@ -3,6 +3,9 @@ from pathlib import Path
 from typing import Any
 
 from ..core.config import ProjectConfig
+from ..core.events import EventBus
+from ..core.output import DiskOutput, OutputBackend
+from ..core.plan import PlanRule
 from ..core.renderer import TemplateRenderer
 
 
@@ -11,16 +14,29 @@ class BaseStrategy(ABC):
     Abstract base class for framework-specific generation strategies
     """
 
-    def __init__(self, config: ProjectConfig, renderer: TemplateRenderer):
+    # Templated files of the framework, compiled into the project's render plan
+    RENDER_RULES: tuple[PlanRule, ...] = ()
+
+    def __init__(
+        self,
+        config: ProjectConfig,
+        renderer: TemplateRenderer,
+        output: OutputBackend | None = None,
+        events: EventBus | None = None,
+    ):
         """
         Initialize strategy
 
         Args:
             config: Project configuration
             renderer: Template renderer instance
+            output: Backend receiving the files (default: the real filesystem)
+            events: Bus receiving step timings (default: no listeners)
         """
         self.config = config
         self.renderer = renderer
+        self.output = output or DiskOutput(config.get_output_path())
+        self.events = events or EventBus()
         self.context = config.model_dump_safe()
 
     @abstractmethod
@@ -32,10 +48,12 @@ class BaseStrategy(ABC):
             project_path: Root path of the project
         """
 
-    @abstractmethod
-    def generate_files(self, project_path: Path):
+    def generate_files(self, project_path: Path):  # noqa: B027 - optional hook
         """
-        Generate framework-specific files
+        Generate framework-specific files that are not part of the render plan
+
+        Templated files are declared in RENDER_RULES and rendered by the
+        generator; override this for anything else (inline files, tooling).
 
         Args:
             project_path: Root path of the project
@@ -4,13 +4,29 @@ Strategy for Django-Rest projects
 
 from pathlib import Path
 
-from ..core.renderer import TemplateRegistry
+from ..core.plan import PlanRule
 from .base import BaseStrategy
 
 
 class DjangoRestStrategy(BaseStrategy):
     """Strategy for generating Django-Rest projects"""
 
+    RENDER_RULES = (
+        # Core Django configuration
+        PlanRule("framework", "settings", "{app_name}/settings.py"),
+        PlanRule("framework", "urls", "{app_name}/urls.py"),
+        # API files, at the app root (not under /api)
+        PlanRule("framework", "models", "{app_name}/models.py"),
+        PlanRule("framework", "serializers", "{app_name}/serializers.py"),
+        PlanRule("framework", "views", "{app_name}/views.py"),
+        PlanRule("framework", "permissions", "{app_name}/permissions.py", "auth_enabled"),
+        # Django-specific test configuration
+        PlanRule("tests", "pytest_ini", "pytest.ini", "testing_suite"),
+        PlanRule("tests", "conftest", "tests/conftest.py", "testing_suite"),
+        PlanRule("tests", "test_api", "tests/test_api.py", "testing_suite"),
+        PlanRule("tests", "test_models", "tests/test_models.py", "testing_suite"),
+    )
+
     def generate_structure(self, project_path: Path):
         """Create Django-specific directory structure ONLY"""
         app_name = self.config.name.replace("-", "_")
@@ -25,34 +41,20 @@ class DjangoRestStrategy(BaseStrategy):
 
         for dir_name in dirs:
             dir_path = project_path / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            self.output.mkdir(dir_path)
 
             # Create __init__.py for Python packages
-            (dir_path / "__init__.py").touch()
+            self.output.touch(dir_path / "__init__.py")
 
         # Create initial migration __init__.py
-        (project_path / app_name / "migrations" / "__init__.py").touch()
+        self.output.touch(project_path / app_name / "migrations" / "__init__.py")
 
     def generate_files(self, project_path: Path):
-        """Generate Django-Rest specific files ONLY"""
+        """Generate Django-Rest files outside the render plan"""
         app_name = self.config.name.replace("-", "_")
 
-        # Get templates for this configuration
-        templates = TemplateRegistry.get_templates_for_config(
-            self.config.framework,
-            self.config.orm,
-            self.config.auth_enabled,
-            self.config.testing_suite,
-        )
-
-        if not templates:
-            raise ValueError(f"No templates found for {self.config.framework} + {self.config.orm}")
-
-        # Core Django files
-        self._generate_core_files(project_path, app_name, templates)
-
-        # API files (models, serializers, views, permissions)
-        self._generate_api_files(project_path, app_name, templates)
+        # apps.py
+        self._generate_apps_py(project_path, app_name)
 
         # WSGI and ASGI
         self._generate_deployment_files(project_path, app_name)
@@ -60,57 +62,6 @@ class DjangoRestStrategy(BaseStrategy):
         # Django management script
         self._generate_manage_py(project_path, app_name)
 
-        # Test files (solo configuración Django)
-        if self.config.testing_suite:
-            self._generate_test_configs(project_path, templates)
-
-    def _generate_core_files(self, project_path: Path, app_name: str, templates: dict):
-        """Generate core Django configuration files"""
-
-        # settings.py
-        if "settings" in templates:
-            self.renderer.render_to_file(
-                templates["settings"], project_path / app_name / "settings.py", self.context
-            )
-
-        # urls.py
-        if "urls" in templates:
-            self.renderer.render_to_file(
-                templates["urls"], project_path / app_name / "urls.py", self.context
-            )
-
-        # apps.py
-        self._generate_apps_py(project_path, app_name)
-
-    def _generate_api_files(self, project_path: Path, app_name: str, templates: dict):
-        """Generate API-related files"""
-
-        # models.py - EN LA RAÍZ DEL APP (NO en /api)
-        if "models" in templates:
-            self.renderer.render_to_file(
-                templates["models"],
-                project_path / app_name / "models.py",  # ✅ Aquí, no en /api
-                self.context,
-            )
-
-        # serializers.py
-        if "serializers" in templates:
-            self.renderer.render_to_file(
-                templates["serializers"], project_path / app_name / "serializers.py", self.context
-            )
-
-        # views.py
-        if "views" in templates:
-            self.renderer.render_to_file(
-                templates["views"], project_path / app_name / "views.py", self.context
-            )
-
-        # permissions.py (if auth enabled)
-        if self.config.auth_enabled and "permissions" in templates:
-            self.renderer.render_to_file(
-                templates["permissions"], project_path / app_name / "permissions.py", self.context
-            )
-
     def _generate_apps_py(self, project_path: Path, app_name: str):
         """Generate Django apps.py configuration"""
         apps_content = f'''"""
@@ -125,7 +76,7 @@ class {self._to_pascal_case(app_name)}Config(AppConfig):
     name = '{app_name}'
     verbose_name = '{app_name.replace("_", " ").title()}'
 '''
-        (project_path / app_name / "apps.py").write_text(apps_content)
+        self.output.write_text(project_path / app_name / "apps.py", apps_content)
 
     def _generate_deployment_files(self, project_path: Path, app_name: str):
         """Generate WSGI and ASGI files for deployment"""
@@ -148,7 +99,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', '{app_name}.settings')
 
 application = get_wsgi_application()
 '''
-        (project_path / app_name / "wsgi.py").write_text(wsgi_content)
+        self.output.write_text(project_path / app_name / "wsgi.py", wsgi_content)
 
         # asgi.py
         asgi_content = f'''"""
@@ -168,7 +119,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', '{app_name}.settings')
 
 application = get_asgi_application()
 '''
-        (project_path / app_name / "asgi.py").write_text(asgi_content)
+        self.output.write_text(project_path / app_name / "asgi.py", asgi_content)
 
     def _generate_manage_py(self, project_path: Path, app_name: str):
         """Generate manage.py file"""
@@ -196,36 +147,8 @@ def main():
 if __name__ == '__main__':
     main()
 '''
-        manage_py_path = project_path / "manage.py"
-        manage_py_path.write_text(manage_py_content)
-        manage_py_path.chmod(0o755)  # Make executable
-
-    def _generate_test_configs(self, project_path: Path, templates: dict):
-        """Generate Django-specific test configuration files"""
-
-        # pytest.ini (Django-specific config)
-        if "pytest_ini" in templates:
-            self.renderer.render_to_file(
-                templates["pytest_ini"], project_path / "pytest.ini", self.context
-            )
-
-        # conftest.py (Django fixtures)
-        if "conftest" in templates:
-            self.renderer.render_to_file(
-                templates["conftest"], project_path / "tests" / "conftest.py", self.context
-            )
-
-        # test_api.py
-        if "test_api" in templates:
-            self.renderer.render_to_file(
-                templates["test_api"], project_path / "tests" / "test_api.py", self.context
-            )
-
-        # test_models.py
-        if "test_models" in templates:
-            self.renderer.render_to_file(
-                templates["test_models"], project_path / "tests" / "test_models.py", self.context
-            )
+        # Make executable
+        self.output.write_text(project_path / "manage.py", manage_py_content, mode=0o755)
 
     @staticmethod
     def _to_pascal_case(text: str) -> str:
@@ -0,0 +1,787 @@
+"""
+Git repositories for generated projects, written without the git CLI
+
+`git init && git add . && git commit` costs three process spawns per
+project. GitRepositoryWriter produces the same repository directly: blob,
+tree and commit objects (same ids as the git CLI) stored in a single
+packfile, an index matching the working tree, the branch ref, HEAD and
+reflogs.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import os
+import re
+import stat
+import struct
+import subprocess
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from ..core.output import DiskOutput, OutputBackend
+from ..exceptions import GitError
+
+DEFAULT_MESSAGE = "Initial commit from vyte"
+
+# Used when neither the environment nor git config provide an identity
+DEFAULT_NAME = "vyte"
+DEFAULT_EMAIL = "vyte@localhost"
+
+ZERO_SHA = "0" * 40
+
+# zlib level for packed objects (any level reads back the same)
+COMPRESSION_LEVEL = 1
+
+# Pack object type codes
+PACK_TYPES = {"commit": 1, "tree": 2, "blob": 3}
+
+REGULAR_FILE = 0o100644
+EXECUTABLE_FILE = 0o100755
+DIRECTORY = 0o40000
+
+REPOSITORY_CONFIG = (
+    "[core]\n"
+    "\trepositoryformatversion = 0\n"
+    "\tfilemode = true\n"
+    "\tbare = false\n"
+    "\tlogallrefupdates = true\n"
+)
+DESCRIPTION = "Unnamed repository; edit this file 'description' to name the repository.\n"
+INFO_EXCLUDE = (
+    "# git ls-files --others --exclude-from=.git/info/exclude\n"
+    "# Lines that start with '#' are comments.\n"
+    "# For a project mostly in C, the following would be a good set of\n"
+    "# exclude patterns (uncomment them if you want to use them):\n"
+    "# *.[oa]\n"
+    "# *~\n"
+)
+
+# Working tree files: POSIX path relative to the project root -> (content, mode)
+FileSet = Mapping[str, tuple[bytes, int]]
+
+# Nesting limit of config includes (git's own)
+MAX_INCLUDE_DEPTH = 10
+
+
+def _xdg_config_home() -> Path:
+    """$XDG_CONFIG_HOME, else ~/.config"""
+    return Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+
+
+def read_git_config(git_dir: Path | None = None) -> dict[str, str]:
+    """
+    Read the system, XDG and global git configuration
+
+    `[include]` files are read where they are included, and so are
+    `[includeIf "gitdir:..."]` (and `gitdir/i:`) files when git_dir matches.
+    Other include conditions (onbranch, hasconfig) never match. Keys are
+    lowercased 'section.key' or 'section.subsection.key'; later entries win.
+
+    Args:
+        git_dir: .git directory of the repository the configuration is for
+
+    Returns:
+        Flat dictionary of configuration values
+    """
+    home = Path.home()
+    paths = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        paths.append(Path("/etc/gitconfig"))
+    paths.append(_xdg_config_home() / "git" / "config")
+    paths.append(Path(os.environ.get("GIT_CONFIG_GLOBAL") or home / ".gitconfig"))
+
+    values: dict[str, str] = {}
+    for path in paths:
+        _read_config_file(path, values, git_dir)
+    return values
+
+
+def _read_config_file(path: Path, values: dict[str, str], git_dir: Path | None, depth: int = 0):
+    """Read one git config file (and the files it includes) into values"""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return
+
+    section = ""
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        header = re.fullmatch(r'\[\s*([\w.-]+)(?:\s+"(.*)")?\s*\]', line)
+        if header:
+            name, subsection = header.groups()
+            section = name.lower() + (f".{subsection}" if subsection is not None else "")
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip().lower()
+        value = value.split(" #")[0].split(" ;")[0].strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+
+        values[f"{section}.{key}"] = value
+
+        included = (
+            key == "path"
+            and value
+            and depth < MAX_INCLUDE_DEPTH
+            and (
+                section == "include"
+                or (
+                    section.startswith("includeif.")
+                    and _include_condition(section.removeprefix("includeif."), path, git_dir)
+                )
+            )
+        )
+        if included:
+            # Relative paths are relative to the including file
+            _read_config_file(path.parent / Path(value).expanduser(), values, git_dir, depth + 1)
+
+
+def _include_condition(condition: str, config_path: Path, git_dir: Path | None) -> bool:
+    """Check an `includeIf` condition; only gitdir conditions are evaluated"""
+    kind, _, pattern = condition.partition(":")
+    if kind not in ("gitdir", "gitdir/i") or git_dir is None or not pattern:
+        return False
+
+    if pattern.startswith("~/"):
+        pattern = Path(pattern).expanduser().as_posix()
+    elif pattern.startswith("./"):
+        pattern = (config_path.parent / pattern[2:]).as_posix()
+    elif not pattern.startswith("/"):
+        pattern = "**/" + pattern
+    if pattern.endswith("/"):
+        pattern += "**"
+
+    regex = re.compile(GitIgnore._translate(pattern), re.IGNORECASE if kind == "gitdir/i" else 0)
+    candidates = {Path(os.path.abspath(git_dir)).as_posix(), Path(git_dir).resolve().as_posix()}
+    return any(regex.fullmatch(candidate) for candidate in candidates)
+
+
+def global_excludes(config: dict[str, str] | None = None) -> str:
+    """
+    Patterns of the user's global ignore file
+
+    That is core.excludesFile, or $XDG_CONFIG_HOME/git/ignore (default
+    ~/.config/git/ignore) when it isn't set.
+
+    Args:
+        config: Git configuration (default: read_git_config())
+
+    Returns:
+        File content ('' if there is none)
+    """
+    config = read_git_config() if config is None else config
+    excludes = config.get("core.excludesfile")
+    path = Path(excludes).expanduser() if excludes else _xdg_config_home() / "git" / "ignore"
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+@dataclass(frozen=True)
+class Signature:
+    """
+    Author or committer of a commit
+
+    Attributes:
+        name: Person name
+        email: Email address
+        timestamp: Seconds since the epoch
+        offset: UTC offset in minutes
+    """
+
+    name: str
+    email: str
+    timestamp: int
+    offset: int = 0
+
+    def format(self) -> str:
+        """Format as git does in commit objects and reflogs"""
+        sign = "-" if self.offset < 0 else "+"
+        hours, minutes = divmod(abs(self.offset), 60)
+        return f"{self.name} <{self.email}> {self.timestamp} {sign}{hours:02d}{minutes:02d}"
+
+    @classmethod
+    def from_environment(cls, role: str, config: dict[str, str] | None = None) -> "Signature":
+        """
+        Resolve an identity the way git does
+
+        $GIT_<ROLE>_NAME/_EMAIL/_DATE win over <role>.name/email and
+        user.name/email from git config, then DEFAULT_NAME/DEFAULT_EMAIL.
+
+        Args:
+            role: 'author' or 'committer'
+            config: Git configuration (default: read_git_config())
+        """
+        config = read_git_config() if config is None else config
+        prefix = f"GIT_{role.upper()}_"
+        name = (
+            os.environ.get(prefix + "NAME")
+            or config.get(f"{role}.name")
+            or config.get("user.name")
+            or DEFAULT_NAME
+        )
+        email = (
+            os.environ.get(prefix + "EMAIL")
+            or config.get(f"{role}.email")
+            or config.get("user.email")
+            or DEFAULT_EMAIL
+        )
+        timestamp, offset = _parse_date(os.environ.get(prefix + "DATE"))
+        return cls(name, email, timestamp, offset)
+
+
+def _parse_date(value: str | None) -> tuple[int, int]:
+    """Parse a git date ('@<epoch> <tz>', '<epoch> <tz>' or ISO 8601), default now"""
+    if not value:
+        now = int(time.time())
+        return now, time.localtime(now).tm_gmtoff // 60
+
+    match = re.fullmatch(r"@?(\d+)(?:\s+([+-])(\d\d)(\d\d))?", value.strip())
+    if match:
+        seconds, sign, hours, minutes = match.groups()
+        offset = int(hours) * 60 + int(minutes) if sign else 0
+        return int(seconds), -offset if sign == "-" else offset
+
+    try:
+        moment = datetime.datetime.fromisoformat(value.strip())
+    except ValueError as e:
+        raise GitError(f"Unsupported git date: {value}") from e
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return int(moment.timestamp()), int(moment.utcoffset().total_seconds()) // 60
+
+
+class GitIgnore:
+    """
+    .gitignore matcher
+
+    Supports comments, negation, directory-only patterns, anchored patterns,
+    `*`, `?`, character classes and `**`. As in git, the last matching
+    pattern wins and files inside an ignored directory stay ignored.
+    """
+
+    def __init__(self, excludes: str = ""):
+        """
+        Initialize
+
+        Args:
+            excludes: Global ignore patterns (see global_excludes()); they
+                      come first, so every .gitignore overrides them
+        """
+        self.patterns: list[tuple[str, re.Pattern, bool, bool]] = []
+        if excludes:
+            self.add("", excludes)
+
+    def add(self, base: str, text: str):
+        """
+        Add the patterns of a .gitignore file
+
+        Args:
+            base: Directory holding the file, relative to the root ('' for the root)
+            text: File content
+        """
+        for raw in text.splitlines():
+            line = raw.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            line = line.lstrip("/")
+            regex = self._translate(line)
+            if not anchored:
+                regex = f"(?:.*/)?{regex}"
+            self.patterns.append((base, re.compile(regex), negate, directory_only))
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Translate a gitignore glob to a regular expression"""
+        out = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("/**", i) and i + 3 == len(pattern):
+                out.append("/.*")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            if char == "*":
+                out.append("[^/]*")
+            elif char == "?":
+                out.append("[^/]")
+            elif char == "[":
+                end = pattern.find("]", i + 2)
+                if end == -1:
+                    out.append(re.escape(char))
+                else:
+                    body = pattern[i + 1 : end]
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    out.append(f"[{body}]")
+                    i = end
+            elif char == "\\" and i + 1 < len(pattern):
+                i += 1
+                out.append(re.escape(pattern[i]))
+            else:
+                out.append(re.escape(char))
+            i += 1
+        return "".join(out)
+
+    def match(self, path: str, is_dir: bool) -> bool:
+        """Check whether a path itself matches (ignoring its parent directories)"""
+        ignored = False
+        for base, regex, negate, directory_only in self.patterns:
+            if directory_only and not is_dir:
+                continue
+            if base:
+                if not path.startswith(base + "/"):
+                    continue
+                relative = path[len(base) + 1 :]
+            else:
+                relative = path
+            if regex.fullmatch(relative):
+                ignored = not negate
+        return ignored
+
+    def ignored(self, path: str) -> bool:
+        """Check whether a file is ignored, itself or through a parent directory"""
+        parts = PurePosixPath(path).parts
+        for depth in range(1, len(parts)):
+            if self.match("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self.match(path, is_dir=False)
+
+
+def tracked_files(files: FileSet, excludes: str = "") -> dict[str, tuple[bytes, int]]:
+    """
+    Select the files `git add .` would stage
+
+    Args:
+        files: Working tree files, .gitignore files included
+        excludes: Global ignore patterns (see global_excludes())
+
+    Returns:
+        Files not excluded by a .gitignore or the global patterns, keyed by path
+    """
+    ignore = GitIgnore(excludes)
+    for path in sorted(files, key=lambda p: p.count("/")):
+        if PurePosixPath(path).name == ".gitignore":
+            parent = PurePosixPath(path).parent.as_posix()
+            ignore.add("" if parent == "." else parent, files[path][0].decode("utf-8", "replace"))
+
+    return {
+        path: entry
+        for path, entry in files.items()
+        if ".git" not in PurePosixPath(path).parts and not ignore.ignored(path)
+    }
+
+
+def read_working_tree(root: Path, excludes: str = "") -> dict[str, tuple[bytes, int]]:
+    """
+    Read the files `git add .` would stage from disk
+
+    Ignored directories are pruned without being read.
+
+    Args:
+        root: Working tree root
+        excludes: Global ignore patterns (see global_excludes())
+
+    Returns:
+        Tracked files, keyed by POSIX path relative to the root
+    """
+    ignore = GitIgnore(excludes)
+    files: dict[str, tuple[bytes, int]] = {}
+
+    for directory, dirnames, filenames in os.walk(root):
+        base = Path(directory).relative_to(root).as_posix()
+        base = "" if base == "." else base
+        prefix = f"{base}/" if base else ""
+
+        if ".gitignore" in filenames:
+            ignore.add(base, (Path(directory) / ".gitignore").read_text(encoding="utf-8"))
+
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if name != ".git" and not ignore.match(prefix + name, is_dir=True)
+        )
+        for name in filenames:
+            path = prefix + name
+            if ignore.match(path, is_dir=False):
+                continue
+            full = Path(directory) / name
+            info = full.lstat()
+            if stat.S_ISREG(info.st_mode):
+                files[path] = (full.read_bytes(), info.st_mode)
+    return files
+
+
+class GitRepositoryWriter:
+    """
+    Writes a git repository with a single initial commit
+
+    The .git directory goes through an output backend, so repositories can
+    be created on disk or inside a MemoryOutput. Objects are written as one
+    packfile instead of one loose file (and directory) each.
+    """
+
+    def __init__(
+        self,
+        output: OutputBackend,
+        branch: str | None = None,
+        config: dict[str, str] | None = None,
+    ):
+        """
+        Initialize writer
+
+        Args:
+            output: Backend of the project the repository belongs to
+            branch: Branch name (default: init.defaultBranch, else 'master')
+            config: Git configuration (default: read_git_config() for the
+                    new repository)
+        """
+        self.output = output
+        self.git_dir = output.root / ".git"
+        self.config = read_git_config(self.git_dir) if config is None else config
+        self.branch = branch or self.config.get("init.defaultbranch") or "master"
+        self._objects: dict[str, tuple[str, bytes]] = {}
+
+    def write_object(self, kind: str, data: bytes) -> str:
+        """
+        Add an object to the pack
+
+        Args:
+            kind: 'blob', 'tree' or 'commit'
+            data: Object content
+
+        Returns:
+            Object id (hex SHA-1)
+        """
+        header = f"{kind} {len(data)}".encode() + b"\0"
+        sha = hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+        self._objects.setdefault(sha, (kind, data))
+        return sha
+
+    def write_pack(self):
+        """Write every added object into objects/pack as a version 2 pack and index"""
+        pack = bytearray(b"PACK" + struct.pack(">II", 2, len(self._objects)))
+        entries = []
+        for sha, (kind, data) in self._objects.items():
+            offset = len(pack)
+            entry = _pack_header(PACK_TYPES[kind], len(data)) + zlib.compress(
+                data, COMPRESSION_LEVEL
+            )
+            pack += entry
+            entries.append((bytes.fromhex(sha), zlib.crc32(entry), offset))
+        pack_checksum = hashlib.sha1(pack, usedforsecurity=False).digest()
+        pack += pack_checksum
+
+        entries.sort()
+        index = bytearray(b"\xfftOc" + struct.pack(">I", 2))
+        fanout = [0] * 256
+        for name, _, _ in entries:
+            fanout[name[0]] += 1
+        total = 0
+        for count in fanout:
+            total += count
+            index += struct.pack(">I", total)
+        index += b"".join(name for name, _, _ in entries)
+        index += b"".join(struct.pack(">I", crc) for _, crc, _ in entries)
+        index += b"".join(struct.pack(">I", offset) for _, _, offset in entries)
+        index += pack_checksum
+        index += hashlib.sha1(index, usedforsecurity=False).digest()
+
+        name = self.git_dir / "objects" / "pack" / f"pack-{pack_checksum.hex()}"
+        self.output.write_bytes(name.with_suffix(".pack"), bytes(pack), mode=0o444)
+        self.output.write_bytes(name.with_suffix(".idx"), bytes(index), mode=0o444)
+
+    def write_tree(self, entries: Mapping[str, tuple[str, int]]) -> str:
+        """
+        Store the tree objects of a file set
+
+        Args:
+            entries: Path -> (blob id, git mode)
+
+        Returns:
+            Root tree id
+        """
+        root: dict = {}
+        for path, entry in entries.items():
+            node = root
+            *parents, name = path.split("/")
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[name] = entry
+
+        def store(node: dict) -> str:
+            items = []
+            for name, value in node.items():
+                if isinstance(value, dict):
+                    items.append((name + "/", name, DIRECTORY, store(value)))
+                else:
+                    sha, mode = value
+                    items.append((name, name, mode, sha))
+            # git sorts directories as if their name ended with '/'
+            items.sort(key=lambda item: item[0].encode())
+            data = b"".join(
+                f"{mode:o} {name}".encode() + b"\0" + bytes.fromhex(sha)
+                for _, name, mode, sha in items
+            )
+            return self.write_object("tree", data)
+
+        return store(root)
+
+    def commit(
+        self,
+        files: FileSet,
+        message: str = DEFAULT_MESSAGE,
+        author: Signature | None = None,
+        committer: Signature | None = None,
+    ) -> str:
+        """
+        Create the repository and commit every file
+
+        Args:
+            files: Files to commit (apply tracked_files() first to honor .gitignore)
+            message: Commit message
+            author: Commit author (default: from environment and git config)
+            committer: Committer (default: from environment and git config)
+
+        Returns:
+            Commit id
+
+        Raises:
+            GitError: If a repository already exists
+        """
+        if self.output.exists(self.git_dir):
+            raise GitError(f"Git repository already exists: {self.git_dir}")
+
+        author = author or Signature.from_environment("author", self.config)
+        committer = committer or Signature.from_environment("committer", self.config)
+
+        self._write_skeleton()
+
+        entries = {
+            path: (self.write_object("blob", content), _git_mode(mode))
+            for path, (content, mode) in files.items()
+        }
+        tree = self.write_tree(entries)
+
+        message = message.rstrip("\n") + "\n"
+        commit = self.write_object(
+            "commit",
+            (
+                f"tree {tree}\n"
+                f"author {author.format()}\n"
+                f"committer {committer.format()}\n"
+                f"\n{message}"
+            ).encode(),
+        )
+
+        self.write_pack()
+        self._write_index(entries, files)
+        ref = f"refs/heads/{self.branch}"
+        self.output.mkdir((self.git_dir / ref).parent)
+        self.output.write_text(self.git_dir / ref, commit + "\n")
+
+        subject = message.splitlines()[0]
+        reflog = f"{ZERO_SHA} {commit} {committer.format()}\tcommit (initial): {subject}\n"
+        self.output.mkdir((self.git_dir / "logs" / ref).parent)
+        self.output.write_text(self.git_dir / "logs" / "HEAD", reflog)
+        self.output.write_text(self.git_dir / "logs" / ref, reflog)
+        return commit
+
+    def _write_skeleton(self):
+        """Create what `git init` creates (hook samples aside)"""
+        for directory in ("objects/info", "objects/pack", "refs/heads", "refs/tags", "info"):
+            self.output.mkdir(self.git_dir / directory)
+        self.output.write_text(self.git_dir / "HEAD", f"ref: refs/heads/{self.branch}\n")
+        self.output.write_text(self.git_dir / "config", REPOSITORY_CONFIG)
+        self.output.write_text(self.git_dir / "description", DESCRIPTION)
+        self.output.write_text(self.git_dir / "info" / "exclude", INFO_EXCLUDE)
+
+    def _write_index(self, entries: Mapping[str, tuple[str, int]], files: FileSet):
+        """
+        Write .git/index (version 2) so the working tree shows as clean
+
+        On disk, entries carry the files' stat data; otherwise it is zeroed
+        and git refreshes it on first use.
+        """
+        data = bytearray(b"DIRC" + struct.pack(">II", 2, len(entries)))
+        for path in sorted(entries, key=str.encode):
+            sha, mode = entries[path]
+            name = path.encode()
+            size = len(files[path][0])
+            times = (0, 0, 0, 0)
+            device = inode = uid = gid = 0
+            if self.output.on_disk:
+                info = (self.output.root / path).stat()
+                times = (
+                    int(info.st_ctime),
+                    info.st_ctime_ns % 1_000_000_000,
+                    int(info.st_mtime),
+                    info.st_mtime_ns % 1_000_000_000,
+                )
+                device, inode, uid, gid = info.st_dev, info.st_ino, info.st_uid, info.st_gid
+            entry = struct.pack(
+                ">10I20sH",
+                *times,
+                device & 0xFFFFFFFF,
+                inode & 0xFFFFFFFF,
+                mode,
+                uid & 0xFFFFFFFF,
+                gid & 0xFFFFFFFF,
+                size & 0xFFFFFFFF,
+                bytes.fromhex(sha),
+                min(len(name), 0xFFF),
+            )
+            entry += name
+            # NUL-terminate and pad each entry to a multiple of 8 bytes
+            entry += b"\0" * (8 - len(entry) % 8)
+            data += entry
+        data += hashlib.sha1(data, usedforsecurity=False).digest()
+        self.output.write_bytes(self.git_dir / "index", bytes(data))
+
+
+def _pack_header(kind: int, size: int) -> bytes:
+    """Encode a pack entry header: type and size as a little-endian varint"""
+    byte = (kind << 4) | (size & 0x0F)
+    size >>= 4
+    header = bytearray()
+    while size:
+        header.append(byte | 0x80)
+        byte = size & 0x7F
+        size >>= 7
+    header.append(byte)
+    return bytes(header)
+
+
+def _git_mode(mode: int) -> int:
+    """Map a file mode to the mode git records"""
+    return EXECUTABLE_FILE if mode & 0o111 else REGULAR_FILE
+
+
+def initialize_repo(
+    project_path: Path,
+    files: FileSet | None = None,
+    output: OutputBackend | None = None,
+    message: str = DEFAULT_MESSAGE,
+    use_cli: bool = False,
+) -> str:
+    """
+    Initialize a git repository holding one commit of the project
+
+    Args:
+        project_path: Project root
+        files: Working tree files (default: read from output, or from disk)
+        output: Backend the project was generated into (default: disk)
+        message: Commit message
+        use_cli: Run the git CLI instead of the built-in writer (disk only)
+
+    Returns:
+        Commit id
+
+    Raises:
+        GitError: If the repository cannot be created
+    """
+    if use_cli:
+        return initialize_repo_cli(project_path, message)
+
+    output = output or DiskOutput(project_path)
+    config = read_git_config(output.root / ".git")
+    excludes = global_excludes(config)
+    if files is None:
+        if output.on_disk:
+            files = read_working_tree(project_path, excludes)
+        elif hasattr(output, "files"):
+            files = tracked_files(
+                {path: (data, output.mode(path)) for path, data in output.files.items()},
+                excludes,
+            )
+        else:
+            raise GitError("Cannot read the project back from this output backend")
+    else:
+        files = tracked_files(files, excludes)
+
+    try:
+        return GitRepositoryWriter(output, config=config).commit(files, message)
+    except OSError as e:
+        raise GitError(f"Failed to write git repository: {e}") from e
+
+
+def initialize_repo_cli(project_path: Path, message: str = DEFAULT_MESSAGE) -> str:
+    """
+    Initialize a repository with `git init`, `git add .` and `git commit`
+
+    Returns:
+        Commit id
+
+    Raises:
+        GitError: If git is missing or a command fails
+    """
+    try:
+        for command in _cli_commands(message):
+            result = subprocess.run(
+                command, cwd=project_path, check=True, capture_output=True, text=True
+            )
+    except FileNotFoundError as e:
+        raise GitError("Git not found. Please install git to use this feature") from e
+    except subprocess.CalledProcessError as e:
+        raise GitError(f"{' '.join(e.cmd)} failed: {(e.stderr or '').strip()}") from e
+    return result.stdout.strip()
+
+
+async def initialize_repo_cli_async(project_path: Path, message: str = DEFAULT_MESSAGE) -> str:
+    """
+    Asyncio version of initialize_repo_cli(), using asyncio subprocesses
+
+    Returns:
+        Commit id
+
+    Raises:
+        GitError: If git is missing or a command fails
+    """
+    stdout = b""
+    for command in _cli_commands(message):
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=project_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise GitError("Git not found. Please install git to use this feature") from e
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise GitError(f"{' '.join(command)} failed: {stderr.decode().strip()}")
+    return stdout.decode().strip()
+
+
+def _cli_commands(message: str) -> tuple[list[str], ...]:
+    """git commands creating the initial commit, then printing its id"""
+    return (
+        ["git", "init"],
+        ["git", "add", "."],
+        ["git", "commit", "-m", message],
+        ["git", "rev-parse", "HEAD"],
+    )